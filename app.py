@@ -3,20 +3,30 @@ import os
 import json
 import logging
 import argparse
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, g, jsonify, request, send_file
 from flask_cors import CORS
-from datetime import datetime
-import re
+from datetime import datetime, timedelta
 import csv
 import tempfile
+import threading
 from urllib.parse import urlparse
-import requests
 from bs4 import BeautifulSoup
 import subprocess
 import platform
+import re
 
 # Import LinkedIn scraper
-from linkedin_scraper import Person, actions
+from linkedin_scraper import Person, actions, selectors, timing, driver_stats
+from linkedin_scraper.company import Company
+from linkedin_scraper.page_cache import PageCache
+from linkedin_scraper.job_search import JobSearch
+from linkedin_scraper.urls import canonical_url, canonical_job_url, canonical_company_url, canonical_profile_url
+from linkedin_scraper.parsers import parse_html
+import result_bus
+import metrics
+from screenshots import ScreenshotWriter
+from dedupe import dedupe_leads
+from extractors import extract_emails, extract_profiles
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -44,6 +54,45 @@ CORS(app)
 # Data storage paths
 LEADS_FILE = "leads_data.json"
 
+JOBS_FILE = "jobs_data.json"
+COMPANIES_FILE = "companies_data.json"
+
+# Cached company records older than this are re-scraped on the next lookup
+COMPANY_CACHE_TTL = float(os.getenv("COMPANY_CACHE_TTL_HOURS", "168")) * 3600
+
+# Resume cursors for interrupted company employee scrapes, keyed by company URL
+EMPLOYEE_CURSORS_FILE = "employee_cursors.json"
+
+# Employees collected before they are written to the lead store and the cursor moves on
+EMPLOYEE_WRITE_BATCH = int(os.getenv("EMPLOYEE_WRITE_BATCH", "100"))
+
+# Profiles scraped within this many seconds are served from the store (0 disables)
+DEFAULT_SCRAPE_MAX_AGE = float(os.getenv("SCRAPE_MAX_AGE", "0"))
+
+# Optional compressed snapshots of fetched profile pages, for re-parsing without the browser
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR")
+page_cache = PageCache(
+    PAGE_CACHE_DIR,
+    max_bytes=int(os.getenv("PAGE_CACHE_MAX_MB", "500")) * 1024 * 1024,
+    ttl=float(os.getenv("PAGE_CACHE_TTL_HOURS", "720")) * 3600
+) if PAGE_CACHE_DIR else None
+
+# Debug screenshots: "off", "error" (only when a scrape fails) or "always"; a request can opt in with "screenshot": true
+SCREENSHOT_MODE = os.getenv("SCREENSHOT_MODE", "error")
+screenshot_writer = ScreenshotWriter(
+    os.getenv("SCREENSHOT_DIR", "screenshots"),
+    max_files=int(os.getenv("SCREENSHOT_MAX_FILES", "50")),
+    max_bytes=int(os.getenv("SCREENSHOT_MAX_MB", "50")) * 1024 * 1024,
+    scale=float(os.getenv("SCREENSHOT_SCALE", "1.0")),
+    image_format=os.getenv("SCREENSHOT_FORMAT", "png")
+)
+
+def capture_screenshot(driver, profile_url, reason, requested=False):
+    """Queue a debug screenshot if the screenshot mode (or the request) asks for one"""
+    wanted = requested or SCREENSHOT_MODE == "always" or (SCREENSHOT_MODE == "error" and reason == "error")
+    if wanted and SCREENSHOT_MODE != "off":
+        screenshot_writer.capture(driver, profile_url, reason)
+
 # Store the LinkedIn driver globally for reuse
 linkedin_driver = None
 linkedin_login_status = {
@@ -53,6 +102,31 @@ linkedin_login_status = {
 }
 
 # Helper functions
+def _file_stat(path):
+    """(mtime_ns, size) of path, None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Lead count for /api/status, reloaded only when the leads file changed since the last save or count
+_leads_count_cache = {"stat": None, "count": 0}
+
+def count_leads():
+    """Number of stored leads without loading the leads file unless it changed"""
+    stat = _file_stat(LEADS_FILE)
+    if stat is None:
+        return 0
+    if _leads_count_cache["stat"] != stat:
+        _leads_count_cache.update({"stat": stat, "count": len(load_leads())})
+    return _leads_count_cache["count"]
+
+# Every load/modify/save of the leads file (request threads, bus subscribers, the
+# background clean) holds this lock, so no writer overwrites another's changes
+_leads_lock = threading.Lock()
+
+@metrics.store_operation("leads", "load")
 def load_leads():
     """Load leads from JSON file"""
     try:
@@ -64,16 +138,214 @@ def load_leads():
         logger.error(f"Error loading leads: {str(e)}")
         return []
 
+@metrics.store_operation("leads", "save")
 def save_leads(leads):
     """Save leads to JSON file"""
     try:
         with open(LEADS_FILE, 'w') as f:
             json.dump(leads, f, indent=2)
+        _leads_count_cache.update({"stat": _file_stat(LEADS_FILE), "count": len(leads)})
         return True
     except Exception as e:
         logger.error(f"Error saving leads: {str(e)}")
         return False
 
+@metrics.store_operation("jobs", "load")
+def load_jobs():
+    """Load job postings from JSON file"""
+    try:
+        if os.path.exists(JOBS_FILE):
+            with open(JOBS_FILE, 'r') as f:
+                return json.load(f)
+        return []
+    except Exception as e:
+        logger.error(f"Error loading jobs: {str(e)}")
+        return []
+
+@metrics.store_operation("jobs", "save")
+def save_jobs(jobs):
+    """Save job postings to JSON file"""
+    try:
+        with open(JOBS_FILE, 'w') as f:
+            json.dump(jobs, f, indent=2)
+        _jobs_cache["mtime"] = None
+        return True
+    except Exception as e:
+        logger.error(f"Error saving jobs: {str(e)}")
+        return False
+
+def company_name_key(name):
+    """Normalize a company name for index lookups"""
+    return " ".join((name or "").lower().split())
+
+# LinkedIn shows posting dates relative to now: "3 days ago", "Reposted 1 week ago", ...
+RELATIVE_DATE_PATTERN = re.compile(r"(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago", re.IGNORECASE)
+RELATIVE_DATE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365)
+}
+
+def parse_posted_date(posted_date, seen_at):
+    """Calendar date (YYYY-MM-DD) of a job's posted_date, resolving relative dates against seen_at"""
+    if not posted_date:
+        return ""
+    try:
+        return datetime.fromisoformat(posted_date[:10]).date().isoformat()
+    except ValueError:
+        pass
+    match = RELATIVE_DATE_PATTERN.search(posted_date)
+    if not match or not seen_at:
+        return ""
+    try:
+        seen = datetime.fromisoformat(seen_at)
+    except (TypeError, ValueError):
+        return ""
+    return (seen - int(match.group(1)) * RELATIVE_DATE_UNITS[match.group(2).lower()]).date().isoformat()
+
+def build_jobs_index(jobs):
+    """Index job postings by canonical URL, company and posted date
+    
+    by_posted_date is keyed by calendar date; upsert_jobs overwrites posted_date when a
+    job is seen again, so relative dates are resolved against last_seen.
+    """
+    index = {"by_url": {}, "by_company_url": {}, "by_company_name": {}, "by_posted_date": {}}
+    for position, job in enumerate(jobs):
+        index["by_url"][job["job_key"]] = position
+        if job.get("company_linkedin_url"):
+            index["by_company_url"].setdefault(canonical_company_url(job["company_linkedin_url"]), []).append(position)
+        if job.get("company"):
+            index["by_company_name"].setdefault(company_name_key(job["company"]), []).append(position)
+        posted_on = parse_posted_date(job.get("posted_date"), job.get("last_seen"))
+        if posted_on:
+            index["by_posted_date"].setdefault(posted_on, []).append(position)
+    return index
+
+def jobs_posted_between(index, after=None, before=None):
+    """Positions of jobs posted on or after `after` and on or before `before` (YYYY-MM-DD)"""
+    positions = set()
+    for day, day_positions in index["by_posted_date"].items():
+        if (not after or day >= after) and (not before or day <= before):
+            positions.update(day_positions)
+    return positions
+
+# Jobs and their index, reloaded only when the jobs file changes on disk
+_jobs_cache = {"mtime": None, "jobs": [], "index": build_jobs_index([])}
+
+def get_jobs_index():
+    """Return (jobs, index), rebuilding the index only after the jobs file changed"""
+    try:
+        mtime = os.path.getmtime(JOBS_FILE)
+    except OSError:
+        mtime = 0
+    if _jobs_cache["mtime"] != mtime:
+        jobs = load_jobs()
+        _jobs_cache.update({"mtime": mtime, "jobs": jobs, "index": build_jobs_index(jobs)})
+    return _jobs_cache["jobs"], _jobs_cache["index"]
+
+# Held around the load/merge/save of the jobs file so concurrent saves don't drop each other's jobs
+_jobs_lock = threading.Lock()
+
+def upsert_jobs(new_jobs):
+    """Merge job dicts into the jobs store, deduplicated by canonical job URL"""
+    with _jobs_lock:
+        jobs = list(get_jobs_index()[0])
+        positions = {job["job_key"]: i for i, job in enumerate(jobs)}
+        now = datetime.now().isoformat()
+        added = 0
+        for job in new_jobs:
+            job_key = canonical_job_url(job.get("linkedin_url"))
+            if not job_key:
+                continue
+            if job_key in positions:
+                # Merged into a copy: the cached dicts stay as saved until save_jobs succeeds
+                existing_job = dict(jobs[positions[job_key]])
+                for key, value in job.items():
+                    if value:
+                        existing_job[key] = value
+                existing_job["last_seen"] = now
+                jobs[positions[job_key]] = existing_job
+            else:
+                positions[job_key] = len(jobs)
+                jobs.append(dict(job, job_key=job_key, first_seen=now, last_seen=now))
+                added += 1
+        save_jobs(jobs)
+    return added
+
+# Company fields copied from a Company scrape into the shared company cache
+COMPANY_FIELDS = ["name", "about_us", "website", "industry", "company_type", "company_size", "headquarters", "founded", "specialties", "headcount"]
+
+@metrics.store_operation("companies", "load")
+def load_companies():
+    """Load cached company records (keyed by canonical company URL) from JSON file"""
+    try:
+        if os.path.exists(COMPANIES_FILE):
+            with open(COMPANIES_FILE, 'r') as f:
+                return json.load(f)
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading companies: {str(e)}")
+        return {}
+
+@metrics.store_operation("companies", "save")
+def save_companies(companies):
+    """Save cached company records to JSON file"""
+    try:
+        with open(COMPANIES_FILE, 'w') as f:
+            json.dump(companies, f, indent=2)
+        return True
+    except Exception as e:
+        logger.error(f"Error saving companies: {str(e)}")
+        return False
+
+company_cache_stats = {"hits": 0, "misses": 0, "fetches": 0}
+# Per-company locks keep one company from being scraped twice at once; _companies_lock
+# serializes the load/update/save of the whole file so fetches of different companies don't drop each other
+_company_locks = {}
+_company_locks_guard = threading.Lock()
+_companies_lock = threading.Lock()
+
+def is_company_fresh(record, max_age=None):
+    """Check whether a cached company record is within its TTL"""
+    max_age = COMPANY_CACHE_TTL if max_age is None else max_age
+    try:
+        return (datetime.now() - datetime.fromisoformat(record["fetched_at"])).total_seconds() <= max_age
+    except (KeyError, TypeError, ValueError):
+        return False
+
+def get_company_record(company_url, driver=None, max_age=None):
+    """Return the cached record for a company, scraping it only when missing or stale
+    
+    Concurrent lookups of the same company wait on one fetch instead of each scraping it.
+    """
+    key = canonical_company_url(company_url)
+    with _company_locks_guard:
+        lock = _company_locks.setdefault(key, threading.Lock())
+    
+    with lock:
+        record = load_companies().get(key)
+        if record and is_company_fresh(record, max_age):
+            company_cache_stats["hits"] += 1
+            return record
+        company_cache_stats["misses"] += 1
+        if driver is None:
+            return record
+        
+        logger.info(f"Scraping company page for cache: {key}")
+        company = Company(key, driver=driver, scrape=True, get_employees=False, close_on_complete=False)
+        company_cache_stats["fetches"] += 1
+        record = {field: getattr(company, field, None) for field in COMPANY_FIELDS}
+        record.update({"linkedin_url": key, "fetched_at": datetime.now().isoformat()})
+        
+        with _companies_lock:
+            companies = load_companies()
+            companies[key] = record
+            save_companies(companies)
+        return record
+
 def generate_lead_id(leads):
     """Generate a new unique ID for a lead"""
     if not leads:
@@ -83,17 +355,224 @@ def generate_lead_id(leads):
         return 1
     return max(ids) + 1
 
-def clean_leads_data(leads):
-    """Clean and normalize leads data"""
+def load_employee_cursors():
+    """Load company employee resume cursors from JSON file"""
+    try:
+        if os.path.exists(EMPLOYEE_CURSORS_FILE):
+            with open(EMPLOYEE_CURSORS_FILE, 'r') as f:
+                return json.load(f)
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading employee cursors: {str(e)}")
+        return {}
+
+def save_employee_cursor(company_url, cursor):
+    """Persist (or clear, when cursor is None) the resume cursor for a company"""
+    cursors = load_employee_cursors()
+    if cursor is None:
+        cursors.pop(company_url, None)
+    else:
+        cursors[company_url] = cursor
+    try:
+        with open(EMPLOYEE_CURSORS_FILE, 'w') as f:
+            json.dump(cursors, f)
+    except Exception as e:
+        logger.error(f"Error saving employee cursor: {str(e)}")
+
+def index_leads(leads):
+    """{source_url: lead} for a loaded leads list, for callers that look up many URLs
+    
+    Stored source_urls are already canonical (written by upsert_lead and clean_leads_data,
+    migrated by --rekey-leads), so they are used as keys as they are.
+    """
+    index = {}
+    for lead in leads:
+        if lead.get("source_url"):
+            index.setdefault(lead["source_url"], lead)
+    return index
+
+def find_lead_by_url(leads, url, index=None):
+    """Find the lead scraped from a given source URL, through index if given"""
+    key = canonical_profile_url(url)
+    if not key:
+        return None
+    if index is not None:
+        return index.get(key)
+    return next((ld for ld in leads if ld.get("source_url") == key), None)
+
+def rekey_leads(leads):
+    """One-time migration: rewrite source_url to its canonical form and merge leads that collapse together
+    
+    The first lead for a key keeps its id; later ones only fill in its empty fields.
+    Returns (leads, number_merged).
+    """
+    by_key = {}
+    rekeyed = []
+    for lead in leads:
+        key = canonical_profile_url(lead.get("source_url"))
+        if not key:
+            rekeyed.append(lead)
+            continue
+        lead["source_url"] = key
+        existing_lead = by_key.get(key)
+        if existing_lead is None:
+            by_key[key] = lead
+            rekeyed.append(lead)
+            continue
+        for field, value in lead.items():
+            if value and not existing_lead.get(field):
+                existing_lead[field] = value
+        mark_lead_dirty(existing_lead)
+        for field in ("last_scraped", "last_changed"):
+            # Stored timestamps may be None rather than missing
+            if lead.get(field) and lead[field] > (existing_lead.get(field) or ""):
+                existing_lead[field] = lead[field]
+    return rekeyed, len(leads) - len(rekeyed)
+
+def is_lead_fresh(lead, max_age):
+    """Check whether a lead was scraped within the last max_age seconds"""
+    if not lead or not max_age or not lead.get("last_scraped"):
+        return False
+    try:
+        age = (datetime.now() - datetime.fromisoformat(lead["last_scraped"])).total_seconds()
+    except (TypeError, ValueError):
+        return False
+    return age <= max_age
+
+def upsert_lead(leads, lead, scraped_at=None, index=None):
+    """Merge a lead into leads by source_url and return the stored lead
+    
+    scraped_at stamps last_scraped; last_changed moves only when a value differs.
+    index (from index_leads) is used for the lookup and kept up to date.
+    """
+    now = datetime.now().isoformat()
+    if lead.get("source_url"):
+        lead["source_url"] = canonical_profile_url(lead["source_url"])
+    existing_lead = find_lead_by_url(leads, lead.get("source_url"), index)
+    
+    if existing_lead:
+        # Update existing lead, keeping values the new data doesn't have
+        changed = False
+        for key, value in lead.items():
+            if value and key != "id" and existing_lead.get(key) != value:
+                existing_lead[key] = value
+                changed = True
+        if changed:
+            existing_lead["last_changed"] = now
+            mark_lead_dirty(existing_lead)
+        if scraped_at:
+            existing_lead["last_scraped"] = scraped_at
+        return existing_lead
+    
+    # Add new lead
+    lead["id"] = generate_lead_id(leads)
+    lead["last_changed"] = now
+    if scraped_at:
+        lead["last_scraped"] = scraped_at
+    leads.append(lead)
+    if index is not None and lead.get("source_url"):
+        index[lead["source_url"]] = lead
+    return lead
+
+def build_profile_lead(profile_data, profile_url):
+    """Create a lead from scraped LinkedIn profile data"""
+    return {
+        "name": profile_data.get("name", ""),
+        "title": profile_data.get("job_title", ""),
+        "company": profile_data.get("company", ""),
+        "location": profile_data.get("location", ""),
+        "email": "",  # LinkedIn doesn't expose email
+        "emails": [],
+        "source_url": canonical_profile_url(profile_url),
+        "about": profile_data.get("about", ""),
+        "experiences": profile_data.get("experiences", 0),
+        "educations": profile_data.get("educations", 0),
+        "company_linkedin_url": profile_data.get("company_linkedin_url", ""),
+        # Reference into the shared company cache
+        "company_key": canonical_company_url(profile_data["company_linkedin_url"]) if profile_data.get("company_linkedin_url") else ""
+    }
+
+def save_scraped_profile(message):
+    """Result bus subscriber: upsert a scraped profile and return the stored lead"""
+    lead = message.get("lead") or build_profile_lead(message.get("profile_data") or {}, message["profile_url"])
+    with _leads_lock:
+        leads = load_leads()
+        lead = upsert_lead(leads, lead, scraped_at=message.get("scraped_at") or datetime.now().isoformat())
+        save_leads(leads)
+    return lead
+
+result_bus.bus.subscribe(result_bus.PROFILE_SCRAPED, save_scraped_profile)
+
+def publish_scraped_profile(profile_url, lead=None, profile_data=None, scraped_at=None):
+    """Hand a scrape result to the result bus and return the lead stored by its subscriber"""
+    results = result_bus.bus.publish(result_bus.PROFILE_SCRAPED, {
+        "profile_url": profile_url,
+        "lead": lead,
+        "profile_data": profile_data,
+        "scraped_at": scraped_at
+    })
+    return next((result for result in results if result), None)
+
+def extract_profile_from_source(page_source, registry=None):
+    """Extract profile data from a saved LinkedIn profile page_source (registry defaults to the shared selectors)"""
+    registry = registry or selectors.registry
+    tree = parse_html(page_source)
+    profile_data = {
+        "name": registry.resolve_tree(tree, "profile.name"),
+        "job_title": registry.resolve_tree(tree, "profile.title"),
+        "company": registry.resolve_tree(tree, "profile.company"),
+        "company_linkedin_url": registry.resolve_tree(tree, "profile.company_url"),
+        "location": "",
+        "about": registry.resolve_tree(tree, "profile.about"),
+        "experiences": len(tree.xpath("//section[contains(@class,'experience')]//li")),
+        "educations": len(tree.xpath("//section[contains(@class,'education')]//li"))
+    }
+    
+    if not profile_data["company"] and " at " in profile_data["job_title"]:
+        profile_data["company"] = profile_data["job_title"].split(" at ", 1)[1].strip()
+    return profile_data
+
+# Bump when clean_leads_data rules change so every stored lead is re-normalized once
+NORMALIZATION_VERSION = 2
+
+# Fields every cleaned lead has
+LEAD_FIELDS = ["name", "title", "company", "location", "email", "emails", "source_url"]
+
+def is_lead_dirty(lead):
+    """Check whether a lead changed since it was last normalized"""
+    return lead.get("normalized_version") != NORMALIZATION_VERSION
+
+def mark_lead_dirty(lead):
+    """Flag a mutated lead for the next incremental clean"""
+    lead.pop("normalized_version", None)
+
+def clean_leads_data(leads, only_dirty=False):
+    """Clean and normalize leads data
+    
+    only_dirty skips leads already normalized at NORMALIZATION_VERSION.
+    """
+    # Company names repeat heavily in bulk imports, so each distinct value is normalized once
+    companies = {}
     cleaned_leads = []
     for lead in leads:
+        if only_dirty and not is_lead_dirty(lead):
+            cleaned_leads.append(lead)
+            continue
+        
         # Normalize company names (capitalize first letter of each word)
-        if lead.get("company"):
-            lead["company"] = re.sub(r'\s+', ' ', lead["company"].strip())
-            lead["company"] = ' '.join([word.capitalize() for word in lead["company"].split()])
+        company = lead.get("company")
+        if company:
+            normalized = companies.get(company)
+            if normalized is None:
+                normalized = companies[company] = ' '.join([word.capitalize() for word in company.split()])
+            lead["company"] = normalized
+        
+        # Store profile URLs in the canonical form lookups compare against
+        if lead.get("source_url"):
+            lead["source_url"] = canonical_profile_url(lead["source_url"])
         
         # Ensure all fields exist
-        for field in ["name", "title", "company", "location", "email", "emails", "source_url"]:
+        for field in LEAD_FIELDS:
             if field not in lead:
                 if field == "emails":
                     lead[field] = []
@@ -105,11 +584,48 @@ def clean_leads_data(leads):
             if not lead.get("emails"):
                 lead["emails"] = []
             lead["emails"].append(lead["email"])
-                
+        
+        lead["normalized_version"] = NORMALIZATION_VERSION
         cleaned_leads.append(lead)
     
     return cleaned_leads
 
+clean_task = {"running": False, "started_at": None, "finished_at": None, "cleaned": 0, "error": None}
+_clean_task_lock = threading.Lock()
+
+def run_incremental_clean(full=False):
+    """Normalize only the leads mutated since the last pass; returns (cleaned, total)"""
+    with _leads_lock:
+        leads = load_leads()
+        if full:
+            for lead in leads:
+                mark_lead_dirty(lead)
+        dirty = [lead for lead in leads if is_lead_dirty(lead)]
+        if dirty:
+            # Leads are cleaned in place, so saving the full list persists them
+            clean_leads_data(dirty)
+            save_leads(leads)
+    return len(dirty), len(leads)
+
+def start_background_clean(full=False):
+    """Run run_incremental_clean in a background thread; returns False if one is already running"""
+    if not _clean_task_lock.acquire(blocking=False):
+        return False
+    clean_task.update({"running": True, "started_at": datetime.now().isoformat(), "finished_at": None, "error": None})
+    
+    def clean_process():
+        try:
+            clean_task["cleaned"], _ = run_incremental_clean(full=full)
+        except Exception as e:
+            logger.error(f"Error in background clean: {str(e)}")
+            clean_task["error"] = str(e)
+        finally:
+            clean_task.update({"running": False, "finished_at": datetime.now().isoformat()})
+            _clean_task_lock.release()
+    
+    threading.Thread(target=clean_process, daemon=True).start()
+    return True
+
 def extract_profile_data(soup, url):
     """Extract profile data from a webpage"""
     # Basic profile structure
@@ -143,17 +659,39 @@ def extract_profile_data(soup, url):
     if location_tags:
         profile["location"] = location_tags[0].get_text().strip()
     
-    # Extract email - look for email patterns
-    email_regex = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    found_emails = re.findall(email_regex, str(soup))
+    # Extract email - scan text nodes and mailto links once, including obfuscated forms
+    found_emails = extract_emails(soup)
     if found_emails:
         profile["email"] = found_emails[0]
-        profile["emails"] = list(set(found_emails))  # Remove duplicates
+        profile["emails"] = found_emails
     
     return profile
 
-def setup_chrome_driver():
-    """Setup and return a Chrome WebDriver instance"""
+# Chrome page-load profiles: "default" is the visible browser, "lean" skips
+# everything extraction doesn't need (no UI, no images/media, eager page load)
+CHROME_PROFILES = {
+    "default": {
+        "headless": False,
+        "page_load_strategy": "normal",
+        "block_images": False
+    },
+    "lean": {
+        "headless": True,
+        "page_load_strategy": "eager",
+        "block_images": True
+    }
+}
+CHROME_PROFILE = os.getenv("CHROME_PROFILE", "default")
+
+# Count and time every WebDriver command per type and call site ("0" disables)
+DRIVER_COMMAND_STATS = os.getenv("DRIVER_COMMAND_STATS", "1") != "0"
+
+def setup_chrome_driver(profile=None, headless=None):
+    """Setup and return a Chrome WebDriver instance
+    
+    profile selects an entry of CHROME_PROFILES (defaults to CHROME_PROFILE);
+    headless overrides the profile, e.g. to keep the window for manual login.
+    """
     # Detect operating system and select appropriate ChromeDriver
     system = platform.system()
     logger.info(f"Detected OS: {system}")
@@ -167,91 +705,138 @@ def setup_chrome_driver():
     
     logger.info(f"Using ChromeDriver at: {chromedriver_path}")
     
-    # Set Chrome options to ensure browser is visible
+    profile_name = profile or CHROME_PROFILE
+    if profile_name not in CHROME_PROFILES:
+        logger.warning(f"Unknown Chrome profile '{profile_name}', using default")
+        profile_name = "default"
+    settings = CHROME_PROFILES[profile_name]
+    if headless is None:
+        headless = settings["headless"]
+    
     chrome_options = webdriver.ChromeOptions()
-    chrome_options.add_argument("--start-maximized")  # Start maximized
     chrome_options.add_argument("--disable-extensions")  # Disable extensions
     chrome_options.add_argument("--disable-gpu")  # Disable GPU acceleration
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])  # Hide automation info
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    # Make sure headless mode is NOT enabled
-    # chrome_options.add_argument("--headless")  # Comment this out to see the browser
+    chrome_options.page_load_strategy = settings["page_load_strategy"]
     
-    logger.info("Starting Chrome with visible UI")
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+    else:
+        chrome_options.add_argument("--start-maximized")  # Start maximized
+    
+    if settings["block_images"]:
+        # Images, media autoplay and notifications are never needed for extraction
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_setting_values.media_stream": 2
+        })
+    
+    logger.info(f"Starting Chrome with '{profile_name}' profile ({'headless' if headless else 'visible UI'})")
     service = Service(executable_path=chromedriver_path)
-    return webdriver.Chrome(service=service, options=chrome_options)
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.started_at = time.time()
+    metrics.driver_starts.inc()
+    if DRIVER_COMMAND_STATS:
+        driver_stats.instrument(driver)
+    return driver
+
+# Optional parts of the profile page; name, title and company are always extracted
+PROFILE_SECTIONS = ("about", "experiences", "educations")
+
+def scrape_linkedin_profile(profile_url, login_method="manual", email=None, password=None, use_existing_session=True, sections=None, screenshot=False):
+    """Scrape a LinkedIn profile using Selenium
+    
+    sections limits extraction to a subset of PROFILE_SECTIONS (default: all).
+    screenshot=True queues a debug screenshot of the profile page.
+    The result carries the per-stage timings of the run under "timings".
+    """
+    with timing.track("profile") as timeline:
+        result = _scrape_linkedin_profile(profile_url, login_method, email, password, use_existing_session, sections, screenshot)
+        timeline.failed = not result["success"]
+    result["timings"] = timeline.report()
+    return result
 
-def scrape_linkedin_profile(profile_url, login_method="manual", email=None, password=None, use_existing_session=True):
-    """Scrape a LinkedIn profile using Selenium"""
+def _scrape_linkedin_profile(profile_url, login_method, email, password, use_existing_session, sections, screenshot):
+    """Body of scrape_linkedin_profile, one timing span per stage"""
     global linkedin_driver, linkedin_login_status
+    sections = PROFILE_SECTIONS if sections is None else sections
     
     try:
         # Check if we already have a logged-in session
-        if use_existing_session and linkedin_driver:
-            # Verify existing driver session status
-            try:
-                current_url = linkedin_driver.current_url
-                # Check if driver is still active and on a LinkedIn page
-                if any(domain in current_url for domain in ["linkedin.com/feed", "linkedin.com/checkpoint", "linkedin.com/in", "linkedin.com/mynetwork"]):
-                    driver = linkedin_driver
-                    linkedin_login_status["logged_in"] = True  # Make sure login status is updated
-                    logger.info(f"Using existing LinkedIn session (URL: {current_url})")
-                else:
-                    # Browser active but not on a page requiring login
-                    logger.warning(f"Existing driver found but URL doesn't indicate login: {current_url}")
-                    driver = linkedin_driver  # Still use existing driver
-            except Exception as e:
-                # Driver not active or error, create a new one
-                logger.warning(f"Error checking existing driver: {str(e)}")
-                driver = setup_chrome_driver()
-                linkedin_login_status["logged_in"] = False
-        else:
-            # Setup a new driver
-            driver = setup_chrome_driver()
-            
-            # Login to LinkedIn
-            logger.info("Opening LinkedIn.com...")
-            driver.get("https://www.linkedin.com/login")
-            
-            if login_method == "automatic" and email and password:
-                # Login automatically
-                logger.info("Attempting automatic login")
-                actions.login(driver, email, password)
+        with timing.span("session"):
+            if use_existing_session and linkedin_driver:
+                # Verify existing driver session status
+                try:
+                    current_url = linkedin_driver.current_url
+                    # Check if driver is still active and on a LinkedIn page
+                    if any(domain in current_url for domain in ["linkedin.com/feed", "linkedin.com/checkpoint", "linkedin.com/in", "linkedin.com/mynetwork"]):
+                        driver = linkedin_driver
+                        linkedin_login_status["logged_in"] = True  # Make sure login status is updated
+                        logger.info(f"Using existing LinkedIn session (URL: {current_url})")
+                    else:
+                        # Browser active but not on a page requiring login
+                        logger.warning(f"Existing driver found but URL doesn't indicate login: {current_url}")
+                        driver = linkedin_driver  # Still use existing driver
+                except Exception as e:
+                    # Driver not active or error, create a new one
+                    logger.warning(f"Error checking existing driver: {str(e)}")
+                    driver = setup_chrome_driver()
+                    linkedin_login_status["logged_in"] = False
             else:
-                # Login manually
-                logger.info("Waiting for manual login")
-                logger.info("Please login to LinkedIn in the opened browser window")
-                # Wait for a moment to allow the login page to open
-                time.sleep(60)
-            
-            # Check if login was successful
-            if "feed" in driver.current_url or "checkpoint" in driver.current_url:
-                logger.info("Login successful")
+                # Setup a new driver (manual login needs a visible window)
+                driver = setup_chrome_driver(headless=False if login_method != "automatic" else None)
                 
-                # Update global variables
-                if linkedin_driver:
-                    try:
-                        linkedin_driver.quit()
-                    except:
-                        pass
-                linkedin_driver = driver
-                linkedin_login_status = {
-                    "logged_in": True,
-                    "timestamp": datetime.now().isoformat(),
-                    "message": "Logged in automatically"
-                }
-            else:
-                logger.error("Login unsuccessful")
-                driver.quit()
-                return {"success": False, "error": "Login to LinkedIn failed. Please check credentials or try manual login."}
+                # Login to LinkedIn
+                logger.info("Opening LinkedIn.com...")
+                driver.get("https://www.linkedin.com/login")
+                
+                if login_method == "automatic" and email and password:
+                    # Login automatically
+                    logger.info("Attempting automatic login")
+                    actions.login(driver, email, password)
+                else:
+                    # Login manually
+                    logger.info("Waiting for manual login")
+                    logger.info("Please login to LinkedIn in the opened browser window")
+                    # Wait for a moment to allow the login page to open
+                    time.sleep(60)
+                
+                # Check if login was successful
+                if "feed" in driver.current_url or "checkpoint" in driver.current_url:
+                    logger.info("Login successful")
+                    
+                    # Update global variables
+                    if linkedin_driver:
+                        try:
+                            linkedin_driver.quit()
+                        except:
+                            pass
+                    linkedin_driver = driver
+                    linkedin_login_status = {
+                        "logged_in": True,
+                        "timestamp": datetime.now().isoformat(),
+                        "message": "Logged in automatically"
+                    }
+                else:
+                    logger.error("Login unsuccessful")
+                    driver.quit()
+                    return {"success": False, "error": "Login to LinkedIn failed. Please check credentials or try manual login."}
         
         # Scrape the profile
         logger.info(f"Starting profile scraping: {profile_url}")
         
         try:
             # Navigate to profile URL
-            driver.get(profile_url)
-            time.sleep(3)  # Wait for a moment to allow the page to load
+            with timing.span("navigation"):
+                driver.get(profile_url)
+            with timing.span("sleep"):
+                time.sleep(3)  # Wait for a moment to allow the page to load
             
             # Check if redirected to login page (indicating session expired)
             if "login" in driver.current_url:
@@ -273,7 +858,8 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
                     logger.info("Scraping profile directly with Selenium")
                     
                     # Extra wait to ensure the page is fully loaded
-                    time.sleep(5)
+                    with timing.span("sleep"):
+                        time.sleep(5)
                     
                     # Initialize profile_data before use
                     profile_data = {
@@ -287,95 +873,59 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
                     }
                     
                     # Extract data from page
-                    try:
-                        name_element = driver.find_element(By.XPATH, "//h1")
-                        profile_data["name"] = name_element.text if name_element else "Unknown"
-                        logger.info(f"Name successfully extracted: {profile_data['name']}")
-                    except Exception as e:
-                        logger.error(f"Error extracting name: {str(e)}")
-                    
-                    # Extract job title/position
-                    try:
-                        title_selectors = [
-                            "//div[contains(@class, 'text-body-medium')]",
-                            "//div[contains(@class, 'pv-text-details__left-panel')]/div",
-                            "//*[contains(@class, 'pv-text-details__left-panel')]//h2",
-                            "//div[contains(@class, 'ph5')]/div[contains(@class, 'mt2')]//div[contains(@class, 'text-body-medium')]"
-                        ]
+                    with timing.span("top_card"):
+                        try:
+                            name_element = driver.find_element(By.XPATH, "//h1")
+                            profile_data["name"] = name_element.text if name_element else "Unknown"
+                            logger.info(f"Name successfully extracted: {profile_data['name']}")
+                        except Exception as e:
+                            logger.error(f"Error extracting name: {str(e)}")
                         
-                        for selector in title_selectors:
-                            try:
-                                elements = driver.find_elements(By.XPATH, selector)
-                                for element in elements:
-                                    if element and element.text.strip():
-                                        profile_data["job_title"] = element.text.strip()
-                                        logger.info(f"Job title successfully extracted: {profile_data['job_title']}")
-                                        break
-                                if profile_data["job_title"]:
-                                    break
-                            except Exception as sel_err:
-                                logger.debug(f"Error with selector {selector}: {str(sel_err)}")
-                    except Exception as e:
-                        logger.error(f"Error extracting job title: {str(e)}")
-                    
-                    # Extract current company
-                    try:
-                        company_selectors = [
-                            "//div[contains(@class, 'pv-entity__company-details')]/div",
-                            "//span[contains(@class, 'pv-entity__secondary-title')]",
-                            "//a[contains(@href, '/company/')]",
-                            "//div[contains(@class, 'inline-show-more-text')]/span"
-                        ]
+                        # Extract job title/position and current company
+                        # (fallback chains are ordered by hit rate in the selector registry)
+                        try:
+                            profile_data["job_title"] = selectors.registry.resolve(driver, "profile.title")
+                            if profile_data["job_title"]:
+                                logger.info(f"Job title successfully extracted: {profile_data['job_title']}")
+                        except Exception as e:
+                            logger.error(f"Error extracting job title: {str(e)}")
                         
-                        for selector in company_selectors:
-                            try:
-                                elements = driver.find_elements(By.XPATH, selector)
-                                for element in elements:
-                                    if element and element.text.strip():
-                                        profile_data["company"] = element.text.strip()
-                                        logger.info(f"Company successfully extracted: {profile_data['company']}")
-                                        break
-                                if profile_data["company"]:
-                                    break
-                            except Exception as sel_err:
-                                logger.debug(f"Error with company selector {selector}: {str(sel_err)}")
-                    except Exception as e:
-                        logger.error(f"Error extracting company: {str(e)}")
-                    
-                    # Extract company from job title if not found
-                    if not profile_data["company"] and " at " in profile_data.get("job_title", ""):
-                        parts = profile_data["job_title"].split(" at ", 1)
-                        profile_data["company"] = parts[1].strip() if len(parts) > 1 else ""
-                        logger.info(f"Company extracted from job title: {profile_data['company']}")
+                        try:
+                            profile_data["company"] = selectors.registry.resolve(driver, "profile.company")
+                            if profile_data["company"]:
+                                logger.info(f"Company successfully extracted: {profile_data['company']}")
+                            profile_data["company_linkedin_url"] = selectors.registry.resolve(driver, "profile.company_url")
+                        except Exception as e:
+                            logger.error(f"Error extracting company: {str(e)}")
+                        
+                        # Extract company from job title if not found
+                        if not profile_data["company"] and " at " in profile_data.get("job_title", ""):
+                            parts = profile_data["job_title"].split(" at ", 1)
+                            profile_data["company"] = parts[1].strip() if len(parts) > 1 else ""
+                            logger.info(f"Company extracted from job title: {profile_data['company']}")
                     
                     # Count experiences
-                    try:
-                        exp_elements = driver.find_elements(By.XPATH, "//section[contains(@class,'experience')]//li")
-                        profile_data["experiences"] = len(exp_elements) if exp_elements else 0
-                    except Exception as e:
-                        logger.error(f"Error extracting experiences: {str(e)}")
-                    
-                    # Count educations
-                    try:
-                        edu_elements = driver.find_elements(By.XPATH, "//section[contains(@class,'education')]//li")
-                        profile_data["educations"] = len(edu_elements) if edu_elements else 0
-                    except Exception as e:
-                        logger.error(f"Error extracting educations: {str(e)}")
-                    
-                    # Extract About section
-                    try:
-                        # Try to find about section with various selectors
-                        about_selectors = [
-                            "//section[contains(@class, 'about')]//div[contains(@class, 'display-flex')]//span",
-                            "//section[.//span[text()='About' or text()='Tentang']]//div[contains(@class, 'display-flex')]//span",
-                            "//section[contains(@id, 'about')]//div[contains(@class, 'inline-show-more-text')]",
-                            "//section[.//span[text()='About' or text()='Tentang']]//p",
-                            "//div[contains(@class, 'about-section')]//p"
-                        ]
+                    with timing.span("sections"):
+                        if "experiences" in sections:
+                            try:
+                                exp_elements = driver.find_elements(By.XPATH, "//section[contains(@class,'experience')]//li")
+                                profile_data["experiences"] = len(exp_elements) if exp_elements else 0
+                            except Exception as e:
+                                logger.error(f"Error extracting experiences: {str(e)}")
                         
-                        for selector in about_selectors:
+                        # Count educations
+                        if "educations" in sections:
                             try:
-                                # Try to click "see more" if present to see full text
+                                edu_elements = driver.find_elements(By.XPATH, "//section[contains(@class,'education')]//li")
+                                profile_data["educations"] = len(edu_elements) if edu_elements else 0
+                            except Exception as e:
+                                logger.error(f"Error extracting educations: {str(e)}")
+                    
+                    # Extract About section (skips the "see more" clicks when not requested)
+                    with timing.span("about"):
+                        if "about" in sections:
+                            try:
+                                # Click "see more" once so every about selector sees the full text
                                 try:
                                     see_more_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'see more') or contains(text(), 'lihat selengkapnya')]")
                                     for button in see_more_buttons:
@@ -385,47 +935,26 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
                                 except Exception as see_more_err:
                                     logger.debug(f"Error clicking 'see more': {str(see_more_err)}")
                                 
-                                # Find about element and get its text
-                                elements = driver.find_elements(By.XPATH, selector)
-                                about_text = ""
-                                for element in elements:
-                                    if element and element.text.strip():
-                                        about_text += element.text.strip() + " "
-                                
-                                if about_text:
-                                    profile_data["about"] = about_text.strip()
+                                profile_data["about"] = selectors.registry.resolve(driver, "profile.about")
+                                if profile_data["about"]:
                                     logger.info(f"About section successfully extracted: {profile_data['about'][:50]}...")
-                                    break
-                            except Exception as sel_err:
-                                logger.debug(f"Error with about selector {selector}: {str(sel_err)}")
-                    except Exception as e:
-                        logger.error(f"Error extracting about section: {str(e)}")
+                            except Exception as e:
+                                logger.error(f"Error extracting about section: {str(e)}")
                     
-                    # Take screenshot for debugging
-                    try:
-                        screenshot_path = f"profile_screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                        driver.save_screenshot(screenshot_path)
-                        logger.info(f"Screenshot saved: {screenshot_path}")
-                    except Exception as e:
-                        logger.error(f"Error saving screenshot: {str(e)}")
+                    # Keep a compressed snapshot so the page can be re-parsed later without the browser
+                    with timing.span("page_cache"):
+                        if page_cache:
+                            try:
+                                page_cache.put(profile_url, driver.page_source)
+                            except Exception as e:
+                                logger.error(f"Error caching page snapshot: {str(e)}")
                     
-                    # Send data to scrape-profile endpoint
-                    try:
-                        api_url = "http://localhost:5000/api/linkedin/scrape-profile"
-                        response = requests.post(
-                            api_url,
-                            json={"profile_data": profile_data, "use_existing_session": True, "profile_url": profile_url},
-                            timeout=10
-                        )
-                        
-                        if response.status_code == 200:
-                            logger.info("Profile data successfully sent to backend")
-                        else:
-                            logger.error(f"Failed to send profile data: {response.status_code}")
-                    except Exception as e:
-                        logger.error(f"Error sending profile data: {str(e)}")
+                    # Screenshot for debugging, written in the background
+                    with timing.span("screenshot"):
+                        capture_screenshot(driver, profile_url, "profile", requested=screenshot)
                 except Exception as scrape_e:
                     logger.error(f"Error during direct Selenium scraping: {str(scrape_e)}")
+                    capture_screenshot(driver, profile_url, "error")
                     
                     # Initialize empty Person object
                     person = type('Person', (), {})()
@@ -448,22 +977,12 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
                         logger.error(f"Basic extraction failed too: {str(basic_error)}")
                 
                 # Create lead from scraped profile
-                lead = {
-                    "name": profile_data.get("name", ""),
-                    "title": profile_data.get("job_title", ""),
-                    "company": profile_data.get("company", ""),
-                    "location": profile_data.get("location", ""),
-                    "email": "",  # LinkedIn doesn't expose email
-                    "emails": [],
-                    "source_url": profile_url,
-                    "about": profile_data.get("about", ""),
-                    "experiences": profile_data.get("experiences", 0),
-                    "educations": profile_data.get("educations", 0)
-                }
+                lead = build_profile_lead(profile_data, profile_url)
                 
                 return {"success": True, "lead": lead}
             except Exception as scrape_error:
                 logger.error(f"Error during profile scraping: {str(scrape_error)}")
+                capture_screenshot(driver, profile_url, "error")
                 # Check if problem is login-related
                 if "login" in driver.current_url:
                     linkedin_login_status["logged_in"] = False
@@ -472,6 +991,7 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
             
         except Exception as scrape_error:
             logger.error(f"Error during profile scraping: {str(scrape_error)}")
+            capture_screenshot(driver, profile_url, "error")
             # Check if problem is login-related
             if "login" in driver.current_url:
                 linkedin_login_status["logged_in"] = False
@@ -487,6 +1007,40 @@ def scrape_linkedin_profile(profile_url, login_method="manual", email=None, pass
             pass
         return {"success": False, "error": str(e)}
 
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def observe_request_latency(response):
+    """Record the request latency per route template (not per URL, so lead IDs don't multiply the series)"""
+    started = g.pop("request_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.http_request_seconds.observe(time.perf_counter() - started, route=route, method=request.method, status=response.status_code)
+    return response
+
+@metrics.registry.collector
+def collect_app_metrics():
+    """Store sizes, driver session and cache stats, read when /api/metrics is scraped"""
+    stores = (("leads", LEADS_FILE), ("jobs", JOBS_FILE), ("companies", COMPANIES_FILE))
+    stats = [(store, _file_stat(path)) for store, path in stores]
+    yield ("leadgen_store_bytes", "gauge", "Size of a JSON store file on disk", [({"store": store}, stat[1]) for store, stat in stats if stat])
+    
+    started_at = getattr(linkedin_driver, "started_at", None)
+    yield ("leadgen_driver_session_age_seconds", "gauge", "Seconds since the shared LinkedIn driver was started",
+           [({}, time.time() - started_at)] if started_at else [])
+    yield ("leadgen_linkedin_logged_in", "gauge", "Whether the shared LinkedIn session is logged in", [({}, bool(linkedin_login_status["logged_in"]))])
+    
+    caches = [("company", company_cache_stats["hits"], company_cache_stats["misses"])]
+    if page_cache:
+        page_stats = page_cache.stats()
+        caches.append(("page", page_stats["hits"], page_stats["misses"]))
+    yield ("leadgen_cache_hits_total", "counter", "Cache lookups answered from the cache", [({"cache": cache}, hits) for cache, hits, _ in caches])
+    yield ("leadgen_cache_misses_total", "counter", "Cache lookups that missed", [({"cache": cache}, misses) for cache, _, misses in caches])
+    yield ("leadgen_company_cache_fetches_total", "counter", "Company pages scraped to fill the company cache", [({}, company_cache_stats["fetches"])])
+    yield ("leadgen_screenshot_queue_depth", "gauge", "Screenshots waiting to be written", [({}, screenshot_writer.pending())])
+
 # API Routes
 @app.route('/')
 def index():
@@ -500,7 +1054,10 @@ def index():
             '/api/linkedin/scrape-profile',
             '/api/clean-data',
             '/api/export/csv',
-            '/api/status'
+            '/api/jobs',
+            '/api/leads/enrich-companies',
+            '/api/status',
+            '/api/metrics'
         ]
     })
 
@@ -524,16 +1081,18 @@ def add_lead():
     """Add a new lead"""
     try:
         lead_data = request.json
-        leads = load_leads()
-        
-        # Generate ID for new lead
-        lead_data["id"] = generate_lead_id(leads)
-        
-        # Clean the lead data
-        lead_data = clean_leads_data([lead_data])[0]
-        
-        leads.append(lead_data)
-        save_leads(leads)
+        with _leads_lock:
+            leads = load_leads()
+            
+            # Generate ID for new lead
+            lead_data["id"] = generate_lead_id(leads)
+            lead_data["last_changed"] = datetime.now().isoformat()
+            
+            # Clean the lead data
+            lead_data = clean_leads_data([lead_data])[0]
+            
+            leads.append(lead_data)
+            save_leads(leads)
         
         return jsonify({"success": True, "lead": lead_data})
     except Exception as e:
@@ -545,20 +1104,24 @@ def update_lead(lead_id):
     """Update a lead"""
     try:
         lead_data = request.json
-        leads = load_leads()
-        
-        lead_index = next((index for index, lead in enumerate(leads) if lead.get("id") == lead_id), None)
-        if lead_index is None:
-            return jsonify({"error": "Lead not found"}), 404
-        
-        # Preserve ID
-        lead_data["id"] = lead_id
-        
-        # Clean the lead data
-        lead_data = clean_leads_data([lead_data])[0]
-        
-        leads[lead_index] = lead_data
-        save_leads(leads)
+        with _leads_lock:
+            leads = load_leads()
+            
+            lead_index = next((index for index, lead in enumerate(leads) if lead.get("id") == lead_id), None)
+            if lead_index is None:
+                return jsonify({"error": "Lead not found"}), 404
+            
+            # Preserve ID and scrape metadata
+            lead_data["id"] = lead_id
+            if leads[lead_index].get("last_scraped"):
+                lead_data["last_scraped"] = leads[lead_index]["last_scraped"]
+            lead_data["last_changed"] = datetime.now().isoformat()
+            
+            # Clean the lead data
+            lead_data = clean_leads_data([lead_data])[0]
+            
+            leads[lead_index] = lead_data
+            save_leads(leads)
         
         return jsonify({"success": True, "lead": lead_data})
     except Exception as e:
@@ -569,14 +1132,15 @@ def update_lead(lead_id):
 def delete_lead(lead_id):
     """Delete a lead"""
     try:
-        leads = load_leads()
-        
-        lead_index = next((index for index, lead in enumerate(leads) if lead.get("id") == lead_id), None)
-        if lead_index is None:
-            return jsonify({"error": "Lead not found"}), 404
-        
-        removed_lead = leads.pop(lead_index)
-        save_leads(leads)
+        with _leads_lock:
+            leads = load_leads()
+            
+            lead_index = next((index for index, lead in enumerate(leads) if lead.get("id") == lead_id), None)
+            if lead_index is None:
+                return jsonify({"error": "Lead not found"}), 404
+            
+            removed_lead = leads.pop(lead_index)
+            save_leads(leads)
         
         return jsonify({"success": True, "lead": removed_lead})
     except Exception as e:
@@ -639,8 +1203,8 @@ def linkedin_login():
             except:
                 pass
         
-        # Setup a new driver
-        driver = setup_chrome_driver()
+        # Setup a new driver (manual login needs a visible window)
+        driver = setup_chrome_driver(headless=False if login_method != "automatic" else None)
         
         # Open LinkedIn login page
         logger.info("Opening LinkedIn.com...")
@@ -760,45 +1324,20 @@ def scrape_linkedin():
         password = data.get('password')
         save_profile = data.get('save', True)  # Default to saving the profile
         use_existing_session = data.get('use_existing_session', True)  # Use existing session if available
+        max_age = float(data.get('max_age', DEFAULT_SCRAPE_MAX_AGE) or 0)  # Seconds a stored profile stays fresh
+        sections = data.get('sections')  # Subset of PROFILE_SECTIONS, default all
+        screenshot = bool(data.get('screenshot', False))  # Queue a debug screenshot of the profile page
         
         # Check if profile data is sent directly from test_scraper.py
         profile_data = data.get('profile_data')
         if profile_data and profile_url:
             logger.info(f"Menerima data profil langsung dari test_scraper.py: {profile_url}")
             
-            # Create lead from sent profile data
-            lead = {
-                "name": profile_data.get("name", ""),
-                "about": profile_data.get("about", ""),
-                "title": "",  # Not in sent data
-                "company": "",  # Not in sent data
-                "location": "",  # Not in sent data
-                "email": "",
-                "emails": [],
-                "source_url": profile_url,
-                "experiences": profile_data.get("experiences", 0),
-                "educations": profile_data.get("educations", 0)
-            }
-            
-            # Save profile
+            # HTTP fallback for external scrapers that can't reach the result bus socket
             if save_profile:
-                leads = load_leads()
-                
-                # Check if this profile already exists by URL
-                existing_lead = next((ld for ld in leads if ld.get("source_url") == profile_url), None)
-                
-                if existing_lead:
-                    # Update existing lead
-                    for key, value in lead.items():
-                        if value and key != "id":
-                            existing_lead[key] = value
-                    lead = existing_lead
-                else:
-                    # Add new lead
-                    lead["id"] = generate_lead_id(leads)
-                    leads.append(lead)
-                
-                save_leads(leads)
+                lead = publish_scraped_profile(profile_url, profile_data=profile_data)
+            else:
+                lead = build_profile_lead(profile_data, profile_url)
             
             return jsonify({
                 "success": True, 
@@ -809,27 +1348,25 @@ def scrape_linkedin():
         if not profile_url:
             return jsonify({"success": False, "error": "LinkedIn profile URL is required"}), 400
         
-        # Normalize LinkedIn URL
-        # If URL is only username or format, convert to full URL format
-        if not profile_url.startswith('http'):
-            # Check if it's only username
-            if "/" not in profile_url:
-                profile_url = f"https://www.linkedin.com/in/{profile_url}"
-            # If given format linkedin.com/in/username without https
-            elif "linkedin.com/in/" in profile_url:
-                profile_url = f"https://www.{profile_url}"
-        
-        # Ensure URL starts with correct format
-        if not (profile_url.startswith('https://www.linkedin.com/') or profile_url.startswith('http://www.linkedin.com/')):
-            logger.warning(f"URL not valid: {profile_url}, trying to correct format")
-            # Try to extract username from possibly incorrect format
-            if '/in/' in profile_url:
-                username = profile_url.split('/in/')[1].split('/')[0].split('?')[0]
-                profile_url = f"https://www.linkedin.com/in/{username}"
-                logger.info(f"URL corrected to: {profile_url}")
-            else:
-                return jsonify({"success": False, "error": "LinkedIn URL format not valid. Use format https://www.linkedin.com/in/username"}), 400
+        # Normalize LinkedIn URL (username only, missing scheme, locale host/subpath, query string)
+        profile_url = canonical_profile_url(profile_url)
+        if not profile_url.startswith('https://www.linkedin.com/in/'):
+            return jsonify({"success": False, "error": "LinkedIn URL format not valid. Use format https://www.linkedin.com/in/username"}), 400
             
+        if sections is not None:
+            if isinstance(sections, str):
+                sections = [section.strip() for section in sections.split(",") if section.strip()]
+            unknown = [section for section in sections if section not in PROFILE_SECTIONS]
+            if unknown:
+                return jsonify({"success": False, "error": f"Unknown sections: {', '.join(unknown)}. Valid sections: {', '.join(PROFILE_SECTIONS)}"}), 400
+        
+        # Serve from the store if this profile was scraped within the freshness window
+        if max_age:
+            existing_lead = find_lead_by_url(load_leads(), profile_url)
+            if is_lead_fresh(existing_lead, max_age):
+                logger.info(f"Profile scraped at {existing_lead['last_scraped']} is within max_age={max_age}s, skipping scrape: {profile_url}")
+                return jsonify({"success": True, "lead": existing_lead, "fresh": True})
+        
         # Check if we need to ensure login first
         if not linkedin_login_status["logged_in"] and use_existing_session:
             logger.warning(f"Trying to scrape {profile_url} without login")
@@ -839,91 +1376,368 @@ def scrape_linkedin():
                 "requires_login": True
             }), 401
             
-        # Scrape the LinkedIn profile
+        # Scrape the LinkedIn profile (the store upsert is timed as part of the same run)
         logger.info(f"Starting to scrape profile: {profile_url}")
-        result = scrape_linkedin_profile(
-            profile_url, 
-            login_method, 
-            email, 
-            password, 
-            use_existing_session=use_existing_session
-        )
-        
-        if not result["success"]:
-            logger.error(f"Failed scraping: {result.get('error', 'Unknown error')}")
-            return jsonify(result), 400
+        scraped_at = datetime.now().isoformat()
+        with timing.track("profile") as timeline:
+            result = scrape_linkedin_profile(
+                profile_url, 
+                login_method, 
+                email, 
+                password, 
+                use_existing_session=use_existing_session,
+                sections=sections,
+                screenshot=screenshot
+            )
             
-        lead = result["lead"]
+            if not result["success"]:
+                logger.error(f"Failed scraping: {result.get('error', 'Unknown error')}")
+                return jsonify(result), 400
+                
+            lead = result["lead"]
+            
+            # Save the profile if requested
+            if save_profile:
+                with timing.span("store"):
+                    lead = publish_scraped_profile(profile_url, lead=lead, scraped_at=scraped_at) or lead
+        
+        return jsonify({"success": True, "lead": lead, "fresh": False, "timings": timeline.report()})
+    except Exception as e:
+        logger.error(f"Error scraping LinkedIn profile: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/jobs', methods=['GET'])
+def get_jobs():
+    """Get job postings, paged and filtered by company, posting date (YYYY-MM-DD, or a posted_after/posted_before range) or keyword"""
+    try:
+        jobs, index = get_jobs_index()
+        page = max(int(request.args.get('page', 1)), 1)
+        per_page = min(max(int(request.args.get('per_page', 50)), 1), 500)
+        company_url = request.args.get('company_linkedin_url')
+        company = request.args.get('company')
+        posted_date = request.args.get('posted_date')
+        posted_after = request.args.get('posted_after')
+        posted_before = request.args.get('posted_before')
+        for value in (posted_date, posted_after, posted_before):
+            if value:
+                datetime.strptime(value, "%Y-%m-%d")
+        keyword = request.args.get('q', '').lower()
+        
+        # Narrow down through the indexes before scanning anything
+        positions = None
+        for key, value in (("by_company_url", company_url and canonical_company_url(company_url)),
+                           ("by_company_name", company and company_name_key(company)),
+                           ("by_posted_date", posted_date)):
+            if value:
+                matches = set(index[key].get(value, []))
+                positions = matches if positions is None else positions & matches
+        if posted_after or posted_before:
+            matches = jobs_posted_between(index, posted_after, posted_before)
+            positions = matches if positions is None else positions & matches
+        positions = sorted(positions) if positions is not None else range(len(jobs))
+        
+        results = [jobs[position] for position in positions]
+        if keyword:
+            results = [job for job in results if keyword in (job.get("job_title") or "").lower() or keyword in (job.get("job_description") or "").lower()]
+        
+        start = (page - 1) * per_page
+        return jsonify({
+            "success": True,
+            "total": len(results),
+            "page": page,
+            "per_page": per_page,
+            "jobs": results[start:start + per_page]
+        })
+    except ValueError as e:
+        return jsonify({"success": False, "error": f"Invalid paging or date parameter: {str(e)}"}), 400
+    except Exception as e:
+        logger.error(f"Error getting jobs: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def add_jobs():
+    """Add job postings (a Job.to_dict() object or a list of them)"""
+    try:
+        data = request.json
+        new_jobs = data if isinstance(data, list) else data.get("jobs", [data])
+        added = upsert_jobs(new_jobs)
+        return jsonify({"success": True, "added": added, "total": len(get_jobs_index()[0])})
+    except Exception as e:
+        logger.error(f"Error adding jobs: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/leads/<int:lead_id>/jobs', methods=['GET'])
+def get_lead_jobs(lead_id):
+    """Get open job postings at a lead's company from the jobs index"""
+    leads = load_leads()
+    lead = next((lead for lead in leads if lead.get("id") == lead_id), None)
+    if not lead:
+        return jsonify({"success": False, "error": "Lead not found"}), 404
+    
+    jobs, index = get_jobs_index()
+    if lead.get("company_linkedin_url"):
+        positions = index["by_company_url"].get(canonical_company_url(lead["company_linkedin_url"]), [])
+    else:
+        positions = index["by_company_name"].get(company_name_key(lead.get("company")), [])
+    return jsonify({"success": True, "company": lead.get("company", ""), "jobs": [jobs[position] for position in positions]})
+
+@app.route('/api/leads/enrich-companies', methods=['POST'])
+def enrich_lead_companies():
+    """Attach company records to leads, fetching each distinct company at most once"""
+    try:
+        data = request.get_json(silent=True) or {}
+        max_age = data.get('max_age')  # Seconds a cached company stays fresh, default COMPANY_CACHE_TTL
+        if max_age is not None:
+            try:
+                max_age = float(max_age)
+            except (TypeError, ValueError):
+                max_age = -1
+            if not max_age >= 0:  # Also rejects NaN
+                return jsonify({"success": False, "error": "max_age must be a non-negative number of seconds"}), 400
+        driver = linkedin_driver if linkedin_login_status["logged_in"] else None
+        
+        # Group leads by company so N leads at one employer cost one lookup
+        by_company = {}
+        for lead in load_leads():
+            if lead.get("company_linkedin_url"):
+                by_company.setdefault(canonical_company_url(lead["company_linkedin_url"]), []).append(lead.get("id"))
+        
+        fetches_before = company_cache_stats["fetches"]
+        missing = []
+        for key in by_company:
+            try:
+                if not get_company_record(key, driver=driver, max_age=max_age):
+                    missing.append(key)
+            except Exception as e:
+                logger.error(f"Error fetching company {key}: {str(e)}")
+                missing.append(key)
         
-        # Save the profile if requested
-        if save_profile:
+        # The scrapes above can take minutes, so the keys go into a fresh copy of the store
+        with _leads_lock:
             leads = load_leads()
-            
-            # Check if this profile already exists by URL
-            existing_lead = next((ld for ld in leads if ld.get("source_url") == profile_url), None)
-            
-            if existing_lead:
-                # Update existing lead
-                for key, value in lead.items():
-                    if value and key != "id":
-                        existing_lead[key] = value
-                lead = existing_lead
-            else:
-                # Add new lead
-                lead["id"] = generate_lead_id(leads)
-                leads.append(lead)
-            
+            for lead in leads:
+                if lead.get("company_linkedin_url"):
+                    lead["company_key"] = canonical_company_url(lead["company_linkedin_url"])
             save_leads(leads)
         
-        return jsonify({"success": True, "lead": lead})
+        return jsonify({
+            "success": True,
+            "companies": len(by_company),
+            "leads": sum(len(group) for group in by_company.values()),
+            "fetched": company_cache_stats["fetches"] - fetches_before,
+            "missing": missing,
+            "requires_login": bool(missing) and driver is None
+        })
     except Exception as e:
-        logger.error(f"Error scraping LinkedIn profile: {str(e)}")
+        logger.error(f"Error enriching lead companies: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/leads/<int:lead_id>/company', methods=['GET'])
+def get_lead_company(lead_id):
+    """Get the cached company record a lead references"""
+    leads = load_leads()
+    lead = next((lead for lead in leads if lead.get("id") == lead_id), None)
+    if not lead:
+        return jsonify({"success": False, "error": "Lead not found"}), 404
+    
+    key = lead.get("company_key") or (canonical_company_url(lead["company_linkedin_url"]) if lead.get("company_linkedin_url") else None)
+    record = load_companies().get(key) if key else None
+    if not record:
+        return jsonify({"success": False, "error": "No cached company for this lead. Run /api/leads/enrich-companies first."}), 404
+    return jsonify({"success": True, "company": record, "fresh": is_company_fresh(record)})
+
+@app.route('/api/linkedin/search-jobs', methods=['POST'])
+def search_linkedin_jobs():
+    """Search LinkedIn jobs with the logged-in session and store the postings"""
+    try:
+        data = request.get_json(silent=True) or {}
+        keywords = data.get('keywords')
+        if not keywords:
+            return jsonify({"success": False, "error": "keywords is required"}), 400
+        if not linkedin_driver or not linkedin_login_status["logged_in"]:
+            return jsonify({"success": False, "error": "Not logged in to LinkedIn. Please login first.", "requires_login": True}), 401
+        
+        job_search = JobSearch(driver=linkedin_driver, close_on_complete=False, scrape=False)
+        found = [job.to_dict() for job in job_search.iter_search(keywords)]
+        added = upsert_jobs(found)
+        return jsonify({"success": True, "found": len(found), "added": added})
+    except Exception as e:
+        logger.error(f"Error searching LinkedIn jobs: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/linkedin/scrape-company-employees', methods=['POST'])
+def scrape_company_employees():
+    """Stream a company's employees into the lead store page by page, resuming after a crash"""
+    global linkedin_driver
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        company_url = data.get('company_url')
+        company_name = data.get('company', '')
+        resume = data.get('resume', True)
+        
+        if not company_url or "/company/" not in company_url:
+            return jsonify({"success": False, "error": "LinkedIn company URL is required, e.g. https://www.linkedin.com/company/name"}), 400
+        if not linkedin_driver or not linkedin_login_status["logged_in"]:
+            return jsonify({"success": False, "error": "Not logged in to LinkedIn. Please login first.", "requires_login": True}), 401
+        
+        company_url = canonical_url(company_url)
+        cursor = load_employee_cursors().get(company_url) if resume else None
+        cursor = cursor or {"page": 0, "recent": []}
+        if cursor["page"]:
+            logger.info(f"Resuming employee scrape of {company_url} at page {cursor['page']}")
+        
+        company = Company(company_url, name=company_name, driver=linkedin_driver, scrape=False, get_employees=False, close_on_complete=False)
+        added = 0
+        pending = []
+        
+        def flush(page_cursor):
+            # Write the collected employees before the saved cursor moves past them
+            nonlocal added
+            if pending:
+                with _leads_lock:
+                    leads = load_leads()
+                    index = index_leads(leads)
+                    for employee in pending:
+                        upsert_lead(leads, {
+                            "name": employee["name"],
+                            "title": employee["designation"],
+                            "company": company_name,
+                            "location": "",
+                            "email": "",
+                            "emails": [],
+                            "source_url": employee["linkedin_url"]
+                        }, index=index)
+                    save_leads(leads)
+                added += len(pending)
+                logger.info(f"Saved {len(pending)} employees up to page {page_cursor['page']} of {company_url}")
+                pending.clear()
+            save_employee_cursor(company_url, page_cursor)
+        
+        def checkpoint(page_cursor):
+            if len(pending) >= EMPLOYEE_WRITE_BATCH:
+                flush(page_cursor)
+        
+        for page, employees in company.iter_employee_pages(cursor=cursor, checkpoint=checkpoint):
+            pending.extend(employees)
+        
+        flush(cursor)
+        save_employee_cursor(company_url, None)
+        return jsonify({"success": True, "count": added, "pages": cursor["page"]})
+    except Exception as e:
+        logger.error(f"Error scraping company employees: {str(e)}")
+        return jsonify({"success": False, "error": str(e), "resumable": True}), 500
+
+@app.route('/api/linkedin/reparse', methods=['POST'])
+def reparse_cached_profiles():
+    """Re-run profile extraction over cached page snapshots without opening the browser"""
+    if not page_cache:
+        return jsonify({"success": False, "error": "Page cache is disabled. Set PAGE_CACHE_DIR to enable it."}), 400
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        profile_url = data.get('profile_url')
+        save_profile = data.get('save', True)
+        
+        if profile_url:
+            page_source = page_cache.get(profile_url)
+            if page_source is None:
+                return jsonify({"success": False, "error": f"No cached snapshot for {profile_url}"}), 404
+            entry = page_cache.entry(profile_url)
+            pages = [(entry["url"], page_source, entry["fetched_at"])]
+        else:
+            pages = list(page_cache.iter_pages())
+        
+        # Parse outside the lock; only the merge into the store holds it
+        parsed = [build_profile_lead(extract_profile_from_source(page_source), url) for url, page_source, _ in pages]
+        
+        if save_profile and parsed:
+            with _leads_lock:
+                leads = load_leads()
+                index = index_leads(leads)
+                parsed = [
+                    upsert_lead(leads, lead, scraped_at=datetime.fromtimestamp(fetched_at).isoformat(), index=index)
+                    for lead, (_, _, fetched_at) in zip(parsed, pages)
+                ]
+                save_leads(leads)
+        
+        logger.info(f"Re-parsed {len(parsed)} cached profile snapshots")
+        return jsonify({"success": True, "count": len(parsed), "leads": parsed})
+    except Exception as e:
+        logger.error(f"Error re-parsing cached profiles: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/extract-profiles', methods=['POST'])
+def extract_profiles_batch():
+    """Extract contact profiles from many HTML documents in one call"""
+    try:
+        data = request.get_json(silent=True) or {}
+        documents = data.get('documents') or []  # [{"url": ..., "html": ...}]
+        if not documents:
+            return jsonify({"success": False, "error": "documents is required"}), 400
+        
+        start = time.perf_counter()
+        results = extract_profiles(
+            [document.get("html", "") for document in documents],
+            urls=[document.get("url") for document in documents],
+            processes=data.get('processes')
+        )
+        
+        return jsonify({
+            "success": True,
+            "count": len(results),
+            "failed": sum(1 for result in results if result["error"]),
+            "seconds": time.perf_counter() - start,
+            "results": results
+        })
+    except Exception as e:
+        logger.error(f"Error extracting profiles: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/clean-data', methods=['POST'])
 def clean_data():
-    """Clean and normalize leads data"""
+    """Clean and normalize leads changed since the last pass"""
     try:
-        leads = load_leads()
-        cleaned_leads = clean_leads_data(leads)
-        save_leads(cleaned_leads)
+        data = request.get_json(silent=True) or {}
+        full = bool(data.get('full', False))  # Re-normalize every lead, not only dirty ones
         
-        return jsonify({"success": True, "count": len(cleaned_leads)})
+        if data.get('background'):
+            started = start_background_clean(full=full)
+            return jsonify({"success": True, "started": started, "task": clean_task}), 202
+        
+        cleaned, total = run_incremental_clean(full=full)
+        return jsonify({"success": True, "count": total, "cleaned": cleaned})
     except Exception as e:
         logger.error(f"Error cleaning data: {str(e)}")
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/clean-data/status', methods=['GET'])
+def clean_data_status():
+    """Get the state of the last background clean"""
+    return jsonify({"success": True, "task": clean_task})
+
 @app.route('/api/clean-all', methods=['POST'])
 def clean_all():
-    """Complete reset and normalize leads data (remove duplicates)"""
+    """Normalize leads data and merge duplicate leads"""
     try:
-        leads = load_leads()
-        
-        # Clean individual leads
-        cleaned_leads = clean_leads_data(leads)
-        
-        # Remove duplicates by email
-        email_dict = {}
-        for lead in cleaned_leads:
-            if lead.get("email"):
-                email_dict[lead["email"]] = lead
-        
-        # Also check source_url for duplicates
-        url_dict = {}
-        for lead in [l for l in cleaned_leads if not l.get("email")]:
-            if lead.get("source_url") and lead["source_url"] not in url_dict:
-                url_dict[lead["source_url"]] = lead
-        
-        # Combine unique leads
-        unique_leads = list(email_dict.values()) + list(url_dict.values())
-        
-        # Reassign IDs
-        for i, lead in enumerate(unique_leads):
-            lead["id"] = i + 1
-        
-        save_leads(unique_leads)
+        with _leads_lock:
+            leads = load_leads()
+            
+            # Clean individual leads
+            cleaned_leads = clean_leads_data(leads)
+            
+            # Resolve duplicates by blocking keys (name + company, profile slug, email, email domain);
+            # survivors keep their id, so nothing referencing a lead id is broken
+            unique_leads, clusters = dedupe_leads(cleaned_leads)
+            
+            save_leads(unique_leads)
         
-        return jsonify({"success": True, "count": len(unique_leads)})
+        return jsonify({
+            "success": True,
+            "count": len(unique_leads),
+            "merged": len(cleaned_leads) - len(unique_leads),
+            "clusters": clusters
+        })
     except Exception as e:
         logger.error(f"Error cleaning all data: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -975,7 +1789,7 @@ def export_csv():
 @app.route('/api/status', methods=['GET'])
 def api_status():
     """Check API status"""
-    leads_count = len(load_leads())
+    leads_count = count_leads()
     
     return jsonify({
         'status': 'online',
@@ -994,8 +1808,8 @@ def run_test_scraper():
         data = request.get_json()
         profile_url = data.get('profile_url', '') if data else ''
         
-        # Setup Chrome WebDriver
-        driver = setup_chrome_driver()
+        # Setup Chrome WebDriver (visible, the user logs in manually)
+        driver = setup_chrome_driver(headless=False)
         
         # Inisiasi proses login dalam thread terpisah
         import threading
@@ -1095,21 +1909,6 @@ def run_test_scraper():
                                 # Set driver global
                                 linkedin_driver = driver
                                 
-                                # Panggil API untuk update status
-                                try:
-                                    # Gunakan API manual-update yang lebih stabil
-                                    requests.post(
-                                        "http://localhost:5000/api/linkedin/manual-update",
-                                        json={
-                                            "status": True, 
-                                            "message": f"Updated from WebDriver login process - URL: {current_url}"
-                                        },
-                                        timeout=5
-                                    )
-                                    logger.info("Status update API called successfully")
-                                except Exception as api_e:
-                                    logger.error(f"Error calling update API: {str(api_e)}")
-                                
                                 # Proses scraping profil jika URL tersedia
                                 if profile_url:
                                     logger.info(f"Scraping profile: {profile_url}")
@@ -1121,6 +1920,9 @@ def run_test_scraper():
                                         driver.get(profile_url)
                                         time.sleep(5)  # Wait for profile page to open
                                         
+                                        scraped_at = datetime.now().isoformat()
+                                        profile_data = {"source_url": profile_url}
+                                        
                                         # Ambil data dari halaman
                                         name_element = driver.find_element(By.XPATH, "//h1")
                                         name = name_element.text if name_element else "Unknown"
@@ -1135,32 +1937,13 @@ def run_test_scraper():
                                             pass
                                         
                                         # Ekstrak job title/posisi dengan selector alternatif
+                                        # Jika teks terlalu panjang, mungkin bukan jabatan
                                         try:
-                                            title_selectors = [
-                                                "//div[contains(@class, 'text-body-medium')]",
-                                                "//div[contains(@class, 'pv-text-details__left-panel')]/div",
-                                                "//*[contains(@class, 'pv-text-details__left-panel')]//h2",
-                                                "//div[contains(@class, 'ph5')]/div[contains(@class, 'mt2')]//div[contains(@class, 'text-body-medium')]"
-                                            ]
-                                            
-                                            for selector in title_selectors:
-                                                try:
-                                                    elements = driver.find_elements(By.XPATH, selector)
-                                                    for element in elements:
-                                                        if element and element.text.strip():
-                                                            text = element.text.strip()
-                                                            # Jika teks terlalu panjang, mungkin bukan jabatan
-                                                            if len(text) < 100:
-                                                                profile_data["job_title"] = text
-                                                                logger.info(f"Job title successfully extracted: {profile_data['job_title']}")
-                                                                break
-                                                    if profile_data.get("job_title"):
-                                                        break
-                                                except Exception as sel_err:
-                                                    logger.debug(f"Error with selector {selector}: {str(sel_err)}")
+                                            profile_data["job_title"] = selectors.registry.resolve(driver, "profile.title", max_length=100)
+                                            if profile_data["job_title"]:
+                                                logger.info(f"Job title successfully extracted: {profile_data['job_title']}")
                                         except Exception as sel_err:
-                                            logger.debug(f"Error with selector {selector}: {str(sel_err)}")
-                                            continue
+                                            logger.debug(f"Error extracting job title: {str(sel_err)}")
                                         
                                         # Pastikan job_title selalu ada meskipun kosong
                                         if "job_title" not in profile_data:
@@ -1182,29 +1965,18 @@ def run_test_scraper():
                                         except:
                                             pass
                                         
-                                        # Kirim data ke endpoint scrape-profile
-                                        profile_data = {
+                                        # Serahkan hasil ke result bus
+                                        profile_data.update({
                                             "name": name,
                                             "about": about,
                                             "experiences": experiences,
-                                            "educations": educations,
-                                            "source_url": profile_url
-                                        }
+                                            "educations": educations
+                                        })
                                         
-                                        try:
-                                            api_url = "http://localhost:5000/api/linkedin/scrape-profile"
-                                            response = requests.post(
-                                                api_url,
-                                                json={"profile_data": profile_data, "use_existing_session": True, "profile_url": profile_url},
-                                                timeout=10
-                                            )
-                                            
-                                            if response.status_code == 200:
-                                                logger.info("Profile data successfully sent to backend")
-                                            else:
-                                                logger.error(f"Failed to send profile data: {response.status_code}")
-                                        except Exception as e:
-                                            logger.error(f"Error sending profile data: {str(e)}")
+                                        if publish_scraped_profile(profile_url, profile_data=profile_data, scraped_at=scraped_at):
+                                            logger.info("Profile data saved through result bus")
+                                        else:
+                                            logger.error("Failed to save profile data through result bus")
                                     except Exception as e:
                                         logger.error(f"Error scraping profile: {str(e)}")
                                 
@@ -1593,6 +2365,27 @@ def verify_linkedin_login():
             "error": error_msg
         })
 
+@app.route('/api/linkedin/selector-stats', methods=['GET'])
+def get_selector_stats():
+    """Get hit/miss and latency stats for the profile selector fallback chains"""
+    return jsonify({"success": True, "fields": selectors.registry.stats()})
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Get request, store, scrape, driver and cache metrics in the Prometheus text format"""
+    return Response(metrics.registry.render(), content_type=metrics.CONTENT_TYPE)
+
+@app.route('/api/linkedin/stage-timings', methods=['GET'])
+def get_stage_timings():
+    """Get p50/p95/p99 latency per scrape stage, keyed by pipeline.stage"""
+    return jsonify({"success": True, "stages": timing.stages.snapshot()})
+
+@app.route('/api/linkedin/driver-commands', methods=['GET'])
+def get_driver_commands():
+    """Get count and latency per WebDriver command and the call sites that spend the most time"""
+    top = int(request.args.get('top', 20))
+    return jsonify({"success": True, "enabled": DRIVER_COMMAND_STATS, **driver_stats.stats.snapshot(top=top)})
+
 @app.route('/api/linkedin/profile-details/<int:lead_id>', methods=['GET'])
 def get_profile_details(lead_id):
     """Get detailed LinkedIn profile data for a specific lead"""
@@ -1633,8 +2426,25 @@ if __name__ == '__main__':
     parser.add_argument('--port', type=int, default=5000, help='Port to run the API server on')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to run the API server on')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode')
+    parser.add_argument('--rekey-leads', action='store_true', help='Migrate stored leads and cached pages to canonical profile URLs, then exit')
     
     args = parser.parse_args()
     
+    if args.rekey_leads:
+        with _leads_lock:
+            leads, merged = rekey_leads(load_leads())
+            save_leads(leads)
+        rekeyed_pages = page_cache.rekey() if page_cache else 0
+        print(f"Re-keyed {len(leads)} leads ({merged} duplicates merged), {rekeyed_pages} cached pages")
+        raise SystemExit(0)
+    
+    # Let external scrapers (test_scraper.py) publish results without an HTTP round trip.
+    # With --debug only the reloader child process owns the socket.
+    if result_bus.DEFAULT_SOCKET_PATH and (not args.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"):
+        try:
+            result_bus.SocketListener().start()
+        except Exception as e:
+            logger.error(f"Error starting result bus socket: {str(e)}")
+    
     # Run the app
     app.run(host=args.host, port=args.port, debug=args.debug) 
\ No newline at end of file
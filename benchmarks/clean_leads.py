@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Time clean_leads_data on a synthetic bulk import and check it against the reference rules.
+
+Usage:
+    python benchmarks/clean_leads.py [--leads 500000] [--companies 20000] [--seed 7]
+
+The reference is the plain per-lead loop clean_leads_data used before the
+company memo. Output must match it exactly, including the order in which
+missing keys are added, and the script exits non-zero on any difference.
+"""
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import LEAD_FIELDS, NORMALIZATION_VERSION, clean_leads_data  # noqa: E402
+
+WORDS = ["global", "  solutions", "tech", "INDONESIA", "pt", "group", "o'neil", "3m", "Ünïcode", "straße"]
+
+
+def reference_clean(leads):
+    for lead in leads:
+        if lead.get("company"):
+            lead["company"] = ' '.join([word.capitalize() for word in lead["company"].split()])
+        for field in LEAD_FIELDS:
+            if field not in lead:
+                lead[field] = [] if field == "emails" else ""
+        if lead.get("email") and lead["email"] not in lead.get("emails", []):
+            if not lead.get("emails"):
+                lead["emails"] = []
+            lead["emails"].append(lead["email"])
+        lead["normalized_version"] = NORMALIZATION_VERSION
+    return leads
+
+
+def synthetic_leads(count, distinct_companies, seed):
+    """Leads with the awkward cases: missing keys, explicit None, blank companies, emails listed or not"""
+    rng = random.Random(seed)
+    companies = ["", "   "] + [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))) + f" {i}" for i in range(distinct_companies)
+    ]
+    leads = []
+    for i in range(count):
+        lead = {"id": i + 1, "name": f"Lead {i}"}
+        if rng.random() < 0.9:
+            lead["company"] = rng.choice(companies)
+        elif rng.random() < 0.5:
+            lead["company"] = None
+        if rng.random() < 0.7:
+            lead["email"] = f"lead{i}@example.com" if rng.random() < 0.8 else ""
+        if rng.random() < 0.5:
+            lead["emails"] = [f"lead{i}@example.com"] if rng.random() < 0.5 else []
+        if rng.random() < 0.5:
+            lead["title"] = "Engineer"
+        leads.append(lead)
+    return leads
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark clean_leads_data against the reference rules")
+    parser.add_argument("--leads", type=int, default=500000)
+    parser.add_argument("--companies", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    leads = synthetic_leads(args.leads, args.companies, args.seed)
+    expected, actual = copy.deepcopy(leads), copy.deepcopy(leads)
+
+    start = time.perf_counter()
+    reference_clean(expected)
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clean_leads_data(actual)
+    clean_seconds = time.perf_counter() - start
+
+    print(f"leads: {args.leads}  reference: {reference_seconds:.2f}s  clean_leads_data: {clean_seconds:.2f}s")
+    # json.dumps keeps key order, so this also compares the order keys were added in
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if json.dumps(a) != json.dumps(b)]
+    for i in mismatches[:5]:
+        print(f"MISMATCH at {i}:\n  reference:        {json.dumps(expected[i])}\n  clean_leads_data: {json.dumps(actual[i])}")
+    if mismatches:
+        print(f"{len(mismatches)} mismatching leads")
+        return 1
+    print("identical output")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare page-ready time and memory across the Chrome driver profiles.
+
+Usage:
+    python benchmarks/driver_profiles.py URL [URL ...] [--profiles default lean] [--runs 3] [--output out.json]
+
+Every profile in CHROME_PROFILES opens the same URLs. The script reports how
+long driver.get() blocks, the navigation timing marks, the JS heap, and the
+resident memory of the browser processes (when psutil is installed).
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import CHROME_PROFILES, setup_chrome_driver  # noqa: E402
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+NAVIGATION_TIMING_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var memory = performance.memory || {};
+return {
+    dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+    load_ms: nav ? nav.loadEventEnd : null,
+    transfer_bytes: nav ? nav.transferSize : null,
+    resources: performance.getEntriesByType('resource').length,
+    js_heap_bytes: memory.usedJSHeapSize || null
+};
+"""
+
+
+def browser_rss_bytes(driver):
+    """Resident memory of chromedriver and every browser process it started"""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        return sum(proc.memory_info().rss for proc in [root] + root.children(recursive=True))
+    except Exception:
+        return None
+
+
+def median(values):
+    values = [value for value in values if value is not None]
+    return statistics.median(values) if values else None
+
+
+def bench_profile(profile, urls, runs):
+    driver = setup_chrome_driver(profile=profile)
+    samples = []
+    try:
+        for _ in range(runs):
+            for url in urls:
+                start = time.perf_counter()
+                driver.get(url)
+                get_seconds = time.perf_counter() - start
+                sample = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+                sample.update({"url": url, "get_ms": get_seconds * 1000})
+                samples.append(sample)
+        rss = browser_rss_bytes(driver)
+    finally:
+        driver.quit()
+
+    return {
+        "profile": profile,
+        "settings": CHROME_PROFILES[profile],
+        "samples": len(samples),
+        "get_ms_p50": median([s["get_ms"] for s in samples]),
+        "dom_content_loaded_ms_p50": median([s["dom_content_loaded_ms"] for s in samples]),
+        "load_ms_p50": median([s["load_ms"] for s in samples]),
+        "resources_p50": median([s["resources"] for s in samples]),
+        "js_heap_bytes_p50": median([s["js_heap_bytes"] for s in samples]),
+        "browser_rss_bytes": rss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chrome driver profiles")
+    parser.add_argument("urls", nargs="+", help="Pages to load with every profile")
+    parser.add_argument("--profiles", nargs="+", default=list(CHROME_PROFILES), choices=list(CHROME_PROFILES))
+    parser.add_argument("--runs", type=int, default=3, help="Passes over the URL list per profile")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = [bench_profile(profile, args.urls, args.runs) for profile in args.profiles]
+    for result in results:
+        print(f"{result['profile']:>10}: get p50 {result['get_ms_p50']:.0f} ms, "
+              f"heap {result['js_heap_bytes_p50'] or 0:,.0f} B, rss {result['browser_rss_bytes'] or 0:,.0f} B")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
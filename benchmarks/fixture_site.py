@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""Local stand-in for the LinkedIn pages the scraper classes read.
+
+Usage:
+    python benchmarks/fixture_site.py [--port 8001] [--latency 0.2] [--jitter 0.05] [--page-size 10]
+    python benchmarks/fixture_site.py --run-scrapers [--profile lean]
+
+Serves profiles, details/experience, details/education, company home,
+about and people pages, the jobs home, job search and job view pages with
+the DOM structure Person, Company, Job and JobSearch expect. Every page
+shows the signed-in navigation. Content is generated deterministically from
+the URL, so any slug works. Each request is delayed by --latency seconds
+(plus up to --jitter), and company people and job search results arrive
+--page-size items at a time, through the "Next" button and by scrolling
+the result list respectively.
+
+Point the scrapers at it by URL:
+
+    Person(f"{base_url}/in/jane-doe", driver=driver)
+    Company(f"{base_url}/company/acme", driver=driver)
+    Job(f"{base_url}/jobs/view/1001", driver=driver)
+    JobSearch(driver, base_url=f"{base_url}/jobs/")
+
+--run-scrapers starts the site on a free port and runs all four against it
+with a real Chrome from app.setup_chrome_driver.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+from flask import Flask, abort, render_template_string, request
+from werkzeug.serving import make_server
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIRST_NAMES = ["Andi", "Budi", "Citra", "Dewi", "Eko", "Fajar", "Gita", "Hadi", "Indah", "Joko", "Kartika", "Lina", "Maya", "Nur", "Putri", "Rina"]
+LAST_NAMES = ["Santoso", "Wijaya", "Pratama", "Saputra", "Hidayat", "Kusuma", "Lestari", "Nugroho", "Setiawan", "Wibowo"]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Sales Director", "HR Business Partner", "Marketing Lead", "CTO", "Account Executive"]
+COMPANIES = ["Acme Global", "Nusantara Tech", "Garuda Logistics", "Sinar Retail", "Borneo Energy", "Kopi Digital", "Java Fintech", "Bali Studios"]
+SCHOOLS = ["Universitas Indonesia", "Institut Teknologi Bandung", "Universitas Gadjah Mada", "Binus University"]
+DEGREES = ["Bachelor of Science - BS, Computer Science", "Bachelor of Business Administration", "Master of Science - MS, Data Science"]
+CITIES = ["Jakarta, Indonesia", "Bandung, West Java, Indonesia", "Surabaya, East Java, Indonesia", "Singapore"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+AREAS = ["Recommended for you", "Top job picks", "Still hiring", "More jobs for you"]
+
+LAYOUT = """<!DOCTYPE html>
+<html><head><title>{{ title }} | LinkedIn</title>
+<style>
+  .jobs-search-results-list { height: 600px; overflow-y: auto; }
+  .job-card-list { height: 120px; border-bottom: 1px solid #ddd; }
+  .list-style-none li { min-height: 80px; }
+</style></head>
+<body>
+<header><nav><a class="global-nav__primary-link" href="/feed/">Home</a><a class="global-nav__primary-link" href="/jobs/">Jobs</a></nav></header>
+{{ body | safe }}
+<script>
+function appendPage(container, url, done) {
+  if (container.dataset.loading === "1" || container.dataset.next === "") { return; }
+  container.dataset.loading = "1";
+  fetch(url + (url.indexOf("?") === -1 ? "?" : "&") + "page=" + container.dataset.next)
+    .then(function (response) { return response.text(); })
+    .then(function (html) {
+      var box = document.createElement("div");
+      box.innerHTML = html;
+      var next = box.firstElementChild;
+      container.dataset.next = next.dataset.next;
+      Array.prototype.slice.call(next.children).forEach(function (item) { container.appendChild(item); });
+      container.dataset.loading = "0";
+      if (done) { done(container.dataset.next); }
+    });
+}
+</script>
+</body></html>"""
+
+PROFILE = """<main class="scaffold-layout__main">
+<section class="artdeco-card pv-top-card">
+  <div class="pv-top-card-profile-picture"><img title="{{ person.name }}{{ ' #OPEN_TO_WORK' if person.open_to_work else '' }}" alt="{{ person.name }}"></div>
+  <div class="ph5">
+    <div class="mt2 relative">
+      <div><h1 class="text-heading-xlarge">{{ person.name }}</h1><div class="text-body-medium break-words">{{ person.headline }}</div></div>
+      <span class="text-body-small inline t-black--light break-words">{{ person.location }}</span>
+    </div>
+  </div>
+</section>
+<section class="artdeco-card about">
+  <div id="about"></div>
+  <div class="display-flex"><div class="inline-show-more-text"><span>{{ person.about }}</span></div></div>
+</section>
+<section class="artdeco-card experience">
+  <div id="experience"></div>
+  <ul>{% for job in person.experiences[:3] %}
+    <li><a href="/company/{{ job.company_slug }}/">{{ job.company }}</a> <span>{{ job.title }}</span></li>{% endfor %}
+  </ul>
+  <a href="{{ path }}/details/experience/">Show all experiences</a>
+</section>
+</main>"""
+
+DETAILS = """<main class="scaffold-layout__main">
+<section class="artdeco-card"><h2>{{ heading }}</h2>
+<div class="pvs-list__container"><div><div><ul>{% for item in items %}
+  <li class="pvs-list__paged-list-item artdeco-list__item">
+    <div data-view-name="profile-component-entity">
+      <div><a href="/company/{{ item.company_slug }}/"><img alt="{{ item.company }} logo"></a></div>
+      <div>
+        <div><div>{% for line in item.lines %}<div><span aria-hidden="true">{{ line }}</span></div>{% endfor %}</div></div>
+        <div><ul><li><div class="inline-show-more-text"><span>{{ item.description }}</span></div></li></ul></div>
+      </div>
+    </div>
+  </li>{% endfor %}
+</ul></div></div></div>
+</section>
+</main>"""
+
+COMPANY = """<main>
+<div dir="ltr">
+  <section class="org-top-card artdeco-card">
+    <h1 class="org-top-card-summary__title" title="{{ company.name }}">{{ company.name }}</h1>
+    <div class="org-top-card-summary-info-list">{{ company.industry }} · {{ company.headquarters }}</div>
+  </section>
+  <nav><ul class="org-page-navigation__items">
+    <li><a href="/company/{{ company.slug }}/">Home</a></li>
+    <li><a data-control-name="page_member_main_nav_about_tab" href="/company/{{ company.slug }}/about/">About</a></li>
+    <li><a href="/company/{{ company.slug }}/people/">People</a></li>
+  </ul></nav>
+  {{ tab | safe }}
+</div>
+</main>"""
+
+COMPANY_HOME = """<section class="artdeco-card org-page-home"><p>{{ company.about }}</p></section>"""
+
+COMPANY_ABOUT = """<section class="artdeco-card org-about-top"><h2>Overview</h2></section>
+<section class="artdeco-card org-page-details-module__card-spacing artdeco-card org-about-module__margin-bottom">
+  <h2>Overview</h2>
+  <p class="break-words white-space-pre-wrap">{{ company.about }}</p>
+  <dl>
+    <dt>Website</dt><dd><a href="{{ company.website }}">{{ company.website }}</a></dd>
+    <dt>Industry</dt><dd>{{ company.industry }}</dd>
+    <dt>Company size</dt><dd>{{ company.size }}</dd><dd>{{ company.headcount }} associated members</dd>
+    <dt>Headquarters</dt><dd>{{ company.headquarters }}</dd>
+    <dt>Type</dt><dd>Privately Held</dd>
+    <dt>Founded</dt><dd>{{ company.founded }}</dd>
+    <dt>Specialties</dt><dd>{{ company.specialties }}</dd>
+  </dl>
+</section>
+<section class="artdeco-card org-people-summary"><div class="mt1"><span>See all {{ company.headcount }} employees on LinkedIn</span></div></section>
+<section class="artdeco-card org-related-companies">
+  {% for group in (company.showcase, company.affiliated) %}<ul class="company-list">{% for other in group %}
+    <li class="org-company-card"><a class="company-name-link" href="/company/{{ other.slug }}/">{{ other.name }}</a><span class="company-followers-count">{{ other.followers }} followers</span></li>{% endfor %}
+  </ul>{% endfor %}
+  <button id="org-related-companies-module__show-more-btn">Show more</button>
+</section>"""
+
+PERSON_CARD = """
+  <li class="org-people-profile-card__profile-card-spacing">
+    <a href="/in/{{ person.slug }}/"><div class="artdeco-entity-lockup__title">{{ person.name }}</div></a>
+    <div class="artdeco-entity-lockup__badge">· {{ person.degree }}</div>
+    <div class="artdeco-entity-lockup__caption">{{ person.mutual }}</div>
+    <div class="artdeco-entity-lockup__subtitle">{{ person.headline }}</div>
+  </li>"""
+
+# Result lists carry the number of the page to fetch next in data-next ("" once exhausted)
+PEOPLE = """<section class="artdeco-card org-people">
+  <h2><span dir="ltr">{{ company.headcount }} associated members</span></h2>
+  <ul class="list-style-none" data-next="{{ next_page }}">{% for person in people %}""" + PERSON_CARD + """{% endfor %}</ul>
+  <button aria-label="Next" onclick="appendPage(document.querySelector('.list-style-none'), '/company/{{ company.slug }}/people/page', function (next) { if (next === '') { this.remove(); } }.bind(this))">Show more results</button>
+</section>"""
+
+PEOPLE_PAGE = """<ul data-next="{{ next_page }}">{% for person in people %}""" + PERSON_CARD + """{% endfor %}</ul>"""
+
+JOB_CARD = """<div class="job-card-list job-card-container">
+  <a class="job-card-list__title" href="/jobs/view/{{ job.id }}/">{{ job.title }}</a>
+  <div class="artdeco-entity-lockup__subtitle">{{ job.company }}</div>
+  <div class="job-card-container__metadata-wrapper">{{ job.location }}</div>
+</div>"""
+
+JOBS_HOME = """<main><div class="scaffold-finite-scroll__content">{% for area in areas %}
+  <section class="artdeco-card"><h2>{{ area.name }}</h2><ul>{% for job in area.jobs %}
+    <li class="jobs-job-board-list__item">""" + JOB_CARD + """</li>{% endfor %}
+  </ul></section>{% endfor %}
+</div></main>"""
+
+JOB_SEARCH = """<main>
+<div class="jobs-search-results-list" data-next="{{ next_page }}">{% for job in jobs %}""" + JOB_CARD + """{% endfor %}</div>
+<script>
+  var results = document.querySelector('.jobs-search-results-list');
+  results.addEventListener('scroll', function () {
+    if (results.scrollTop + results.clientHeight >= results.scrollHeight - 50) {
+      appendPage(results, '/jobs/search/page?keywords={{ keywords | urlencode }}');
+    }
+  });
+</script>
+</main>"""
+
+JOB_SEARCH_PAGE = """<div data-next="{{ next_page }}">{% for job in jobs %}""" + JOB_CARD + """{% endfor %}</div>"""
+
+JOB_VIEW = """<main>
+<div class="job-details-jobs-unified-top-card__container">
+  <h1 class="job-details-jobs-unified-top-card__job-title">{{ job.title }}</h1>
+  <div class="job-details-jobs-unified-top-card__company-name"><a href="/company/{{ job.company_slug }}/life/">{{ job.company }}</a></div>
+  <div class="job-details-jobs-unified-top-card__primary-description-container">
+    <span>{{ job.location }}</span><span>·</span><span>Reposted</span><span>{{ job.posted }}</span><span>·</span><span>{{ job.applicants }} applicants</span>
+  </div>
+  <span class="jobs-unified-top-card__applicant-count">{{ job.applicants }} applicants</span>
+</div>
+<article class="jobs-description">
+  <h2>About the job</h2>
+  <div class="jobs-description__content"><p>{{ job.description }}</p></div>
+  <button class="jobs-description__footer-button" onclick="this.previousElementSibling.style.maxHeight = 'none'">See more</button>
+</article>
+<div class="jobs-unified-description__salary-main-rail-card">{{ job.salary }}</div>
+</main>"""
+
+
+def _slugify(text):
+    return "-".join(text.lower().replace(",", "").split())
+
+
+class FixtureData(object):
+    """Deterministic fake people, companies and jobs derived from a seed and the requested slug"""
+
+    def __init__(self, seed=7, employees=45, jobs=60):
+        self.seed = seed
+        self.employees = employees
+        self.jobs = jobs
+
+    def _rng(self, *parts):
+        return random.Random(":".join(str(part) for part in (self.seed,) + parts))
+
+    def person(self, slug):
+        rng = self._rng("person", slug)
+        # "jane-doe" is Jane Doe, so names listed on a people page match the profile behind the link
+        words = [word.capitalize() for word in slug.split("-")[:2] if word.isalpha()]
+        name = " ".join(words) if len(words) == 2 else f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        experiences = []
+        year = 2024
+        for _ in range(rng.randint(2, 6)):
+            company = rng.choice(COMPANIES)
+            start = year - rng.randint(1, 4)
+            end = "Present" if not experiences else f"{rng.choice(MONTHS)} {year}"
+            location = rng.choice(CITIES)
+            title = rng.choice(TITLES)
+            experiences.append({
+                "title": title,
+                "company": company,
+                "company_slug": _slugify(company),
+                "description": f"{title} at {company}, shipping things in {location.split(',')[0]}.",
+                "lines": [title, f"{company} · Full-time", f"{rng.choice(MONTHS)} {start} - {end} · {year - start} yrs", location],
+            })
+            year = start
+        educations = []
+        for _ in range(rng.randint(1, 3)):
+            school = rng.choice(SCHOOLS)
+            start = year - 4
+            educations.append({
+                "company": school,
+                "company_slug": _slugify(school),
+                "description": "Activities and societies: student council",
+                "lines": [school, rng.choice(DEGREES), f"{start} - {year}"],
+            })
+            year = start - 1
+        return {
+            "slug": slug,
+            "name": name,
+            "headline": f"{experiences[0]['title']} at {experiences[0]['company']}",
+            "location": rng.choice(CITIES),
+            "about": f"Hi, I am {name}. I like building teams and shipping products.",
+            "open_to_work": rng.random() < 0.2,
+            "degree": rng.choice(["1st", "2nd", "3rd+"]),
+            "mutual": f"{rng.randint(0, 40)} mutual connections",
+            "experiences": experiences,
+            "educations": educations,
+        }
+
+    def company(self, slug):
+        rng = self._rng("company", slug)
+        name = " ".join(word.capitalize() for word in slug.split("-")) or "Company"
+        return {
+            "slug": slug,
+            "name": name,
+            "about": f"{name} builds software for businesses across Southeast Asia.",
+            "website": f"https://www.{slug.replace('-', '')}.example",
+            "industry": rng.choice(["Software Development", "Financial Services", "Retail", "Logistics"]),
+            "size": rng.choice(["51-200 employees", "201-500 employees", "1,001-5,000 employees"]),
+            "headcount": self.employees,
+            "headquarters": rng.choice(CITIES).split(",")[0],
+            "founded": str(rng.randint(1980, 2020)),
+            "specialties": "Software, Cloud, Data, Payments",
+            "showcase": [self._company_card(rng) for _ in range(2)],
+            "affiliated": [self._company_card(rng) for _ in range(2)],
+        }
+
+    def _company_card(self, rng):
+        name = rng.choice(COMPANIES)
+        return {"name": name, "slug": _slugify(name), "followers": f"{rng.randint(1, 900):,}"}
+
+    def people(self, company_slug, start, count):
+        """Employees start..start+count of a company (fewer at the end of the list)"""
+        people = []
+        for i in range(start, min(start + count, self.employees)):
+            rng = self._rng("employee", company_slug, i)
+            slug = f"{_slugify(rng.choice(FIRST_NAMES))}-{_slugify(rng.choice(LAST_NAMES))}-{company_slug}-{i}"
+            people.append(self.person(slug))
+        return people
+
+    def job(self, job_id):
+        rng = self._rng("job", job_id)
+        company = rng.choice(COMPANIES)
+        title = rng.choice(TITLES)
+        weeks = rng.randint(1, 4)
+        return {
+            "id": job_id,
+            "title": title,
+            "company": company,
+            "company_slug": _slugify(company),
+            "location": rng.choice(CITIES),
+            "posted": f"{weeks} week{'s' if weeks > 1 else ''} ago",
+            "applicants": rng.randint(0, 200),
+            "description": f"We are hiring a {title} to join {company}. " * 5,
+            "salary": f"IDR {rng.randint(10, 60)}M/month",
+        }
+
+    def search(self, keywords, start, count):
+        """Job search results start..start+count for keywords"""
+        rng = self._rng("search", keywords.lower())
+        base = rng.randint(1000, 9000) * 1000
+        return [self.job(base + i) for i in range(start, min(start + count, self.jobs))]
+
+
+def create_app(latency=0.0, jitter=0.0, page_size=10, employees=45, jobs=60, seed=7):
+    """Flask app serving the fixture pages; every request waits latency + up to jitter seconds"""
+    app = Flask(__name__)
+    data = FixtureData(seed=seed, employees=employees, jobs=jobs)
+    app.config["FIXTURE_DATA"] = data
+
+    def render(title, body, **context):
+        return render_template_string(LAYOUT, title=title, body=render_template_string(body, **context))
+
+    def next_page(page, total):
+        return page + 1 if (page + 1) * page_size < total else ""
+
+    @app.before_request
+    def delay():
+        wait = latency + (random.uniform(0, jitter) if jitter else 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    @app.route("/feed/")
+    def feed():
+        return render("Feed", "<main><h1>Feed</h1></main>")
+
+    @app.route("/in/<slug>/")
+    @app.route("/in/<slug>")
+    def profile(slug):
+        return render(data.person(slug)["name"], PROFILE, person=data.person(slug), path=f"/in/{slug}")
+
+    @app.route("/in/<slug>/details/<section>/")
+    @app.route("/in/<slug>/details/<section>")
+    def profile_details(slug, section):
+        person = data.person(slug)
+        if section == "experience":
+            return render("Experience", DETAILS, heading="Experience", items=person["experiences"])
+        if section == "education":
+            return render("Education", DETAILS, heading="Education", items=person["educations"])
+        abort(404)
+
+    @app.route("/company/<slug>/")
+    @app.route("/company/<slug>")
+    def company_home(slug):
+        company = data.company(slug)
+        return render(company["name"], COMPANY, company=company, tab=render_template_string(COMPANY_HOME, company=company))
+
+    @app.route("/company/<slug>/about/")
+    @app.route("/company/<slug>/about")
+    def company_about(slug):
+        company = data.company(slug)
+        return render(company["name"], COMPANY, company=company, tab=render_template_string(COMPANY_ABOUT, company=company))
+
+    @app.route("/company/<slug>/people/")
+    @app.route("/company/<slug>/people")
+    def company_people(slug):
+        company = data.company(slug)
+        tab = render_template_string(
+            PEOPLE, company=company, people=data.people(slug, 0, page_size), next_page=next_page(0, data.employees)
+        )
+        return render(company["name"], COMPANY, company=company, tab=tab)
+
+    @app.route("/company/<slug>/people/page")
+    def company_people_page(slug):
+        page = request.args.get("page", 1, type=int)
+        return render_template_string(
+            PEOPLE_PAGE, people=data.people(slug, page * page_size, page_size), next_page=next_page(page, data.employees)
+        )
+
+    @app.route("/jobs/")
+    @app.route("/jobs")
+    def jobs_home():
+        areas = [{"name": name, "jobs": data.search(name, 0, page_size)} for name in AREAS]
+        return render("Jobs", JOBS_HOME, areas=areas)
+
+    @app.route("/jobs/search/")
+    @app.route("/jobs/search")
+    def job_search():
+        keywords = request.args.get("keywords", "")
+        return render(f"{keywords} Jobs", JOB_SEARCH, jobs=data.search(keywords, 0, page_size),
+                      keywords=keywords, next_page=next_page(0, data.jobs))
+
+    @app.route("/jobs/search/page")
+    def job_search_page():
+        page = request.args.get("page", 1, type=int)
+        return render_template_string(
+            JOB_SEARCH_PAGE, jobs=data.search(request.args.get("keywords", ""), page * page_size, page_size),
+            next_page=next_page(page, data.jobs)
+        )
+
+    @app.route("/jobs/view/<int:job_id>/")
+    @app.route("/jobs/view/<int:job_id>")
+    def job_view(job_id):
+        job = data.job(job_id)
+        return render(job["title"], JOB_VIEW, job=job)
+
+    return app
+
+
+class FixtureServer(object):
+    """Runs the fixture app on a background thread, e.g. for the duration of a benchmark"""
+
+    def __init__(self, host="127.0.0.1", port=0, **options):
+        self.app = create_app(**options)
+        self._server = make_server(host, port, self.app, threaded=True)
+        self.base_url = f"http://{host}:{self._server.server_port}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def run_scrapers(base_url, profile=None):
+    """Scrape one page of each kind from the fixture site with a real Chrome and report the time taken"""
+    from app import setup_chrome_driver
+    from linkedin_scraper import Person
+    from linkedin_scraper.company import Company
+    from linkedin_scraper.job_search import JobSearch
+    from linkedin_scraper.jobs import Job
+
+    driver = setup_chrome_driver(profile=profile)
+    timings = {}
+    try:
+        start = time.perf_counter()
+        person = Person(f"{base_url}/in/jane-doe", driver=driver, close_on_complete=False,
+                        sections=("experiences", "educations"))
+        timings["person"] = (time.perf_counter() - start, f"{len(person.experiences)} experiences")
+
+        start = time.perf_counter()
+        company = Company(f"{base_url}/company/acme-global", driver=driver, close_on_complete=False)
+        timings["company"] = (time.perf_counter() - start, f"{len(company.employees)} employees")
+
+        start = time.perf_counter()
+        job = Job(f"{base_url}/jobs/view/1001", driver=driver, close_on_complete=False)
+        timings["job"] = (time.perf_counter() - start, job.job_title)
+
+        start = time.perf_counter()
+        jobs = JobSearch(driver, base_url=f"{base_url}/jobs/", scrape=False).search("python developer")
+        timings["job_search"] = (time.perf_counter() - start, f"{len(jobs)} jobs")
+    finally:
+        driver.quit()
+
+    for name, (seconds, detail) in timings.items():
+        print(f"{name:>10}: {seconds:6.2f}s  {detail}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve LinkedIn-like fixture pages on localhost")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001, help="0 picks a free port")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds, up to this much")
+    parser.add_argument("--page-size", type=int, default=10, help="People / job results per page")
+    parser.add_argument("--employees", type=int, default=45)
+    parser.add_argument("--jobs", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--run-scrapers", action="store_true", help="Run Person, Company, Job and JobSearch against the site with Chrome")
+    parser.add_argument("--profile", help="Chrome profile for --run-scrapers (see CHROME_PROFILES)")
+    args = parser.parse_args()
+
+    options = dict(latency=args.latency, jitter=args.jitter, page_size=args.page_size,
+                   employees=args.employees, jobs=args.jobs, seed=args.seed)
+    if args.run_scrapers:
+        with FixtureServer(args.host, 0, **options) as server:
+            run_scrapers(server.base_url, profile=args.profile)
+        return
+
+    server = FixtureServer(args.host, args.port, **options)
+    print(f"Fixture site on {server.base_url}  (try {server.base_url}/in/jane-doe, "
+          f"{server.base_url}/company/acme-global/people/, {server.base_url}/jobs/search/?keywords=python)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""Benchmark the lead store, cleaning, export, page extraction and API hot paths.
+
+Usage:
+    python benchmarks/suite.py [--size 1k|100k|1m] [--repeat 5] [--only store.load ...]
+                               [--output results.json] [--baseline previous.json]
+
+Leads are synthetic (see synthetic_leads) and the HTML pages come from the
+fixture site in benchmarks/fixture_site.py, rendered through its test
+client; --save-fixtures writes them to a directory. The store runs in a
+temporary directory, so the real leads_data.json is never touched.
+
+Results are written as JSON (by default to benchmarks/results/<commit>-<size>.json)
+with the median, min and max seconds of every benchmark. With --baseline,
+each median is compared to the same benchmark in an earlier results file and
+anything slower than its threshold (the allowed slowdown factor, see
+THRESHOLDS) is reported as a regression and makes the script exit 1.
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from selenium.webdriver.common.by import By  # noqa: E402
+
+import app  # noqa: E402
+from extractors import extract_profile  # noqa: E402
+from linkedin_scraper import Person, parsers, selectors  # noqa: E402
+from linkedin_scraper.company import Company  # noqa: E402
+from linkedin_scraper.job_search import JobSearch  # noqa: E402
+from linkedin_scraper.jobs import Job  # noqa: E402
+from linkedin_scraper.replay import ReplayDriver  # noqa: E402
+from fixture_site import create_app as create_fixture_app  # noqa: E402
+
+SIZES = {"1k": 1000, "100k": 100000, "1m": 1000000}
+
+# Allowed slowdown against the baseline before a benchmark counts as regressed
+DEFAULT_THRESHOLD = 1.25
+# Endpoints and anything touching the disk are noisier
+THRESHOLDS = {
+    "store.save": 1.5,
+    "store.load": 1.5,
+    "api.get_leads": 1.5,
+    "api.status": 1.5,
+    "api.add_lead": 1.5,
+    "api.export_csv": 1.5,
+}
+
+FIXTURE_BASE = "https://fixtures.local"
+FIXTURE_PAGES = {
+    "profile": "/in/jane-doe",
+    "experience": "/in/jane-doe/details/experience",
+    "education": "/in/jane-doe/details/education",
+    "company": "/company/acme-global",
+    "company_about": "/company/acme-global/about/",
+    "company_people": "/company/acme-global/people",
+    "job": "/jobs/view/1001",
+    "jobs_home": "/jobs/",
+    "job_search": "/jobs/search?keywords=python%20developer",
+}
+
+FIRST_NAMES = ["Andi", "Budi", "Citra", "Dewi", "Eko", "Fajar", "Gita", "Hadi", "Indah", "Joko", "Kartika", "Lina", "Maya", "Nur", "Putri", "Rina"]
+LAST_NAMES = ["Santoso", "Wijaya", "Pratama", "Saputra", "Hidayat", "Kusuma", "Lestari", "Nugroho", "Setiawan", "Wibowo"]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Sales Director", "HR Business Partner", "Marketing Lead", "CTO"]
+COMPANY_WORDS = ["pt", "global", "nusantara", "tech", "digital", "logistics", "retail", "energy", "fintech", "studios", "INDONESIA"]
+CITIES = ["Jakarta, Indonesia", "Bandung, Indonesia", "Surabaya, Indonesia", "Singapore", ""]
+MAIL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com"]
+
+
+def synthetic_leads(count, seed=7, duplicate_rate=0.05):
+    """Leads shaped like the store's, with messy company names and some re-scraped duplicates"""
+    rng = random.Random(seed)
+    companies = [
+        " ".join(rng.choice(COMPANY_WORDS) for _ in range(rng.randint(1, 3))) + f" {i}" for i in range(max(1, count // 20))
+    ]
+    start = datetime(2024, 1, 1)
+    leads = []
+    for i in range(count):
+        if leads and rng.random() < duplicate_rate:
+            # Same person again, from a variant of the profile URL
+            lead = copy.deepcopy(rng.choice(leads))
+            lead["id"] = i + 1
+            lead["source_url"] = lead["source_url"].replace("https://www.", "http://") + "/"
+            lead["last_changed"] = (start + timedelta(minutes=i)).isoformat()
+            leads.append(lead)
+            continue
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        company = rng.choice(companies)
+        slug = f"{first}-{last}-{i}".lower()
+        domain = rng.choice(MAIL_DOMAINS) if rng.random() < 0.5 else company.split()[-1] + ".example.com"
+        email = f"{first}.{last}{i}@{domain}".lower() if rng.random() < 0.6 else ""
+        leads.append({
+            "id": i + 1,
+            "name": f"{first} {last}",
+            "title": rng.choice(TITLES),
+            "company": company.lower() if rng.random() < 0.5 else company,
+            "location": rng.choice(CITIES),
+            "email": email,
+            "emails": [email] if email and rng.random() < 0.5 else [],
+            "source_url": f"https://www.linkedin.com/in/{slug}",
+            "last_changed": (start + timedelta(minutes=i)).isoformat(),
+        })
+    return leads
+
+
+def fixture_pages():
+    """{name: (url, page_source)} rendered from the fixture site"""
+    client = create_fixture_app().test_client()
+    return {name: (FIXTURE_BASE + path, client.get(path).get_data(as_text=True)) for name, path in FIXTURE_PAGES.items()}
+
+
+class Context(object):
+    def __init__(self, leads, pages, directory):
+        self.leads = leads
+        self.pages = pages
+        self.directory = directory
+        self.client = app.app.test_client()
+        self.replay_pages = {url: page_source for url, page_source in pages.values()}
+
+    def write_store(self):
+        app.save_leads(self.leads)
+
+
+BENCHMARKS = []
+
+
+def benchmark(name, items=None):
+    """Register fn(ctx) -> callable; fn does the untimed setup, only the returned callable is timed
+
+    items(ctx) gives the number of items one run processes, for per-item figures.
+    """
+    def register(fn):
+        BENCHMARKS.append((name, fn, items))
+        return fn
+    return register
+
+
+def lead_count(ctx):
+    return len(ctx.leads)
+
+
+@benchmark("store.save", lead_count)
+def bench_store_save(ctx):
+    return lambda: app.save_leads(ctx.leads)
+
+
+@benchmark("store.load", lead_count)
+def bench_store_load(ctx):
+    ctx.write_store()
+    return app.load_leads
+
+
+@benchmark("store.find_lead_by_url", lambda ctx: 20)
+def bench_find_lead_by_url(ctx):
+    rng = random.Random(1)
+    urls = [rng.choice(ctx.leads)["source_url"] for _ in range(20)]
+    return lambda: [app.find_lead_by_url(ctx.leads, url) for url in urls]
+
+
+@benchmark("store.upsert_lead", lambda ctx: 20)
+def bench_upsert_lead(ctx):
+    leads = copy.deepcopy(ctx.leads)
+    rng = random.Random(2)
+    updates = [dict(rng.choice(ctx.leads), title="Updated title") for _ in range(10)]
+    updates += [{"name": f"New Lead {i}", "source_url": f"https://www.linkedin.com/in/new-lead-{i}"} for i in range(10)]
+    return lambda: [app.upsert_lead(leads, dict(lead)) for lead in updates]
+
+
+@benchmark("clean.clean_leads_data", lead_count)
+def bench_clean_leads_data(ctx):
+    leads = copy.deepcopy(ctx.leads)
+    return lambda: app.clean_leads_data(leads)
+
+
+@benchmark("clean.incremental_noop", lead_count)
+def bench_incremental_noop(ctx):
+    leads = app.clean_leads_data(copy.deepcopy(ctx.leads))
+    return lambda: app.clean_leads_data(leads, only_dirty=True)
+
+
+@benchmark("clean.dedupe_leads", lead_count)
+def bench_dedupe_leads(ctx):
+    leads = app.clean_leads_data(copy.deepcopy(ctx.leads))
+    return lambda: app.dedupe_leads(leads)
+
+
+@benchmark("parse.person", lambda ctx: 2)
+def bench_parse_person(ctx):
+    (experience_url, experience), (education_url, education) = ctx.pages["experience"], ctx.pages["education"]
+    return lambda: (parsers.parse_experiences(experience, experience_url), parsers.parse_educations(education, education_url))
+
+
+@benchmark("parse.company", lambda ctx: 2)
+def bench_parse_company(ctx):
+    (about_url, about), (people_url, people) = ctx.pages["company_about"], ctx.pages["company_people"]
+    return lambda: (parsers.parse_company(about, about_url), parsers.parse_employees(people, people_url))
+
+
+@benchmark("parse.job", lambda ctx: 2)
+def bench_parse_job(ctx):
+    (job_url, job), (search_url, search) = ctx.pages["job"], ctx.pages["job_search"]
+    return lambda: (parsers.parse_job(job, job_url), parsers.parse_job_cards(search, search_url))
+
+
+@benchmark("extract.profile_lxml")
+def bench_extract_profile(ctx):
+    url, page_source = ctx.pages["profile"]
+    return lambda: extract_profile(page_source, url)
+
+
+@benchmark("extract.profile_soup")
+def bench_extract_profile_data(ctx):
+    url, page_source = ctx.pages["profile"]
+    return lambda: app.extract_profile_data(BeautifulSoup(page_source, "html.parser"), url)
+
+
+@benchmark("extract.profile_selectors")
+def bench_extract_profile_from_source(ctx):
+    url, page_source = ctx.pages["profile"]
+    # A private registry, so the runs don't shift the live selector order and stats
+    registry = selectors.registry.fresh()
+    return lambda: app.extract_profile_from_source(page_source, registry)
+
+
+@benchmark("scrape.person")
+def bench_scrape_person(ctx):
+    url = ctx.pages["profile"][0]
+    driver = ReplayDriver(ctx.replay_pages, strict=True)
+    # The sections on the profile and its details pages; interests, accomplishments and connections aren't served
+    return lambda: Person(url, driver=driver, close_on_complete=False, sections=("about", "experiences", "educations"))
+
+
+@benchmark("scrape.company")
+def bench_scrape_company(ctx):
+    url = ctx.pages["company"][0]
+    driver = ReplayDriver(ctx.replay_pages, strict=True)
+    # Employees are left out: without a browser the people list never grows, so paging would wait for its timeout
+    return lambda: Company(url, driver=driver, get_employees=False, close_on_complete=False)
+
+
+@benchmark("scrape.job")
+def bench_scrape_job(ctx):
+    url = ctx.pages["job"][0]
+    driver = ReplayDriver(ctx.replay_pages, strict=True)
+    # Job checks the sign-in on whatever page is open before navigating
+    driver.get(url)
+    return lambda: Job(url, driver=driver, close_on_complete=False)
+
+
+@benchmark("scrape.job_cards")
+def bench_scrape_job_cards(ctx):
+    url = ctx.pages["job_search"][0]
+    driver = ReplayDriver(ctx.replay_pages, strict=True)
+    search = JobSearch(driver, base_url=FIXTURE_BASE + "/jobs/", scrape=False)
+
+    def run():
+        driver.get(url)
+        return [search.scrape_job_card(card) for card in driver.find_elements(By.CLASS_NAME, "job-card-list")]
+    return run
+
+
+@benchmark("api.get_leads", lead_count)
+def bench_api_get_leads(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.get("/api/leads")
+
+
+@benchmark("api.get_lead")
+def bench_api_get_lead(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.get(f"/api/leads/{ctx.leads[-1]['id']}")
+
+
+@benchmark("api.status")
+def bench_api_status(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.get("/api/status")
+
+
+@benchmark("api.add_lead")
+def bench_api_add_lead(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.post("/api/leads", json={"name": "Bench Lead", "company": "pt bench indonesia"})
+
+
+@benchmark("api.clean_data", lead_count)
+def bench_api_clean_data(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.post("/api/clean-data", json={"full": True})
+
+
+@benchmark("api.clean_all", lead_count)
+def bench_api_clean_all(ctx):
+    ctx.write_store()
+    return lambda: ctx.client.post("/api/clean-all")
+
+
+@benchmark("api.export_csv", lead_count)
+def bench_api_export_csv(ctx):
+    ctx.write_store()
+
+    def run():
+        response = ctx.client.post("/api/export/csv")
+        response.get_data()
+        response.close()
+        return response
+    return run
+
+
+def run_benchmark(fn, ctx, repeat):
+    samples = []
+    for _ in range(repeat):
+        run = fn(ctx)
+        start = time.perf_counter()
+        result = run()
+        samples.append(time.perf_counter() - start)
+        status = getattr(result, "status_code", 200)
+        if status >= 400:
+            raise RuntimeError(f"request failed with HTTP {status}")
+    return samples
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARKS_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline):
+    """Attach baseline figures to results and return the names of regressed benchmarks"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous or not previous.get("median_s"):
+            continue
+        ratio = result["median_s"] / previous["median_s"]
+        result["baseline_median_s"] = previous["median_s"]
+        result["ratio"] = round(ratio, 3)
+        result["regressed"] = ratio > result["threshold"]
+        if result["regressed"]:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark store, cleaning, extraction and API hot paths")
+    parser.add_argument("--size", choices=list(SIZES), default="1k", help="Number of synthetic leads")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", help="Benchmark names or prefixes to run, e.g. store api.status")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Results file (default benchmarks/results/<commit>-<size>.json)")
+    parser.add_argument("--baseline", help="Earlier results file to check for regressions")
+    parser.add_argument("--save-fixtures", metavar="DIR", help="Also write the HTML fixture pages to DIR")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    output = args.output or os.path.join(BENCHMARKS_DIR, "results", f"{commit}-{args.size}.json")
+    output = os.path.abspath(output)
+
+    pages = fixture_pages()
+    if args.save_fixtures:
+        os.makedirs(args.save_fixtures, exist_ok=True)
+        for name, (_, page_source) in pages.items():
+            with open(os.path.join(args.save_fixtures, f"{name}.html"), "w", encoding="utf-8") as f:
+                f.write(page_source)
+
+    selected = [
+        (name, fn, items) for name, fn, items in BENCHMARKS
+        if not args.only or any(name == only or name.startswith(only.rstrip(".") + ".") for only in args.only)
+    ]
+    leads = synthetic_leads(SIZES[args.size], seed=args.seed)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        app.LEADS_FILE = os.path.join(directory, "leads_data.json")
+        ctx = Context(leads, pages, directory)
+        for name, fn, items in selected:
+            samples = run_benchmark(fn, ctx, args.repeat)
+            median = statistics.median(samples)
+            count = items(ctx) if items else 1
+            results[name] = {
+                "median_s": median,
+                "min_s": min(samples),
+                "max_s": max(samples),
+                "runs": len(samples),
+                "items": count,
+                "per_item_us": median / count * 1e6,
+                "threshold": THRESHOLDS.get(name, DEFAULT_THRESHOLD),
+            }
+            print(f"{name:<28} median {median * 1000:10.2f} ms   min {min(samples) * 1000:10.2f} ms   "
+                  f"{results[name]['per_item_us']:10.2f} us/item")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(results, json.load(f))
+        for name in regressions:
+            result = results[name]
+            print(f"REGRESSION {name}: {result['median_s'] * 1000:.2f} ms vs {result['baseline_median_s'] * 1000:.2f} ms "
+                  f"(x{result['ratio']}, allowed x{result['threshold']})")
+
+    report = {
+        "commit": commit,
+        "created_at": datetime.now().isoformat(),
+        "size": args.size,
+        "leads": len(leads),
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "baseline": args.baseline,
+        "regressions": regressions,
+        "benchmarks": results,
+    }
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Blocking-key entity resolution for leads
+
+Leads are grouped into blocks by cheap keys (normalized name + company,
+LinkedIn profile slug, e-mail, e-mail domain) and only pairs inside a block are
+scored. Oversized blocks are compared with a sorted-neighbourhood window, so
+the total work stays near O(n log n) instead of all pairs. Matching pairs
+are joined with union-find and every cluster is merged into one lead with
+field-level survivorship rules. Leads are never dropped, only merged.
+"""
+import re
+import unicodedata
+from difflib import SequenceMatcher
+
+from linkedin_scraper.urls import canonical_profile_url
+
+# Shared mailbox providers say nothing about the employer, so they don't form blocks
+FREE_EMAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "yahoo.co.id", "hotmail.com", "outlook.com",
+    "live.com", "icloud.com", "me.com", "aol.com", "proton.me", "protonmail.com", "gmx.com", "mail.com",
+}
+
+COMPANY_SUFFIXES = {"inc", "incorporated", "ltd", "limited", "llc", "plc", "corp", "corporation", "co", "company", "gmbh", "pt", "tbk", "sa", "bv"}
+
+MATCH_THRESHOLD = 0.9
+WINDOW = 20
+# Names whose character-bigram Dice overlap is below this are not compared further
+BIGRAM_FILTER = 0.6
+
+
+def _fold(value):
+    value = unicodedata.normalize("NFKD", value or "")
+    value = "".join(char for char in value if not unicodedata.combining(char)).lower()
+    return re.sub(r"[^a-z0-9]+", " ", value).strip()
+
+
+def normalize_name(name):
+    return _fold(name)
+
+
+def normalize_company(company):
+    return " ".join(word for word in _fold(company).split() if word not in COMPANY_SUFFIXES)
+
+
+def profile_slug(url):
+    key = canonical_profile_url(url)
+    return key.split("/in/", 1)[1] if "/in/" in key else ""
+
+
+def lead_emails(lead):
+    emails = [lead.get("email")] + list(lead.get("emails") or [])
+    return {email.strip().lower() for email in emails if email and "@" in email}
+
+
+def lead_features(lead):
+    """Normalized values used for blocking and scoring, computed once per lead"""
+    emails = lead_emails(lead)
+    name = normalize_name(lead.get("name"))
+    return {
+        "name": name,
+        "bigrams": frozenset(name[i:i + 2] for i in range(len(name) - 1)),
+        "company": normalize_company(lead.get("company")),
+        "slug": profile_slug(lead.get("source_url")),
+        "emails": emails,
+        "domains": {email.rsplit("@", 1)[1] for email in emails} - FREE_EMAIL_DOMAINS,
+    }
+
+
+def blocking_keys(features):
+    """Keys under which a lead is compared with others; leads sharing no key are never compared"""
+    keys = []
+    if features["name"] and features["company"]:
+        keys.append(("name_company", f"{features['name']}|{features['company']}"))
+    if features["slug"]:
+        keys.append(("slug", features["slug"]))
+    keys.extend(("email", email) for email in features["emails"])
+    keys.extend(("email_domain", domain) for domain in features["domains"])
+    return keys
+
+
+def match_score(a, b, threshold=MATCH_THRESHOLD):
+    """Likelihood in [0, 1] that two leads (as lead_features) describe the same person
+
+    A shared profile slug or e-mail is decisive. Otherwise the name similarity counts
+    in full only when the company or a company e-mail domain corroborates it.
+    Pairs that provably cannot reach threshold score 0.
+    """
+    if a["slug"] and b["slug"]:
+        # Two different LinkedIn profiles are two different people
+        return 1.0 if a["slug"] == b["slug"] else 0.0
+    if a["emails"] & b["emails"]:
+        return 1.0
+    if not a["name"] or not b["name"]:
+        return 0.0
+
+    corroborated = (a["company"] and a["company"] == b["company"]) or bool(a["domains"] & b["domains"])
+    weight = 1.0 if corroborated else 0.8
+    # Cheap filters first, most candidate pairs fail here: the length bound on the
+    # ratio, then character-bigram overlap, before the full SequenceMatcher
+    length_a, length_b = len(a["name"]), len(b["name"])
+    if weight * 2.0 * min(length_a, length_b) / (length_a + length_b) < threshold:
+        return 0.0
+    shared = len(a["bigrams"] & b["bigrams"])
+    if 2.0 * shared / ((len(a["bigrams"]) + len(b["bigrams"])) or 1) < BIGRAM_FILTER:
+        return 0.0
+    return weight * SequenceMatcher(None, a["name"], b["name"]).ratio()
+
+
+class _UnionFind(object):
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # Keep the earliest lead as root so cluster order follows input order
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def candidate_pairs(features, window=WINDOW):
+    """Yield index pairs of leads that share a blocking key"""
+    blocks = {}
+    for i, lead_features in enumerate(features):
+        for key in blocking_keys(lead_features):
+            blocks.setdefault(key, []).append(i)
+
+    seen = set()
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        if len(members) > window:
+            # Sorted neighbourhood: compare each lead only with its next `window` neighbours by name
+            members = sorted(members, key=lambda i: features[i]["name"])
+        for position, i in enumerate(members):
+            for j in members[position + 1:position + 1 + window]:
+                pair = (min(i, j), max(i, j))
+                if pair not in seen:
+                    seen.add(pair)
+                    yield pair
+
+
+def _recency(lead):
+    return lead.get("last_scraped") or lead.get("last_changed") or ""
+
+
+def merge_cluster(cluster):
+    """Merge duplicate leads into one using field-level survivorship rules
+
+    - the most recently scraped/changed lead survives and keeps its id
+    - empty survivor fields are filled from the other leads, most recent first
+    - emails are unioned, counts (experiences, educations) take the maximum
+    - merged_from records the ids that were absorbed
+    """
+    ordered = sorted(cluster, key=lambda lead: (_recency(lead), -(lead.get("id") or 0)), reverse=True)
+    survivor = dict(ordered[0])
+    for lead in ordered[1:]:
+        for field, value in lead.items():
+            if field in ("id", "merged_from"):
+                continue
+            if field == "emails":
+                survivor["emails"] = list(dict.fromkeys(list(survivor.get("emails") or []) + list(value or [])))
+            elif field in ("experiences", "educations") and isinstance(value, int):
+                survivor[field] = max(survivor.get(field) or 0, value)
+            elif value and not survivor.get(field):
+                survivor[field] = value
+
+    absorbed = [lead.get("id") for lead in ordered[1:]] + [i for lead in ordered for i in lead.get("merged_from", [])]
+    if absorbed:
+        survivor["merged_from"] = sorted(i for i in set(absorbed) if i is not None)
+    for field in ("last_scraped", "last_changed"):
+        stamps = [lead[field] for lead in cluster if lead.get(field)]
+        if stamps:
+            survivor[field] = max(stamps)
+    return survivor
+
+
+def dedupe_leads(leads, threshold=MATCH_THRESHOLD, window=WINDOW):
+    """Resolve duplicates in leads
+
+    Returns (deduped_leads, clusters) where clusters lists the ids merged together
+    (survivor first). Output order follows each cluster's first lead in the input.
+    """
+    features = [lead_features(lead) for lead in leads]
+    union_find = _UnionFind(len(leads))
+    # Profile slug of each cluster, so transitive matches can't join two different profiles
+    cluster_slug = {i: lead_features["slug"] for i, lead_features in enumerate(features)}
+    for i, j in candidate_pairs(features, window):
+        root_i, root_j = union_find.find(i), union_find.find(j)
+        if root_i == root_j:
+            continue
+        slug_i, slug_j = cluster_slug[root_i], cluster_slug[root_j]
+        if slug_i and slug_j and slug_i != slug_j:
+            continue
+        if match_score(features[i], features[j], threshold) >= threshold:
+            union_find.union(i, j)
+            cluster_slug[union_find.find(i)] = slug_i or slug_j
+
+    groups = {}
+    for i in range(len(leads)):
+        groups.setdefault(union_find.find(i), []).append(leads[i])
+
+    deduped, clusters = [], []
+    for root in sorted(groups):
+        group = groups[root]
+        if len(group) == 1:
+            deduped.append(group[0])
+            continue
+        merged = merge_cluster(group)
+        deduped.append(merged)
+        clusters.append([merged.get("id")] + [lead.get("id") for lead in group if lead.get("id") != merged.get("id")])
+    return deduped, clusters
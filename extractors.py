@@ -0,0 +1,165 @@
+"""Contact and profile extraction from fetched web pages
+
+Documents are scanned once with precompiled patterns: raw str/bytes
+page sources directly, parsed trees (BeautifulSoup or lxml) through their
+text nodes and mailto links, so nothing is serialized back to markup.
+
+extract_profiles is the batch counterpart of app.extract_profile_data: it
+parses with lxml, evaluates precompiled XPath equivalents of the CSS
+selectors, and fans documents out across a process pool.
+"""
+import html
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote
+
+from lxml import etree
+
+from linkedin_scraper.parsers import has_class, parse_html, read_page_source
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# EMAIL_PATTERN split at the "@", so scanning can jump between "@" signs instead of trying every word
+LOCAL_PART = re.compile(r"[a-zA-Z0-9._%+-]+\Z")
+DOMAIN_PART = re.compile(r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+LOCAL_PART_WINDOW = 256
+MAILTO_PATTERN = re.compile(r"mailto:([^\"'<>\s?]+)", re.IGNORECASE)
+
+# Only documents that show one of these hints pay for deobfuscation. "<" is left out of the
+# bracket forms because it starts every tag in raw markup.
+OBFUSCATION_HINT = re.compile(r"[\[\(\{]\s*(?:at|dot|@)\s*[\]\)\}]", re.IGNORECASE)
+ENCODED_AT_HINTS = ("&#64;", "&#x40;", "&commat;", "%40")
+OBFUSCATED_AT = re.compile(r"\s*[\[\(\{]\s*(?:at|@)\s*[\]\)\}]\s*", re.IGNORECASE)
+OBFUSCATED_DOT = re.compile(r"\s*[\[\(\{]\s*dot\s*[\]\)\}]\s*", re.IGNORECASE)
+
+# Retina image names like logo@2x.png look like addresses
+IGNORED_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".css", ".js")
+
+
+def deobfuscate(text):
+    """Rewrite "name [at] example [dot] com", entity-encoded @ and percent-encoded mailto targets into plain addresses"""
+    if "&" in text:
+        text = html.unescape(text)
+    if "%40" in text:
+        text = MAILTO_PATTERN.sub(lambda match: "mailto:" + unquote(match.group(1)), text)
+    text = OBFUSCATED_AT.sub("@", text)
+    return OBFUSCATED_DOT.sub(".", text)
+
+
+def document_text(document):
+    """Searchable text of a document without re-serializing parsed trees"""
+    if isinstance(document, bytes):
+        return document.decode("utf-8", "replace")
+    if isinstance(document, str):
+        return document
+    if hasattr(document, "find_all"):
+        # BeautifulSoup: text nodes plus mailto targets
+        mailtos = [a.get("href", "") for a in document.find_all("a", href=MAILTO_PATTERN)]
+        return "\n".join(list(document.strings) + mailtos)
+    if hasattr(document, "itertext"):
+        # lxml element or tree
+        root = document.getroot() if hasattr(document, "getroot") else document
+        mailtos = root.xpath("//a[starts-with(translate(@href, 'MAILTO', 'mailto'), 'mailto:')]/@href")
+        return "\n".join(list(root.itertext()) + list(mailtos))
+    raise TypeError(f"Unsupported document type: {type(document).__name__}")
+
+
+def find_emails(text):
+    """Yield the same matches as EMAIL_PATTERN.finditer(text), visiting only the "@" signs"""
+    position = 0
+    at = text.find("@")
+    while at != -1:
+        local = LOCAL_PART.search(text, max(position, at - LOCAL_PART_WINDOW), at)
+        domain = DOMAIN_PART.match(text, at + 1) if local else None
+        if domain:
+            yield text[local.start():domain.end()]
+            position = domain.end()
+            at = text.find("@", position)
+        else:
+            at = text.find("@", at + 1)
+
+
+def extract_emails(document):
+    """E-mail addresses in document, deduplicated case-insensitively in order of first appearance"""
+    text = document_text(document)
+    if any(hint in text for hint in ENCODED_AT_HINTS) or OBFUSCATION_HINT.search(text):
+        text = deobfuscate(text)
+
+    emails = {}
+    for email in find_emails(text):
+        key = email.lower()
+        if key not in emails and not key.endswith(IGNORED_SUFFIXES):
+            emails[key] = email
+    return list(emails.values())
+
+
+def extract_emails_many(documents, processes=None, chunksize=16):
+    """Run extract_emails over many documents across a process pool, preserving input order
+
+    With processes=1 everything runs in the calling process.
+    """
+    documents = list(documents)
+    if processes == 1 or len(documents) <= 1:
+        return [extract_emails(document) for document in documents]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(extract_emails, documents, chunksize=chunksize))
+
+
+# XPath equivalents of the extract_profile_data selectors; "(a | b)[1]" is the first match in document order
+_PROFILE_NAME = etree.XPath("(//h1 | //*[contains(@class, 'name')] | //*[contains(@id, 'name')])[1]")
+_PROFILE_TITLE = etree.XPath(
+    f"(//*[contains(@class, 'title')] | //*[{has_class('profession')}] | //*[contains(@class, 'position')])[1]"
+)
+_PROFILE_COMPANY = etree.XPath("(//*[contains(@class, 'company')] | //*[contains(@class, 'organization')])[1]")
+_PROFILE_LOCATION = etree.XPath("(//*[contains(@class, 'location')] | //address)[1]")
+
+
+def _first_text(xpath, tree):
+    found = xpath(tree)
+    # Same as BeautifulSoup get_text(): every descendant string, no separators
+    return "".join(found[0].itertext()).strip() if found else ""
+
+
+def extract_profile(page_source, url=None):
+    """lxml version of app.extract_profile_data for one page_source"""
+    tree = parse_html(page_source)
+    emails = extract_emails(tree)
+    return {
+        "name": _first_text(_PROFILE_NAME, tree),
+        "title": _first_text(_PROFILE_TITLE, tree),
+        "company": _first_text(_PROFILE_COMPANY, tree),
+        "location": _first_text(_PROFILE_LOCATION, tree),
+        "email": emails[0] if emails else "",
+        "emails": emails,
+        "source_url": url
+    }
+
+
+def _extract_profile_task(task):
+    document, url = task
+    start = time.perf_counter()
+    try:
+        if isinstance(document, os.PathLike):
+            document = read_page_source(document)
+        profile, error = extract_profile(document, url), None
+    except Exception as e:
+        profile, error = None, str(e)
+    return {"url": url, "profile": profile, "seconds": time.perf_counter() - start, "error": error}
+
+
+def extract_profiles(documents, urls=None, processes=None, chunksize=4):
+    """Extract profiles from many documents across a process pool, preserving input order
+
+    documents holds page_source strings/bytes or os.PathLike paths to saved pages.
+    Each result is {"url", "profile", "seconds", "error"}; a document that fails to
+    parse gets profile None and the error message instead of aborting the batch.
+    With processes=1 everything runs in the calling process.
+    """
+    documents = list(documents)
+    urls = list(urls) if urls is not None else [None] * len(documents)
+    tasks = list(zip(documents, urls))
+    if processes == 1 or len(tasks) <= 1:
+        return [_extract_profile_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_extract_profile_task, tasks, chunksize=chunksize))
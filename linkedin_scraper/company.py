@@ -4,15 +4,20 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from .objects import Scraper
 from .person import Person
+from . import timing
 import time
 import os
 import json
+from collections import deque
 
 AD_BANNER_CLASSNAME = ('ad-banner-container', '__ad')
 
+# Employee URLs remembered for de-duplication; pages only overlap at their edges
+RECENT_EMPLOYEES = 250
+
 def getchildren(elem):
     return elem.find_elements(By.XPATH, ".//*")
 
@@ -75,11 +80,19 @@ class Company(Scraper):
             except:
                 driver = webdriver.Chrome()
 
-        driver.get(linkedin_url)
         self.driver = driver
 
         if scrape:
-            self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
+            self._get_and_scrape(get_employees, close_on_complete)
+        else:
+            driver.get(linkedin_url)
+
+    @timing.tracked("company")
+    def _get_and_scrape(self, get_employees, close_on_complete):
+        # The initial page load belongs to the run, so it is opened here rather than in scrape
+        with timing.span("navigation"):
+            self.driver.get(self.linkedin_url)
+        self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
 
     def __get_text_under_subtitle(self, elem):
         return "\n".join(elem.text.split("\n")[1:])
@@ -87,6 +100,7 @@ class Company(Scraper):
     def __get_text_under_subtitle_by_class(self, driver, class_name):
         return self.__get_text_under_subtitle(driver.find_element(By.CLASS_NAME, class_name))
 
+    @timing.tracked("company")
     def scrape(self, get_employees=True, close_on_complete=True):
         if self.is_signed_in():
             self.scrape_logged_in(get_employees = get_employees, close_on_complete = close_on_complete)
@@ -118,175 +132,203 @@ class Company(Scraper):
             # print(e)
             return None
 
+    @timing.timed("employees")
     def get_employees(self, wait_time=10):
-        total = []
+        return list(self.iter_employees(wait_time=wait_time))
+
+    def iter_employees(self, wait_time=10, cursor=None, checkpoint=None):
+        for _, employees in self.iter_employee_pages(wait_time=wait_time, cursor=cursor, checkpoint=checkpoint):
+            for employee in employees:
+                yield employee
+
+    def iter_employee_pages(self, wait_time=10, cursor=None, checkpoint=None):
+        """Yield (page_index, employees) as each page of the people list loads
+
+        cursor is a resume point {"page": int, "recent": [linkedin_url, ...]} that
+        is updated in place once the consumer has taken a page; checkpoint, if
+        given, is called with it so a crash loses at most one page. Pages before
+        cursor["page"] are scrolled through without being read. "recent" holds
+        the last RECENT_EMPLOYEES URLs yielded, so the cursor stays the same
+        size however long the list is; employees among them are not yielded again.
+        """
         list_css = "list-style-none"
         next_xpath = '//button[@aria-label="Next"]'
         driver = self.driver
+        cursor = cursor if cursor is not None else {}
+        cursor.setdefault("page", 0)
+        # Older cursors listed every URL seen under "seen"
+        recent = deque(cursor.get("recent") or cursor.pop("seen", []), maxlen=RECENT_EMPLOYEES)
+        cursor.pop("seen", None)
+        recent_urls = set(recent)
 
-        try:
-            see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
-        except:
-            pass
         driver.get(os.path.join(self.linkedin_url, "people"))
 
         _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
 
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
         driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
-
         results_list = driver.find_element(By.CLASS_NAME, list_css)
-        results_li = results_list.find_elements(By.TAG_NAME, "li")
-        for res in results_li:
-            total.append(self.__parse_employee__(res))
-
-        def is_loaded(previous_results):
-          loop = 0
-          driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-          results_li = results_list.find_elements(By.TAG_NAME, "li")
-          while len(results_li) == previous_results and loop <= 5:
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            loop += 1
-          return loop <= 5
 
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
+        def results_after(count):
+            # Only the entries past the ones already read, so each page costs the same
+            return results_list.find_elements(By.XPATH, f"(.//li)[position() > {count}]")
 
-        results_li_len = len(results_li)
-        while is_loaded(results_li_len):
+        def load_more(previous_results):
+            # Scroll (and page) until more results show up instead of sleeping a fixed time
             try:
-                driver.find_element(By.XPATH,next_xpath).click()
+                driver.find_element(By.XPATH, next_xpath).click()
             except:
                 pass
-            _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
-
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
             driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
-
-            get_data(results_li_len)
-            results_li_len = len(total)
-        return total
-
-
-
+            try:
+                WebDriverWait(driver, wait_time, poll_frequency=0.25).until(
+                    lambda _: len(results_list.find_elements(By.XPATH, f"(.//li)[{previous_results + 1}]")) > 0
+                )
+                return True
+            except TimeoutException:
+                return False
+
+        page = 0
+        processed = 0
+        while True:
+            new_results = results_after(processed)
+            processed += len(new_results)
+
+            if page >= cursor["page"]:
+                employees = []
+                for res in new_results:
+                    employee = self.__parse_employee__(res)
+                    if employee is None or employee["linkedin_url"] in recent_urls:
+                        continue
+                    if len(recent) == recent.maxlen:
+                        recent_urls.discard(recent[0])
+                    recent.append(employee["linkedin_url"])
+                    recent_urls.add(employee["linkedin_url"])
+                    employees.append(employee)
+                yield page, employees
+
+                cursor["page"] = page + 1
+                cursor["recent"] = list(recent)
+                if checkpoint:
+                    checkpoint(cursor)
+
+            page += 1
+            if not load_more(processed):
+                break
+
+    @timing.tracked("company")
     def scrape_logged_in(self, get_employees = True, close_on_complete = True):
         driver = self.driver
 
-        driver.get(self.linkedin_url)
+        with timing.span("navigation"):
+            driver.get(self.linkedin_url)
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
+            _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
 
         navigation = driver.find_element(By.CLASS_NAME, "org-page-navigation__items ")
 
         self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
 
-        # Click About Tab or View All Link
-        try:
-          self.__find_first_available_element__(
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='page_member_main_nav_about_tab']"),
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
-          ).click()
-        except:
-          driver.get(os.path.join(self.linkedin_url, "about"))
-
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
-        time.sleep(3)
-
-        if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
-            section_id = 4
-        else:
-            section_id = 3
-       #section ID is no longer needed, we are using class name now.
-        #grid = driver.find_elements_by_tag_name("section")[section_id]
-        grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
-        print(grid)
-        descWrapper = grid.find_elements(By.TAG_NAME, "p")
-        if len(descWrapper) > 0:
-            self.about_us = descWrapper[0].text.strip()
-        labels = grid.find_elements(By.TAG_NAME, "dt")
-        values = grid.find_elements(By.TAG_NAME, "dd")
-        num_attributes = min(len(labels), len(values))
-        #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
-        # if num_attributes == 0:
-        #     exit()
-        x_off = 0
-        for i in range(num_attributes):
-            txt = labels[i].text.strip()
-            if txt == 'Website':
-                self.website = values[i+x_off].text.strip()
-            if txt == 'Phone':
-                self.phone = values[i+x_off].text.strip()
-            elif txt == 'Industry':
-                self.industry = values[i+x_off].text.strip()
-            elif txt == 'Company size':
-                self.company_size = values[i+x_off].text.strip()
-                if len(values) > len(labels):
-                    x_off = 1
-            elif txt == 'Headquarters':
-                    self.headquarters = values[i+x_off].text.strip()
-            elif txt == 'Type':
-                self.company_type = values[i+x_off].text.strip()
-            elif txt == 'Founded':
-                self.founded = values[i+x_off].text.strip()
-            elif txt == 'Specialties':
-                self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
-
-        try:
-            grid = driver.find_element(By.CLASS_NAME, "mt1")
-            spans = grid.find_elements(By.TAG_NAME, "span")
-            for span in spans:
-                txt = span.text.strip()
-                if "See all" in txt and "employees on LinkedIn" in txt:
-                    self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
-        except NoSuchElementException: # Does not exist in page, skip it
-            pass
-
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
+        with timing.span("about_tab"):
+            # Click About Tab or View All Link
+            try:
+              self.__find_first_available_element__(
+                navigation.find_elements(By.XPATH, "//a[@data-control-name='page_member_main_nav_about_tab']"),
+                navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
+              ).click()
+            except:
+              driver.get(os.path.join(self.linkedin_url, "about"))
+
+            _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
+            self.wait(3)
+
+        with timing.span("details"):
+            if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
+                section_id = 4
+            else:
+                section_id = 3
+           #section ID is no longer needed, we are using class name now.
+            #grid = driver.find_elements_by_tag_name("section")[section_id]
+            grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
+            print(grid)
+            descWrapper = grid.find_elements(By.TAG_NAME, "p")
+            if len(descWrapper) > 0:
+                self.about_us = descWrapper[0].text.strip()
+            labels = grid.find_elements(By.TAG_NAME, "dt")
+            values = grid.find_elements(By.TAG_NAME, "dd")
+            num_attributes = min(len(labels), len(values))
+            #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
+            # if num_attributes == 0:
+            #     exit()
+            x_off = 0
+            for i in range(num_attributes):
+                txt = labels[i].text.strip()
+                if txt == 'Website':
+                    self.website = values[i+x_off].text.strip()
+                if txt == 'Phone':
+                    self.phone = values[i+x_off].text.strip()
+                elif txt == 'Industry':
+                    self.industry = values[i+x_off].text.strip()
+                elif txt == 'Company size':
+                    self.company_size = values[i+x_off].text.strip()
+                    if len(values) > len(labels):
+                        x_off = 1
+                elif txt == 'Headquarters':
+                        self.headquarters = values[i+x_off].text.strip()
+                elif txt == 'Type':
+                    self.company_type = values[i+x_off].text.strip()
+                elif txt == 'Founded':
+                    self.founded = values[i+x_off].text.strip()
+                elif txt == 'Specialties':
+                    self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
+
+        with timing.span("headcount"):
+            try:
+                grid = driver.find_element(By.CLASS_NAME, "mt1")
+                spans = grid.find_elements(By.TAG_NAME, "span")
+                for span in spans:
+                    txt = span.text.strip()
+                    if "See all" in txt and "employees on LinkedIn" in txt:
+                        self.headcount = int(txt.replace("See all", "").replace("employees on LinkedIn", "").strip())
+            except NoSuchElementException: # Does not exist in page, skip it
+                pass
 
+        with timing.span("scroll"):
+            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
 
-        try:
-            _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
-            showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
-            driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
 
-            # get showcase
-            for showcase_company in showcase.find_elements(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                        linkedin_url = showcase_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = showcase_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = showcase_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                    )
-                self.showcase_pages.append(companySummary)
+        with timing.span("related"):
+            try:
+                _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
+                showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
+                driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
+
+                # get showcase
+                for showcase_company in showcase.find_elements(By.CLASS_NAME, "org-company-card"):
+                    companySummary = CompanySummary(
+                            linkedin_url = showcase_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
+                            name = showcase_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
+                            followers = showcase_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
+                        )
+                    self.showcase_pages.append(companySummary)
 
-            # affiliated company
+                # affiliated company
 
-            for affiliated_company in showcase.find_element(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                         linkedin_url = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = affiliated_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                        )
-                self.affiliated_companies.append(companySummary)
+                for affiliated_company in showcase.find_element(By.CLASS_NAME, "org-company-card"):
+                    companySummary = CompanySummary(
+                             linkedin_url = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
+                            name = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
+                            followers = affiliated_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
+                            )
+                    self.affiliated_companies.append(companySummary)
 
-        except:
-            pass
+            except:
+                pass
 
         if get_employees:
             self.employees = self.get_employees()
 
-        driver.get(self.linkedin_url)
+        with timing.span("navigation"):
+            driver.get(self.linkedin_url)
 
         if close_on_complete:
             driver.close()
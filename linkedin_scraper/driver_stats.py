@@ -0,0 +1,127 @@
+"""Count and time every WebDriver command a driver sends
+
+``instrument(driver)`` hooks the driver's ``execute``, which every Selenium
+call ends up in (``find_element``, ``WebElement.text``, ``execute_script``,
+alert handling, ...). The driver is hooked in place rather than wrapped in
+a proxy object because WebElements send their commands through the driver
+that created them, which would bypass a proxy.
+
+Each command is recorded under its name and its call site, the first frame
+outside Selenium (e.g. ``person.py:312 (get_experiences)``), in the
+process-wide ``stats``. Inside a tracked scrape (see timing) the commands
+are also rolled up on the run's Timeline, so they show up in its report.
+"""
+import os
+import sys
+import threading
+import time
+
+import selenium
+
+from . import timing
+
+_SKIPPED_PREFIXES = (os.path.dirname(selenium.__file__), os.path.abspath(__file__))
+
+
+class CommandStats(object):
+    """Latency histogram per command name plus count and time per call site"""
+
+    def __init__(self):
+        self.commands = {}
+        self.errors = {}
+        self.call_sites = {}
+        self._lock = threading.Lock()
+
+    def record(self, command, call_site, seconds, failed=False):
+        histogram = self.commands.get(command)
+        if histogram is None:
+            with self._lock:
+                histogram = self.commands.setdefault(command, timing.Histogram())
+        histogram.observe(seconds)
+        with self._lock:
+            entry = self.call_sites.setdefault((call_site, command), [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            if failed:
+                self.errors[command] = self.errors.get(command, 0) + 1
+
+    def state(self):
+        """Copies of (commands, errors), for readers on other threads"""
+        with self._lock:
+            return dict(self.commands), dict(self.errors)
+
+    def snapshot(self, top=20):
+        """Per-command latency and the top call sites by time spent"""
+        with self._lock:
+            call_sites = sorted(self.call_sites.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        histograms, errors = self.state()
+        commands = {}
+        for command in sorted(histograms):
+            commands[command] = dict(histograms[command].snapshot(), errors=errors.get(command, 0))
+        return {
+            "total": {
+                "count": sum(command["count"] for command in commands.values()),
+                "seconds": sum(command["sum_s"] for command in commands.values()),
+            },
+            "commands": commands,
+            "call_sites": [
+                {"call_site": call_site, "command": command, "count": count, "seconds": seconds}
+                for (call_site, command), (count, seconds) in call_sites
+            ],
+        }
+
+    def reset(self):
+        with self._lock:
+            self.commands = {}
+            self.errors = {}
+            self.call_sites = {}
+
+
+stats = CommandStats()
+
+
+def call_site(depth=2):
+    """file:line (function) of the first caller outside Selenium and this module"""
+    frame = sys._getframe(depth)
+    while frame is not None and frame.f_code.co_filename.startswith(_SKIPPED_PREFIXES):
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def instrument(driver, command_stats=None):
+    """Record every command driver executes in command_stats (default: stats); returns driver"""
+    command_stats = command_stats or stats
+    if getattr(driver, "command_stats", None) is not None:
+        return driver
+    execute = driver.execute
+
+    def accounted_execute(driver_command, params=None):
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = execute(driver_command, params)
+            failed = False
+            return response
+        finally:
+            seconds = time.perf_counter() - start
+            # BiDi commands arrive as generators rather than names
+            command = driver_command if isinstance(driver_command, str) else "bidi"
+            site = call_site()
+            command_stats.record(command, site, seconds, failed)
+            timeline = timing.current()
+            if timeline is not None:
+                timeline.count_command(command, site, seconds)
+
+    driver.execute = accounted_execute
+    driver.command_stats = command_stats
+    return driver
+
+
+def uninstrument(driver):
+    """Remove the hook installed by instrument"""
+    if getattr(driver, "command_stats", None) is not None:
+        del driver.execute
+        driver.command_stats = None
+    return driver
@@ -1,6 +1,5 @@
 import os
-from typing import List
-from time import sleep
+from typing import Iterator, List
 import urllib.parse
 
 from .objects import Scraper
@@ -36,8 +35,8 @@ class JobSearch(Scraper):
         job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
         job_title = job_div.text.strip()
         linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
+        company = base_element.find_element(By.CLASS_NAME, "artdeco-entity-lockup__subtitle").text
+        location = base_element.find_element(By.CLASS_NAME, "job-card-container__metadata-wrapper").text
         job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
         return job
 
@@ -47,15 +46,21 @@ class JobSearch(Scraper):
         driver.get(self.base_url)
         if scrape_recommended_jobs:
             self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
             job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
-            areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
-            for i, area in enumerate(areas):
+            self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
+            # Scroll until no more areas load, then parse them once
+            for _ in self.scroll_until_stable(
+                lambda: len(job_area.find_elements(By.CLASS_NAME, "artdeco-card")),
+                self.scroll_to_bottom
+            ):
+                pass
+            areas = job_area.find_elements(By.CLASS_NAME, "artdeco-card")
+            for i, area in enumerate(areas[:len(self.AREAS)]):
                 area_name = self.AREAS[i]
                 if not area_name:
                     continue
                 area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
+                for job_posting in area.find_elements(By.CLASS_NAME, "jobs-job-board-list__item"):
                     job = self.scrape_job_card(job_posting)
                     area_results.append(job)
                 setattr(self, area_name, area_results)
@@ -63,29 +68,33 @@ class JobSearch(Scraper):
 
 
     def search(self, search_term: str) -> List[Job]:
+        return list(self.iter_search(search_term))
+
+
+    def iter_search(self, search_term: str, settle_timeout=2) -> Iterator[Job]:
+        """Yield jobs as cards appear, scrolling the result list until it stops growing"""
         url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
         self.driver.get(url)
-        self.scroll_to_bottom()
         self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
         job_listing_class_name = "jobs-search-results-list"
         job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        job_results = []
-        for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
-            job = self.scrape_job_card(job_card)
-            job_results.append(job)
-        return job_results
+        # The first cards can take longer to render than the settle timeout allows
+        cards = self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing)
+
+        def count_cards():
+            # Keep the list that was counted so each round looks the cards up once
+            nonlocal cards
+            cards = job_listing.find_elements(By.CLASS_NAME, "job-card-list")
+            return len(cards)
+
+        parsed = 0
+        for _ in self.scroll_until_stable(
+            count_cards,
+            lambda: self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1),
+            timeout=settle_timeout
+        ):
+            # Only the cards that appeared since the previous round are parsed
+            for job_card in cards[parsed:]:
+                yield self.scrape_job_card(job_card)
+            parsed = len(cards)
@@ -2,6 +2,7 @@ from selenium.common.exceptions import TimeoutException
 
 from .objects import Scraper
 from . import constants as c
+from . import timing
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -42,6 +43,7 @@ class Job(Scraper):
     def __repr__(self):
         return f"<Job {self.job_title} {self.company}>"
 
+    @timing.tracked("job")
     def scrape(self, close_on_complete=True):
         if self.is_signed_in():
             self.scrape_logged_in(close_on_complete=close_on_complete)
@@ -62,32 +64,38 @@ class Job(Scraper):
         }
 
 
+    @timing.tracked("job")
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         
-        driver.get(self.linkedin_url)
+        with timing.span("navigation"):
+            driver.get(self.linkedin_url)
         self.focus()
-        self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
-        self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
-        self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
-        primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
-        texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
-        self.location = texts[0]
-        self.posted_date = texts[3]
+        with timing.span("top_card"):
+            self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
+            self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
+            self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
+            primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
+            texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
+            self.location = texts[0]
+            self.posted_date = texts[3]
         
-        try:
-            self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
-        except TimeoutException:
-            self.applicant_count = 0
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
-        job_description_elem = self.wait_for_element_to_load(name="jobs-description")
-        job_description_elem.find_element(By.TAG_NAME, "button").click()
-        self.job_description = job_description_elem.text.strip()
-        try:
-            self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
-        except TimeoutException:
-            self.benefits = None
+        with timing.span("applicants"):
+            try:
+                self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
+            except TimeoutException:
+                self.applicant_count = 0
+        with timing.span("description"):
+            job_description_elem = self.wait_for_element_to_load(name="jobs-description")
+            self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
+            job_description_elem = self.wait_for_element_to_load(name="jobs-description")
+            job_description_elem.find_element(By.TAG_NAME, "button").click()
+            self.job_description = job_description_elem.text.strip()
+        with timing.span("benefits"):
+            try:
+                self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
+            except TimeoutException:
+                self.benefits = None
 
         if close_on_complete:
             driver.close()
@@ -4,11 +4,13 @@ from time import sleep
 from selenium.webdriver import Chrome
 
 from . import constants as c
+from . import timing
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 
 @dataclass
@@ -65,10 +67,13 @@ class Scraper:
     WAIT_FOR_ELEMENT_TIMEOUT = 5
     TOP_CARD = "pv-top-card"
 
-    @staticmethod
-    def wait(duration):
-        sleep(int(duration))
+    def wait(self, duration):
+        # Recorded pages are complete already, nothing to wait for
+        if not getattr(self.driver, "replaying", False):
+            with timing.span("sleep"):
+                sleep(int(duration))
 
+    @timing.timed("focus")
     def focus(self):
         self.driver.execute_script('alert("Focus window")')
         self.driver.switch_to.alert.accept()
@@ -100,6 +105,7 @@ class Scraper:
         )
 
 
+    @timing.timed("sign_in_check")
     def is_signed_in(self):
         try:
             WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
@@ -127,6 +133,35 @@ class Scraper:
             "window.scrollTo(0, document.body.scrollHeight);"
         )
 
+    def fetch_page_source(self, url, scroll=True):
+        """Navigate to url and return its page_source for offline parsing"""
+        self.driver.get(url)
+        if scroll:
+            self.scroll_to_bottom()
+        return self.driver.page_source
+
+    def scroll_until_stable(self, count, scroll, timeout=2, poll_frequency=0.25):
+        """Yield the item count each time it grows after a scroll
+
+        Stops as soon as a scroll adds nothing within timeout seconds, so no
+        fixed sleep is spent once the list is exhausted.
+        """
+        previous = count()
+        yield previous
+
+        def grown(_):
+            current = count()
+            return current if current > previous else False
+
+        while True:
+            scroll()
+            try:
+                # The count that ended the wait is the one yielded, so count() isn't called again for it
+                previous = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency).until(grown)
+            except TimeoutException:
+                return
+            yield previous
+
     def scroll_class_name_element_to_page_percent(self, class_name:str, page_percent:float):
         self.driver.execute_script(
             f'elem = document.getElementsByClassName("{class_name}")[0]; elem.scrollTo(0, elem.scrollHeight*{str(page_percent)});'
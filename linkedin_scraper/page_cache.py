@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from .urls import canonical_profile_url
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, zlib is always available
+    zstandard = None
+
+
+def _compress(data):
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=6).compress(data)
+    return "zlib", zlib.compress(data, 6)
+
+
+def _decompress(codec, data):
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd snapshots")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class PageCache(object):
+    """Compressed page_source snapshots keyed by canonical (profile) URL
+
+    Entries are kept in LRU order; the least recently used snapshots are
+    evicted once the compressed total exceeds max_bytes (None for no limit),
+    and entries older than ttl seconds are treated as missing. key maps a URL
+    to its cache key; recordings pass a stricter one that keeps detail pages
+    and query strings apart.
+    """
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory, max_bytes=500 * 1024 * 1024, ttl=None, key=canonical_profile_url):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.index = self._load_index()
+        self.total_bytes = sum(entry["size"] for entry in self.index.values())
+
+    def _load_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return OrderedDict()
+        entries.sort(key=lambda entry: entry.get("accessed_at", 0))
+        return OrderedDict((entry["key"], entry) for entry in entries)
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(list(self.index.values()), f)
+        os.replace(tmp_path, path)
+
+    def _path(self, entry):
+        return os.path.join(self.directory, entry["file"])
+
+    def _remove(self, key):
+        entry = self.index.pop(key)
+        self.total_bytes -= entry["size"]
+        try:
+            os.remove(self._path(entry))
+        except OSError:
+            pass
+
+    def _expired(self, entry, max_age=None):
+        max_age = self.ttl if max_age is None else max_age
+        return max_age is not None and time.time() - entry["fetched_at"] > max_age
+
+    def put(self, url, page_source, fetched_at=None):
+        key = self.key(url)
+        codec, blob = _compress(page_source.encode("utf-8"))
+        file_name = hashlib.sha1(key.encode("utf-8")).hexdigest() + "." + codec
+        now = time.time()
+        with self._lock:
+            if key in self.index:
+                self._remove(key)
+            with open(os.path.join(self.directory, file_name), "wb") as f:
+                f.write(blob)
+            self.index[key] = {
+                "key": key,
+                "url": url,
+                "file": file_name,
+                "codec": codec,
+                "size": len(blob),
+                "fetched_at": fetched_at or now,
+                "accessed_at": now,
+            }
+            self.total_bytes += len(blob)
+            while self.max_bytes is not None and self.total_bytes > self.max_bytes and len(self.index) > 1:
+                self._remove(next(iter(self.index)))
+                self.evictions += 1
+            self._save_index()
+        return key
+
+    def get(self, url, max_age=None):
+        """Return the cached page_source for url, or None if missing or stale"""
+        key = self.key(url)
+        with self._lock:
+            entry = self.index.get(key)
+            if entry is None or self._expired(entry, max_age):
+                if entry is not None:
+                    self._remove(key)
+                    self._save_index()
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(entry), "rb") as f:
+                    blob = f.read()
+            except OSError:
+                self._remove(key)
+                self.misses += 1
+                return None
+            entry["accessed_at"] = time.time()
+            self.index.move_to_end(key)
+            self.hits += 1
+        return _decompress(entry["codec"], blob).decode("utf-8")
+
+    def entry(self, url):
+        return self.index.get(self.key(url))
+
+    def rekey(self):
+        """Re-key entries stored under an older URL normalization; returns how many changed
+
+        When several entries collapse onto one key the most recently fetched one is kept.
+        """
+        changed = 0
+        with self._lock:
+            for old_key, entry in list(self.index.items()):
+                if old_key not in self.index:
+                    continue
+                key = self.key(entry["url"])
+                if key == old_key:
+                    continue
+                existing = self.index.get(key)
+                if existing is not None and existing["fetched_at"] >= entry["fetched_at"]:
+                    self._remove(old_key)
+                else:
+                    if existing is not None:
+                        self._remove(key)
+                    del self.index[old_key]
+                    entry["key"] = key
+                    self.index[key] = entry
+                changed += 1
+            if changed:
+                self.index = OrderedDict(sorted(self.index.items(), key=lambda item: item[1]["accessed_at"]))
+                self._save_index()
+        return changed
+
+    def iter_pages(self, max_age=None):
+        """Yield (url, page_source, fetched_at) for every fresh snapshot, for backfills"""
+        for entry in list(self.index.values()):
+            if self._expired(entry, max_age):
+                continue
+            try:
+                with open(self._path(entry), "rb") as f:
+                    blob = f.read()
+            except OSError:
+                continue
+            yield entry["url"], _decompress(entry["codec"], blob).decode("utf-8"), entry["fetched_at"]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.index),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
@@ -0,0 +1,347 @@
+"""Offline parsers that turn saved page_source into scraper objects.
+
+Fetching and parsing are separate steps: a live session only needs to
+collect ``driver.page_source`` (see ``Scraper.fetch_page_source``), and the
+HTML can then be parsed here, in this process or across a process pool with
+``parse_many``, without any further WebDriver round trips.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+
+from lxml import etree, html
+
+from .person import _experiences_from_records, _educations_from_records
+from .company import CompanySummary
+from .jobs import Job
+
+BLOCK_TAGS = frozenset([
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li",
+    "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+])
+SKIP_TAGS = frozenset(["script", "style", "noscript", "template"])
+
+
+def has_class(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Person details pages
+_MAIN_LIST = etree.XPath(f"(//main//*[{has_class('pvs-list__container')}])[1]")
+_LIST_ITEMS = etree.XPath(f".//*[{has_class('pvs-list__paged-list-item')}]")
+_ENTITY = etree.XPath(".//div[@data-view-name='profile-component-entity'][1]")
+_CHILDREN = etree.XPath("*")
+_FIRST_SPAN = etree.XPath("(.//span)[1]")
+_INNER_LIST = etree.XPath(f"(.//*[{has_class('pvs-list__container')}])[1]")
+_FIRST_ANCHOR = etree.XPath("(.//a)[1]")
+
+# Company pages
+_COMPANY_NAME = etree.XPath(f"(//*[{has_class('org-top-card-summary__title')}])[1]")
+_ABOUT_GRID = etree.XPath(
+    f"(//*[{has_class('org-page-details-module__card-spacing')} and {has_class('org-about-module__margin-bottom')}])[1]"
+)
+_HEADCOUNT_SPANS = etree.XPath(f"(//*[{has_class('mt1')}])[1]//span")
+_COMPANY_LISTS = etree.XPath(f"//*[{has_class('company-list')}]")
+_COMPANY_CARDS = etree.XPath(f".//*[{has_class('org-company-card')}]")
+_COMPANY_NAME_LINK = etree.XPath(f"(.//*[{has_class('company-name-link')}])[1]")
+_COMPANY_FOLLOWERS = etree.XPath(f"(.//*[{has_class('company-followers-count')}])[1]")
+_EMPLOYEE_ITEMS = etree.XPath(f"(//*[{has_class('list-style-none')}])[1]//li")
+
+# Job pages
+_JOB_TITLE = etree.XPath(f"(//*[{has_class('job-details-jobs-unified-top-card__job-title')}])[1]")
+_JOB_COMPANY = etree.XPath(f"(//*[{has_class('job-details-jobs-unified-top-card__company-name')}])[1]")
+_JOB_PRIMARY_SPANS = etree.XPath(
+    f"(//*[{has_class('job-details-jobs-unified-top-card__primary-description-container')}])[1]//span"
+)
+_JOB_APPLICANTS = etree.XPath(f"(//*[{has_class('jobs-unified-top-card__applicant-count')}])[1]")
+_JOB_DESCRIPTION = etree.XPath(f"(//*[{has_class('jobs-description')}])[1]")
+_JOB_BENEFITS = etree.XPath(f"(//*[{has_class('jobs-unified-description__salary-main-rail-card')}])[1]")
+_JOB_CARDS = etree.XPath(f"//*[{has_class('job-card-list')}]")
+_JOB_CARD_TITLE = etree.XPath(f"(.//*[{has_class('job-card-list__title')}])[1]")
+_JOB_CARD_COMPANY = etree.XPath(f"(.//*[{has_class('artdeco-entity-lockup__subtitle')}])[1]")
+_JOB_CARD_LOCATION = etree.XPath(f"(.//*[{has_class('job-card-container__metadata-wrapper')}])[1]")
+
+
+def read_page_source(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def parse_html(page_source):
+    """Parse a page_source string (or bytes) into an lxml tree; trees pass through"""
+    if isinstance(page_source, etree._Element):
+        return page_source
+    return html.fromstring(page_source)
+
+
+def element_text(elem):
+    """Approximate WebElement.text: rendered text with block elements on their own lines"""
+    if elem is None:
+        return ""
+    parts = []
+
+    def walk(node):
+        tag = node.tag if isinstance(node.tag, str) else None
+        if tag in SKIP_TAGS:
+            return
+        block = tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if node.text and tag is not None:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(elem)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first(xpath, node):
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _first_text(xpath, node):
+    return element_text(_first(xpath, node))
+
+
+def _href(elem, base_url):
+    href = elem.get("href") if elem is not None else None
+    if not href:
+        return None
+    return urljoin(base_url, href) if base_url else href
+
+
+def _section_records(tree, base_url=None, with_inner=True):
+    """lxml counterpart of person._SECTION_RECORDS_SCRIPT"""
+    main_list = _first(_MAIN_LIST, tree)
+    if main_list is None:
+        return []
+
+    records = []
+    for item in _LIST_ITEMS(main_list):
+        entity = _first(_ENTITY, item)
+        children = _CHILDREN(entity) if entity is not None else []
+        if len(children) < 2:
+            continue
+        logo, details = children[0], _CHILDREN(children[1])
+        summary = details[0] if len(details) > 0 else None
+        summary_text = details[1] if len(details) > 1 else None
+
+        outer = []
+        summary_children = _CHILDREN(summary) if summary is not None else []
+        if summary_children:
+            for elem in _CHILDREN(summary_children[0]):
+                outer.append({"span": _first_text(_FIRST_SPAN, elem), "text": element_text(elem)})
+
+        inner = []
+        container = _first(_INNER_LIST, summary_text) if with_inner and summary_text is not None else None
+        if container is not None:
+            for position in _LIST_ITEMS(container):
+                anchor = _first(_FIRST_ANCHOR, position)
+                res = _CHILDREN(anchor) if anchor is not None else []
+                title = _CHILDREN(res[0]) if len(res) > 0 else []
+                title_children = _CHILDREN(title[0]) if title else []
+                inner.append({
+                    "position_title": element_text(title_children[0] if title_children else (title[0] if title else None)),
+                    "work_times": element_text(_CHILDREN(res[1])[0]) if len(res) > 1 and len(res[1]) else "",
+                    "location": element_text(_CHILDREN(res[2])[0]) if len(res) > 2 and len(res[2]) else None,
+                    "text": element_text(position),
+                })
+
+        logo_children = _CHILDREN(logo)
+        records.append({
+            "linkedin_url": _href(logo_children[0], base_url) if logo_children else None,
+            "outer": outer,
+            "summary_text": element_text(summary_text) if summary_text is not None else None,
+            "inner": inner,
+        })
+    return records
+
+
+def parse_experiences(page_source, base_url=None):
+    """Parse a details/experience page into Experience objects"""
+    return _experiences_from_records(_section_records(parse_html(page_source), base_url, True))
+
+
+def parse_educations(page_source, base_url=None):
+    """Parse a details/education page into Education objects"""
+    return _educations_from_records(_section_records(parse_html(page_source), base_url, False))
+
+
+def parse_company(page_source, base_url=None):
+    """Parse a company about page into a dict of Company fields"""
+    tree = parse_html(page_source)
+    company = {
+        "linkedin_url": base_url,
+        "name": _first_text(_COMPANY_NAME, tree) or None,
+        "about_us": None,
+        "website": None,
+        "phone": None,
+        "headquarters": None,
+        "founded": None,
+        "industry": None,
+        "company_type": None,
+        "company_size": None,
+        "specialties": None,
+        "headcount": None,
+        "showcase_pages": [],
+        "affiliated_companies": [],
+    }
+
+    grid = _first(_ABOUT_GRID, tree)
+    if grid is not None:
+        paragraphs = grid.findall(".//p")
+        if paragraphs:
+            company["about_us"] = element_text(paragraphs[0])
+        labels = grid.findall(".//dt")
+        values = grid.findall(".//dd")
+        x_off = 0
+        fields = {
+            "Website": "website",
+            "Phone": "phone",
+            "Industry": "industry",
+            "Company size": "company_size",
+            "Headquarters": "headquarters",
+            "Type": "company_type",
+            "Founded": "founded",
+        }
+        for i in range(min(len(labels), len(values))):
+            label = element_text(labels[i])
+            if i + x_off >= len(values):
+                break
+            value = element_text(values[i + x_off])
+            if label in fields:
+                company[fields[label]] = value
+                if label == "Company size" and len(values) > len(labels):
+                    x_off = 1
+            elif label == "Specialties":
+                company["specialties"] = "\n".join(value.split(", "))
+
+    for span in _HEADCOUNT_SPANS(tree):
+        txt = element_text(span)
+        if "See all" in txt and "employees on LinkedIn" in txt:
+            try:
+                company["headcount"] = int(txt.replace("See all", "").replace("employees on LinkedIn", "").replace(",", "").strip())
+            except ValueError:
+                pass
+
+    company_lists = _COMPANY_LISTS(tree)
+    for key, company_list in zip(("showcase_pages", "affiliated_companies"), company_lists):
+        for card in _COMPANY_CARDS(company_list):
+            link = _first(_COMPANY_NAME_LINK, card)
+            company[key].append(CompanySummary(
+                linkedin_url=_href(link, base_url),
+                name=element_text(link),
+                followers=_first_text(_COMPANY_FOLLOWERS, card)
+            ))
+    return company
+
+
+def parse_employee(elem, base_url=None):
+    """lxml counterpart of Company.__parse_employee__"""
+    lines = element_text(elem).split("\n")
+    anchor = _first(_FIRST_ANCHOR, elem)
+    if len(lines) < 4 or anchor is None:
+        return None
+    return {
+        "name": lines[0].strip(),
+        "designation": lines[3].strip(),
+        "linkedin_url": _href(anchor, base_url),
+    }
+
+
+def parse_employees(page_source, base_url=None):
+    """Parse a company people page into employee dicts"""
+    employees = (parse_employee(li, base_url) for li in _EMPLOYEE_ITEMS(parse_html(page_source)))
+    return [employee for employee in employees if employee]
+
+
+def parse_job(page_source, linkedin_url=None):
+    """Parse a job view page into a Job"""
+    tree = parse_html(page_source)
+    texts = [text for text in (element_text(span) for span in _JOB_PRIMARY_SPANS(tree)) if text.strip()]
+    company_elem = _first(_JOB_COMPANY, tree)
+    benefits = _first(_JOB_BENEFITS, tree)
+    return Job(
+        linkedin_url=linkedin_url,
+        job_title=_first_text(_JOB_TITLE, tree),
+        company=element_text(company_elem),
+        company_linkedin_url=_href(_first(_FIRST_ANCHOR, company_elem), linkedin_url) if company_elem is not None else None,
+        location=texts[0] if len(texts) > 0 else None,
+        posted_date=texts[3] if len(texts) > 3 else None,
+        applicant_count=_first_text(_JOB_APPLICANTS, tree) or 0,
+        job_description=_first_text(_JOB_DESCRIPTION, tree),
+        benefits=element_text(benefits) if benefits is not None else None,
+        scrape=False,
+    )
+
+
+def parse_job_card(card, base_url=None):
+    """lxml counterpart of JobSearch.scrape_job_card"""
+    title = _first(_JOB_CARD_TITLE, card)
+    return Job(
+        linkedin_url=_href(title, base_url),
+        job_title=element_text(title),
+        company=_first_text(_JOB_CARD_COMPANY, card),
+        location=_first_text(_JOB_CARD_LOCATION, card),
+        scrape=False,
+    )
+
+
+def parse_job_cards(page_source, base_url=None):
+    """Parse a job search results page into Job objects"""
+    return [parse_job_card(card, base_url) for card in _JOB_CARDS(parse_html(page_source))]
+
+
+PARSERS = {
+    "experiences": parse_experiences,
+    "educations": parse_educations,
+    "company": parse_company,
+    "employees": parse_employees,
+    "job": parse_job,
+    "job_cards": parse_job_cards,
+}
+
+
+def parse_page(kind, page_source, url=None):
+    """Parse one page with the parser registered under kind"""
+    if kind not in PARSERS:
+        raise ValueError(f"Unknown page kind: {kind}")
+    return PARSERS[kind](page_source, url)
+
+
+def parse_file(kind, path, url=None):
+    return parse_page(kind, read_page_source(path), url)
+
+
+def _parse_task(task):
+    kind, source, url, is_path = task
+    if is_path:
+        source = read_page_source(source)
+    return parse_page(kind, source, url)
+
+
+def parse_many(kind, pages, urls=None, processes=None, chunksize=4):
+    """Parse many pages of one kind across a process pool, preserving input order
+
+    pages holds page_source strings or paths to saved files. With processes=1
+    everything runs in the calling process.
+    """
+    pages = list(pages)
+    urls = list(urls) if urls is not None else [None] * len(pages)
+    tasks = [
+        (kind, page, url, isinstance(page, os.PathLike) or (isinstance(page, str) and not page.lstrip().startswith("<") and os.path.isfile(page)))
+        for page, url in zip(pages, urls)
+    ]
+    if processes == 1 or len(tasks) <= 1:
+        return [_parse_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(_parse_task, tasks, chunksize=chunksize))
@@ -6,13 +6,159 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException
 from .objects import Experience, Education, Scraper, Interest, Accomplishment, Contact
 import os
-from linkedin_scraper import selectors
+from linkedin_scraper import selectors, timing
+
+# Serializes a details/experience or details/education list into plain records
+# in a single round trip. The walk mirrors the WebElement traversal in
+# get_experiences/get_educations; arguments[0] toggles nested positions.
+_SECTION_RECORDS_SCRIPT = """
+var withInner = arguments[0];
+var main = document.querySelector('main');
+var list = main && main.querySelector('.pvs-list__container');
+if (!list) { return []; }
+function text(el) { return el ? el.innerText : ''; }
+function spanText(el) { return el ? text(el.querySelector('span')) : ''; }
+var records = [];
+list.querySelectorAll('.pvs-list__paged-list-item').forEach(function (item) {
+    var entity = item.querySelector("div[data-view-name='profile-component-entity']");
+    if (!entity || entity.children.length < 2) { return; }
+    var logo = entity.children[0], details = entity.children[1].children;
+    var summary = details.length > 0 ? details[0] : null;
+    var summaryText = details.length > 1 ? details[1] : null;
+    var outer = [];
+    if (summary && summary.firstElementChild) {
+        Array.prototype.forEach.call(summary.firstElementChild.children, function (el) {
+            outer.push({span: spanText(el), text: text(el)});
+        });
+    }
+    var inner = [];
+    var container = withInner && summaryText && summaryText.querySelector('.pvs-list__container');
+    if (container) {
+        container.querySelectorAll('.pvs-list__paged-list-item').forEach(function (pos) {
+            var anchor = pos.querySelector('a');
+            var res = anchor ? anchor.children : [];
+            var title = res.length > 0 && res[0].firstElementChild;
+            inner.push({
+                position_title: title ? text(title.firstElementChild || title) : '',
+                work_times: res.length > 1 ? text(res[1].firstElementChild) : '',
+                location: res.length > 2 ? text(res[2].firstElementChild) : null,
+                text: text(pos)
+            });
+        });
+    }
+    records.push({
+        linkedin_url: logo.firstElementChild ? (logo.firstElementChild.href || null) : null,
+        outer: outer,
+        summary_text: summaryText ? text(summaryText) : null,
+        inner: inner
+    });
+});
+return records;
+"""
+
+
+def _split_work_times(work_times):
+    """Split "Jan 2020 - Mar 2022 · 2 yrs 3 mos" into (from_date, to_date, duration)"""
+    if not work_times:
+        return "", "", None
+    parts = work_times.split("·")
+    times = parts[0].strip()
+    duration = parts[1].strip() if len(parts) > 1 else None
+    words = times.split(" ")
+    from_date = " ".join(words[:2]) if times else ""
+    to_date = " ".join(words[3:]) if times else ""
+    return from_date, to_date, duration
+
+
+def _experiences_from_records(records):
+    """Build Experience objects from records produced by _SECTION_RECORDS_SCRIPT"""
+    experiences = []
+    for record in records or []:
+        company_linkedin_url = record.get("linkedin_url")
+        if not company_linkedin_url:
+            continue
+
+        outer_positions = record.get("outer") or []
+        spans = [position.get("span", "") for position in outer_positions]
+        if len(spans) == 4:
+            position_title, company, work_times, location = spans
+        elif len(spans) == 3:
+            if "·" in outer_positions[2].get("text", ""):
+                position_title, company, work_times = spans
+                location = ""
+            else:
+                position_title = ""
+                company, work_times, location = spans
+        else:
+            position_title = ""
+            company = spans[0] if spans else ""
+            work_times = ""
+            location = ""
+
+        inner_positions = record.get("inner") or []
+        if len(inner_positions) > 1:
+            for inner in inner_positions:
+                from_date, to_date, duration = _split_work_times(inner.get("work_times"))
+                experiences.append(Experience(
+                    position_title=inner.get("position_title") or "",
+                    from_date=from_date,
+                    to_date=to_date,
+                    duration=duration,
+                    location=inner.get("location"),
+                    description=inner.get("text"),
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url
+                ))
+        else:
+            from_date, to_date, duration = _split_work_times(work_times)
+            experiences.append(Experience(
+                position_title=position_title,
+                from_date=from_date,
+                to_date=to_date,
+                duration=duration,
+                location=location,
+                description=record.get("summary_text") or "",
+                institution_name=company,
+                linkedin_url=company_linkedin_url
+            ))
+    return experiences
+
+
+def _educations_from_records(records):
+    """Build Education objects from records produced by _SECTION_RECORDS_SCRIPT"""
+    educations = []
+    for record in records or []:
+        spans = [position.get("span", "") for position in record.get("outer") or []]
+        if not spans:
+            continue
+
+        institution_name = spans[0]
+        degree = spans[1] if len(spans) > 1 else None
+        from_date = None
+        to_date = None
+        if len(spans) > 2 and spans[2] != "":
+            times = spans[2].split(" ")
+            from_date = times[times.index("-") - 1] if len(times) > 3 and "-" in times else times[0]
+            to_date = times[-1]
+
+        educations.append(Education(
+            from_date=from_date,
+            to_date=to_date,
+            description=record.get("summary_text") or "",
+            degree=degree,
+            institution_name=institution_name,
+            linkedin_url=record.get("linkedin_url")
+        ))
+    return educations
 
 
 class Person(Scraper):
 
     __TOP_CARD = "main"
     __WAIT_FOR_ELEMENT_TIMEOUT = 5
+    # Optional parts of a profile; name and location always come from the top card
+    SECTIONS = ("about", "experiences", "educations", "interests", "accomplishments", "connections")
+    CONNECTIONS_URL = "https://www.linkedin.com/mynetwork/invite-connect/connections/"
 
     def __init__(
         self,
@@ -31,8 +177,15 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
+        script_extraction=False,
+        sections=None,
     ):
         self.linkedin_url = linkedin_url
+        self.script_extraction = script_extraction
+        self.sections = self.SECTIONS if sections is None else tuple(sections)
+        unknown = set(self.sections) - set(self.SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown Person sections: {', '.join(sorted(unknown))}")
         self.name = name
         self.about = about or []
         self.experiences = experiences or []
@@ -55,13 +208,20 @@ class Person(Scraper):
             except:
                 driver = webdriver.Chrome()
 
-        if get:
-            driver.get(linkedin_url)
-
         self.driver = driver
 
         if scrape:
-            self.scrape(close_on_complete)
+            self._get_and_scrape(get, close_on_complete)
+        elif get:
+            driver.get(linkedin_url)
+
+    @timing.tracked("person")
+    def _get_and_scrape(self, get, close_on_complete):
+        # The initial page load belongs to the run, so it is opened here rather than in scrape
+        if get:
+            with timing.span("navigation"):
+                self.driver.get(self.linkedin_url)
+        self.scrape(close_on_complete)
 
     def add_about(self, about):
         self.about.append(about)
@@ -84,6 +244,7 @@ class Person(Scraper):
     def add_contact(self, contact):
         self.contacts.append(contact)
 
+    @timing.tracked("person")
     def scrape(self, close_on_complete=True):
         if self.is_signed_in():
             self.scrape_logged_in(close_on_complete=close_on_complete)
@@ -100,20 +261,29 @@ class Person(Scraper):
         except Exception as e:
             pass
 
+    @timing.timed("open_to_work")
     def is_open_to_work(self):
         try:
             return "#OPEN_TO_WORK" in self.driver.find_element(By.CLASS_NAME,"pv-top-card-profile-picture").find_element(By.TAG_NAME,"img").get_attribute("title")
         except:
             return False
 
+    @timing.timed("experiences")
     def get_experiences(self):
         url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
+        with timing.span("navigation"):
+            self.driver.get(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        if self.script_extraction:
+            records = self.driver.execute_script(_SECTION_RECORDS_SCRIPT, True)
+            for experience in _experiences_from_records(records):
+                self.add_experience(experience)
+            return
+
         for position in main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item"):
             position = position.find_element(By.CSS_SELECTOR, "div[data-view-name='profile-component-entity']")
             company_logo_elem, position_details = position.find_elements(By.XPATH, "*")
@@ -151,12 +321,7 @@ class Person(Scraper):
                 work_times = ""
                 location = ""
 
-
-            times = work_times.split("·")[0].strip() if work_times else ""
-            duration = work_times.split("·")[1].strip() if len(work_times.split("·")) > 1 else None
-
-            from_date = " ".join(times.split(" ")[:2]) if times else ""
-            to_date = " ".join(times.split(" ")[3:]) if times else ""
+            from_date, to_date, duration = _split_work_times(work_times)
             if position_summary_text and any(element.get_attribute("pvs-list__container") for element in position_summary_text.find_elements(By.TAG_NAME, "*")):
                 inner_positions = (position_summary_text.find_element(By.CLASS_NAME,"pvs-list__container")
                                   .find_element(By.XPATH,"*").find_element(By.XPATH,"*").find_element(By.XPATH,"*")
@@ -175,10 +340,7 @@ class Person(Scraper):
                     location = location_elem.find_element(By.XPATH,"*").text if location_elem else None
                     position_title = position_title_elem.find_element(By.XPATH,"*").find_element(By.TAG_NAME,"*").text if position_title_elem else ""
                     work_times = work_times_elem.find_element(By.XPATH,"*").text if work_times_elem else ""
-                    times = work_times.split("·")[0].strip() if work_times else ""
-                    duration = work_times.split("·")[1].strip() if len(work_times.split("·")) > 1 else None
-                    from_date = " ".join(times.split(" ")[:2]) if times else ""
-                    to_date = " ".join(times.split(" ")[3:]) if times else ""
+                    from_date, to_date, duration = _split_work_times(work_times)
 
                     experience = Experience(
                         position_title=position_title,
@@ -206,14 +368,22 @@ class Person(Scraper):
                 )
                 self.add_experience(experience)
 
+    @timing.timed("educations")
     def get_educations(self):
         url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
+        with timing.span("navigation"):
+            self.driver.get(url)
         self.focus()
         main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
         self.scroll_to_half()
         self.scroll_to_bottom()
         main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+        if self.script_extraction:
+            records = self.driver.execute_script(_SECTION_RECORDS_SCRIPT, False)
+            for education in _educations_from_records(records):
+                self.add_education(education)
+            return
+
         for position in main_list.find_elements(By.CLASS_NAME,"pvs-list__paged-list-item"):
             position = position.find_element(By.XPATH,"//div[@data-view-name='profile-component-entity']")
             institution_logo_elem, position_details = position.find_elements(By.XPATH,"*")
@@ -257,11 +427,13 @@ class Person(Scraper):
             )
             self.add_education(education)
 
+    @timing.timed("top_card")
     def get_name_and_location(self):
         top_panel = self.driver.find_element(By.XPATH, "//*[@class='mt2 relative']")
         self.name = top_panel.find_element(By.TAG_NAME, "h1").text
         self.location = top_panel.find_element(By.XPATH, "//*[@class='text-body-small inline t-black--light break-words']").text
 
+    @timing.timed("about")
     def get_about(self):
         try:
             about = self.driver.find_element(By.ID,"about").find_element(By.XPATH,"..").find_element(By.CLASS_NAME,"display-flex").text
@@ -269,18 +441,20 @@ class Person(Scraper):
             about=None
         self.about = about
 
+    @timing.tracked("person")
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         duration = None
 
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    By.TAG_NAME,
-                    self.__TOP_CARD,
+        with timing.span("page_load"):
+            root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (
+                        By.TAG_NAME,
+                        self.__TOP_CARD,
+                    )
                 )
             )
-        )
         self.focus()
         self.wait(5)
 
@@ -290,23 +464,44 @@ class Person(Scraper):
         self.open_to_work = self.is_open_to_work()
 
         # get about
-        self.get_about()
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
-        )
+        if "about" in self.sections:
+            self.get_about()
+            with timing.span("scroll"):
+                driver.execute_script(
+                    "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
+                )
+                driver.execute_script(
+                    "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
+                )
 
         # get experience
-        self.get_experiences()
+        if "experiences" in self.sections:
+            self.get_experiences()
 
         # get education
-        self.get_educations()
+        if "educations" in self.sections:
+            self.get_educations()
+
+        # interests and accomplishments live on the profile page itself
+        if "interests" in self.sections or "accomplishments" in self.sections:
+            if "experiences" in self.sections or "educations" in self.sections:
+                with timing.span("navigation"):
+                    driver.get(self.linkedin_url)
+            if "interests" in self.sections:
+                self.get_interests()
+            if "accomplishments" in self.sections:
+                self.get_accomplishments()
 
-        driver.get(self.linkedin_url)
+        # get connections
+        if "connections" in self.sections:
+            self.get_connections()
 
-        # get interest
+        if close_on_complete:
+            driver.quit()
+
+    @timing.timed("interests")
+    def get_interests(self):
+        driver = self.driver
         try:
 
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
@@ -330,7 +525,9 @@ class Person(Scraper):
         except:
             pass
 
-        # get accomplishment
+    @timing.timed("accomplishments")
+    def get_accomplishments(self):
+        driver = self.driver
         try:
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located(
@@ -355,9 +552,11 @@ class Person(Scraper):
         except:
             pass
 
-        # get connections
+    @timing.timed("connections")
+    def get_connections(self):
+        driver = self.driver
         try:
-            driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
+            driver.get(self.CONNECTIONS_URL)
             _ = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "mn-connections"))
             )
@@ -372,10 +571,7 @@ class Person(Scraper):
                     contact = Contact(name=name, occupation=occupation, url=url)
                     self.add_contact(contact)
         except:
-            connections = None
-
-        if close_on_complete:
-            driver.quit()
+            pass
 
     @property
     def company(self):
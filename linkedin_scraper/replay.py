@@ -0,0 +1,384 @@
+"""Record live WebDriver sessions and replay them offline.
+
+``Recorder`` wraps a live driver and stores the page_source of every page the
+scraper navigates to in a ``PageCache``. ``ReplayDriver`` serves those pages
+back through the subset of the Selenium API the scraper classes use, backed
+by lxml, so Person, Company, Job and JobSearch run without a browser::
+
+    recorder = Recorder(webdriver.Chrome(), "recordings/")
+    Person("https://www.linkedin.com/in/someone", driver=recorder)
+    recorder.quit()
+
+    Person("https://www.linkedin.com/in/someone", driver=ReplayDriver("recordings/"))
+
+Replay is static: scrolling and clicks on buttons do nothing, so each page is
+replayed as it looked when the recording left it. Explicit waits for
+elements that were never recorded still run into their timeout.
+"""
+import logging
+import uuid
+from urllib.parse import urljoin
+
+from lxml import etree
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from .page_cache import PageCache
+from .parsers import _section_records, element_text, has_class, parse_html
+from .person import _SECTION_RECORDS_SCRIPT
+from .urls import canonical_page_url
+
+logger = logging.getLogger(__name__)
+
+EMPTY_PAGE = "<html><head></head><body></body></html>"
+
+
+def open_recording(pages):
+    """PageCache for a recording directory; PageCache instances pass through"""
+    if isinstance(pages, PageCache):
+        return pages
+    return PageCache(pages, max_bytes=None, key=canonical_page_url)
+
+
+class Recorder(object):
+    """Live driver wrapper that snapshots page_source for every page it visits
+
+    A page is saved right after it loads and again when the session moves
+    on, so content that scrolling or clicking loaded in between is kept.
+    Everything else is passed through to the wrapped driver.
+    """
+
+    def __init__(self, driver, pages):
+        self.driver = driver
+        self.pages = open_recording(pages)
+        self.recorded = 0
+        self._requested = None
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+    def _save(self, urls):
+        page_source = self.driver.page_source
+        for key in dict.fromkeys(self.pages.key(url) for url in urls if url):
+            self.pages.put(key, page_source)
+            self.recorded += 1
+
+    def snapshot(self, url=None):
+        """Save the current page under url (default: the URL last requested and the current URL)"""
+        self._save([url] if url else [self._requested, self.driver.current_url])
+
+    def _leave(self):
+        """Save the page once more before navigating away, under the URL it ended up at"""
+        if self._requested is None:
+            return
+        try:
+            current_url = self.driver.current_url
+            same_page = self.pages.key(current_url) == self.pages.key(self._requested)
+            self._save([current_url, self._requested] if same_page else [current_url])
+        except WebDriverException as e:
+            logger.error(f"Error recording {self._requested}: {str(e)}")
+
+    def get(self, url):
+        self._leave()
+        self.driver.get(url)
+        self._requested = url
+        self.snapshot()
+
+    def close(self):
+        self._leave()
+        self._requested = None
+        self.driver.close()
+
+    def quit(self):
+        self._leave()
+        self._requested = None
+        self.driver.quit()
+
+
+def _literal(value):
+    """XPath string literal for value"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _class_predicates(class_names):
+    return "".join(f"[{has_class(name)}]" for name in class_names if name)
+
+
+def css_to_xpath(selector, prefix=".//"):
+    """Translate a simple CSS selector (tag, #id, .class, [attr], [attr=value], descendant and > combinators)"""
+    steps = []
+    axis = prefix
+    for token in selector.replace(">", " > ").split():
+        if token == ">":
+            axis = "/"
+            continue
+        tag, rest = token, ""
+        for i, char in enumerate(token):
+            if char in ".#[":
+                tag, rest = token[:i], token[i:]
+                break
+        predicates = []
+        while rest:
+            if rest[0] == "[":
+                end = rest.index("]")
+                attribute, rest = rest[1:end], rest[end + 1:]
+                if "=" in attribute:
+                    name, value = attribute.split("=", 1)
+                    predicates.append(f"[@{name.strip()}={_literal(value.strip().strip(chr(34) + chr(39)))}]")
+                else:
+                    predicates.append(f"[@{attribute.strip()}]")
+                continue
+            kind, rest = rest[0], rest[1:]
+            end = min([i for i in (rest.find("."), rest.find("#"), rest.find("[")) if i != -1] or [len(rest)])
+            value, rest = rest[:end], rest[end:]
+            predicates.append(f"[@id={_literal(value)}]" if kind == "#" else _class_predicates([value]))
+        steps.append(axis + (tag or "*") + "".join(predicates))
+        axis = "//"
+    return "".join(steps)
+
+
+def locator_xpath(by, value, prefix=".//"):
+    """XPath equivalent of a Selenium (by, value) locator, searched below the context node"""
+    if by == By.XPATH:
+        return value
+    if by == By.CLASS_NAME:
+        # Selenium treats the value as a CSS class selector, so "a.b" means both classes
+        return f"{prefix}*" + _class_predicates(value.strip().split("."))
+    if by == By.TAG_NAME:
+        return f"{prefix}{value}"
+    if by == By.ID:
+        return f"{prefix}*[@id={_literal(value)}]"
+    if by == By.NAME:
+        return f"{prefix}*[@name={_literal(value)}]"
+    if by == By.LINK_TEXT:
+        return f"{prefix}a[normalize-space()={_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return f"{prefix}a[contains(normalize-space(), {_literal(value)})]"
+    if by == By.CSS_SELECTOR:
+        return css_to_xpath(value, prefix)
+    raise WebDriverException(f"Unsupported locator strategy: {by}")
+
+
+def _find_all(driver, node, by, value):
+    found = node.xpath(locator_xpath(by, value))
+    return [ReplayElement(driver, elem) for elem in found if isinstance(elem, etree._Element)]
+
+
+def _find_one(driver, node, by, value):
+    found = _find_all(driver, node, by, value)
+    if not found:
+        raise NoSuchElementException(f"Unable to locate element: {{\"method\": \"{by}\", \"selector\": \"{value}\"}}")
+    return found[0]
+
+
+class ReplayElement(WebElement):
+    """WebElement backed by an lxml element
+
+    It subclasses WebElement so ActionChains accepts it; the methods the
+    scrapers use are answered from the tree, anything else goes through
+    ReplayDriver.execute and returns None.
+    """
+
+    def __init__(self, driver, node):
+        super().__init__(driver, uuid.uuid4().hex)
+        self.node = node
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and other.node is self.node
+
+    def __hash__(self):
+        return hash(self.node)
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return element_text(self.node)
+
+    @property
+    def location(self):
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self):
+        return {"height": 0, "width": 0}
+
+    def get_attribute(self, name):
+        if name in ("innerText", "text"):
+            return element_text(self.node)
+        if name == "textContent":
+            return "".join(self.node.itertext())
+        if name == "outerHTML":
+            return etree.tostring(self.node, encoding="unicode", method="html", with_tail=False)
+        if name == "innerHTML":
+            return (self.node.text or "") + "".join(etree.tostring(child, encoding="unicode", method="html") for child in self.node)
+        value = self.node.get(name)
+        if value and name in ("href", "src"):
+            # Like the browser's property, links come back absolute
+            return urljoin(self.parent.current_url, value)
+        return value
+
+    get_property = get_attribute
+    get_dom_attribute = get_attribute
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def is_selected(self):
+        return False
+
+    def click(self):
+        """Follow links; any other click leaves the recorded page as it is"""
+        anchor = self.node if self.node.tag == "a" else next(self.node.iterancestors("a"), None)
+        href = anchor.get("href") if anchor is not None else None
+        if href and not href.startswith(("#", "javascript:")):
+            self.parent.get(urljoin(self.parent.current_url, href))
+
+    def send_keys(self, *value):
+        pass
+
+    def clear(self):
+        pass
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_one(self.parent, self.node, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_all(self.parent, self.node, by, value)
+
+
+class _Alert(object):
+    def accept(self):
+        pass
+
+    def dismiss(self):
+        pass
+
+
+class _SwitchTo(object):
+    alert = _Alert()
+
+    def window(self, name):
+        pass
+
+    def default_content(self):
+        pass
+
+    def frame(self, frame):
+        pass
+
+
+class ReplayDriver(object):
+    """Offline WebDriver serving recorded pages
+
+    pages is a recording directory, a PageCache or a {url: page_source} dict.
+    Unrecorded URLs load an empty page and are listed in misses; with
+    strict=True they raise KeyError instead.
+    """
+    replaying = True
+    session_id = "replay"
+
+    def __init__(self, pages, strict=False):
+        if isinstance(pages, dict):
+            self.pages = {canonical_page_url(url): page_source for url, page_source in pages.items()}
+        else:
+            self.pages = open_recording(pages)
+        self.strict = strict
+        self.misses = []
+        self.navigations = 0
+        self.switch_to = _SwitchTo()
+        self.current_url = "about:blank"
+        self.page_source = EMPTY_PAGE
+        self._tree = parse_html(EMPTY_PAGE)
+        self._trees = {}
+
+    def _load(self, url):
+        key = canonical_page_url(url)
+        if key in self._trees:
+            return self._trees[key]
+        if isinstance(self.pages, dict):
+            page_source = self.pages.get(key)
+        else:
+            page_source = self.pages.get(url)
+        if page_source is None:
+            return None
+        self._trees[key] = (page_source, parse_html(page_source))
+        return self._trees[key]
+
+    def get(self, url):
+        self.navigations += 1
+        page = self._load(url)
+        if page is None:
+            if self.strict:
+                raise KeyError(f"No recording for {url}")
+            logger.warning(f"No recording for {url}, serving an empty page")
+            self.misses.append(url)
+            page = (EMPTY_PAGE, parse_html(EMPTY_PAGE))
+        self.current_url = url
+        self.page_source, self._tree = page
+
+    def refresh(self):
+        pass
+
+    @property
+    def title(self):
+        titles = self._tree.xpath("//title")
+        return element_text(titles[0]) if titles else ""
+
+    def find_element(self, by=By.ID, value=None):
+        return _find_one(self, self._tree, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_all(self, self._tree, by, value)
+
+    def execute_script(self, script, *args):
+        if script == _SECTION_RECORDS_SCRIPT:
+            return _section_records(self._tree, self.current_url, args[0] if args else True)
+        if "document.readyState" in script:
+            return "complete"
+        # Scrolling, focusing and the like have nothing to do on a static page
+        return None
+
+    def execute(self, driver_command, params=None):
+        """Low-level commands (e.g. ActionChains.perform) are accepted and ignored"""
+        return {"value": None}
+
+    def get_screenshot_as_png(self):
+        raise WebDriverException("Screenshots are not available while replaying")
+
+    def get_cookies(self):
+        return []
+
+    def add_cookie(self, cookie):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+
+    def set_window_size(self, width, height, windowHandle="current"):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
@@ -1 +1,188 @@
+import threading
+import time
+
+from lxml import etree
+from selenium.webdriver.common.by import By
+
 NAME = 'text-heading-xlarge'
+
+
+class SelectorStats(object):
+    __slots__ = ("hits", "misses", "seconds")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.seconds = 0.0
+
+    @property
+    def attempts(self):
+        return self.hits + self.misses
+
+    @property
+    def score(self):
+        # Laplace smoothing so untried selectors are neither favoured nor buried
+        return (self.hits + 1) / (self.attempts + 2)
+
+    def to_dict(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / self.attempts if self.attempts else None,
+            "avg_ms": self.seconds * 1000 / self.attempts if self.attempts else None,
+        }
+
+
+class FieldSelectors(object):
+    """Ordered XPath fallbacks for one named field, compiled once
+
+    fallbacks are broader selectors that match wherever the precise ones do
+    (and elsewhere), so they would win any hit-rate contest. They form a
+    second tier: reordering happens within a tier and they are always tried
+    after every precise selector.
+    """
+
+    def __init__(self, name, xpaths, join=False, attribute=None, fallbacks=()):
+        self.name = name
+        self.join = join
+        self.attribute = attribute
+        xpaths = list(xpaths) + list(fallbacks)
+        self.tiers = {xpath: 1 if i >= len(xpaths) - len(fallbacks) else 0 for i, xpath in enumerate(xpaths)}
+        self.locators = [(By.XPATH, xpath) for xpath in xpaths]
+        self.compiled = {xpath: etree.XPath(xpath) for xpath in xpaths}
+        self.stats = {xpath: SelectorStats() for xpath in xpaths}
+        self.order = list(xpaths)
+
+    def reorder(self):
+        declared = {xpath: i for i, (_, xpath) in enumerate(self.locators)}
+        self.order = sorted(self.order, key=lambda xpath: (self.tiers[xpath], -self.stats[xpath].score, declared[xpath]))
+
+
+class SelectorRegistry(object):
+    """Named fields with fallback chains, reordered at runtime by hit rate"""
+
+    def __init__(self):
+        self.fields = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, xpaths, join=False, attribute=None, fallbacks=()):
+        self.fields[name] = FieldSelectors(name, xpaths, join=join, attribute=attribute, fallbacks=fallbacks)
+        return self.fields[name]
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def fresh(self):
+        """A registry with the same fields in their declared order and no recorded stats"""
+        registry = SelectorRegistry()
+        for name, field in self.fields.items():
+            xpaths = [xpath for _, xpath in field.locators]
+            registry.register(
+                name, [xpath for xpath in xpaths if not field.tiers[xpath]], join=field.join, attribute=field.attribute,
+                fallbacks=[xpath for xpath in xpaths if field.tiers[xpath]],
+            )
+        return registry
+
+    def _record(self, field, xpath, hit, seconds):
+        with self._lock:
+            stats = field.stats[xpath]
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            stats.seconds += seconds
+            field.reorder()
+
+    def _value(self, field, texts, max_length):
+        texts = [text for text in texts if text and (max_length is None or len(text) < max_length)]
+        if not texts:
+            return ""
+        return " ".join(texts) if field.join else texts[0]
+
+    def resolve(self, driver, name, max_length=None):
+        """Return the first non-empty value for name from a live WebDriver"""
+        field = self.fields[name]
+        for xpath in list(field.order):
+            start = time.perf_counter()
+            try:
+                elements = driver.find_elements(By.XPATH, xpath)
+                if field.attribute:
+                    texts = [(element.get_attribute(field.attribute) or "").strip() for element in elements]
+                elif field.join:
+                    texts = [element.text.strip() for element in elements]
+                else:
+                    # Stop at the first usable element to avoid reading every match
+                    texts = []
+                    for element in elements:
+                        text = element.text.strip()
+                        if text and (max_length is None or len(text) < max_length):
+                            texts.append(text)
+                            break
+                value = self._value(field, texts, max_length)
+            except Exception:
+                value = ""
+            self._record(field, xpath, bool(value), time.perf_counter() - start)
+            if value:
+                return value
+        return ""
+
+    def resolve_tree(self, tree, name, max_length=None):
+        """Return the first non-empty value for name from an lxml tree"""
+        from .parsers import element_text
+
+        field = self.fields[name]
+        for xpath in list(field.order):
+            start = time.perf_counter()
+            elements = field.compiled[xpath](tree)
+            if field.attribute:
+                texts = [(element.get(field.attribute) or "").strip() for element in elements]
+            else:
+                texts = [element_text(element).strip() for element in elements]
+            value = self._value(field, texts, max_length)
+            self._record(field, xpath, bool(value), time.perf_counter() - start)
+            if value:
+                return value
+        return ""
+
+    def stats(self):
+        with self._lock:
+            return {
+                name: {
+                    "order": list(field.order),
+                    "fallbacks": [xpath for xpath in field.order if field.tiers[xpath]],
+                    "selectors": {xpath: field.stats[xpath].to_dict() for xpath in field.order},
+                }
+                for name, field in self.fields.items()
+            }
+
+
+registry = SelectorRegistry()
+
+registry.register("profile.name", [
+    "//h1",
+])
+registry.register("profile.title", [
+    "//div[contains(@class, 'text-body-medium')]",
+    "//div[contains(@class, 'pv-text-details__left-panel')]/div",
+    "//*[contains(@class, 'pv-text-details__left-panel')]//h2",
+    "//div[contains(@class, 'ph5')]/div[contains(@class, 'mt2')]//div[contains(@class, 'text-body-medium')]",
+])
+registry.register("profile.company", [
+    "//div[contains(@class, 'pv-entity__company-details')]/div",
+    "//span[contains(@class, 'pv-entity__secondary-title')]",
+], fallbacks=[
+    "//a[contains(@href, '/company/')]",
+    "//div[contains(@class, 'inline-show-more-text')]/span",
+])
+registry.register("profile.company_url", [
+    "//section[contains(@class, 'experience')]//a[contains(@href, '/company/')]",
+], fallbacks=[
+    "//a[contains(@href, '/company/')]",
+], attribute="href")
+registry.register("profile.about", [
+    "//section[contains(@class, 'about')]//div[contains(@class, 'display-flex')]//span",
+    "//section[.//span[text()='About' or text()='Tentang']]//div[contains(@class, 'display-flex')]//span",
+    "//section[contains(@id, 'about')]//div[contains(@class, 'inline-show-more-text')]",
+    "//section[.//span[text()='About' or text()='Tentang']]//p",
+    "//div[contains(@class, 'about-section')]//p",
+], join=True)
@@ -0,0 +1,278 @@
+"""Per-stage timing for scrape pipelines
+
+A pipeline run (one profile, company or job scrape) is tracked with
+``track("person")``; inside it, ``span("experiences")`` times one stage.
+Spans outside a tracked run cost nothing and are not recorded. When the
+run ends, the time spent in each stage is observed into a process-wide
+histogram named ``<pipeline>.<stage>``, so p50/p95/p99 per stage build up
+over many scrapes. ``Timeline.report()`` is what gets attached to results;
+it also lists the WebDriver commands of the run when the driver is
+instrumented (see driver_stats).
+
+Stages are exclusive: time spent in a nested span (say the fixed sleep
+inside "experiences") counts for the inner stage only, so the stages of a
+run add up to at most its total.
+"""
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+
+# Upper bounds in seconds; the last bucket is open-ended
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Histogram(object):
+    """Fixed-bucket latency histogram; percentiles are interpolated inside a bucket"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def state(self):
+        """(per-bucket counts, count, sum) read together"""
+        with self._lock:
+            return list(self.counts), self.count, self.sum
+
+    def percentile(self, q):
+        with self._lock:
+            counts, count, largest = list(self.counts), self.count, self.max
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else largest
+                return min(lower + (upper - lower) * (rank - seen) / bucket_count, largest)
+            seen += bucket_count
+        return largest
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "sum_s": self.sum,
+            "max_s": self.max,
+            "p50_s": self.percentile(0.5),
+            "p95_s": self.percentile(0.95),
+            "p99_s": self.percentile(0.99),
+        }
+
+
+class StageStats(object):
+    """Histograms per "<pipeline>.<stage>" name, created on first use
+
+    Also counts finished runs per (pipeline, outcome) and runs in progress per pipeline.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self.runs = {}
+        self.active = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, Histogram())
+        return histogram
+
+    def observe(self, name, seconds):
+        self.histogram(name).observe(seconds)
+
+    def started(self, pipeline):
+        with self._lock:
+            self.active[pipeline] = self.active.get(pipeline, 0) + 1
+
+    def finished(self, pipeline, outcome):
+        with self._lock:
+            self.active[pipeline] -= 1
+            self.runs[(pipeline, outcome)] = self.runs.get((pipeline, outcome), 0) + 1
+
+    def state(self):
+        """Copies of (runs, active, histograms), for readers on other threads"""
+        with self._lock:
+            return dict(self.runs), dict(self.active), dict(self.histograms)
+
+    def snapshot(self, names=None):
+        histograms = self.state()[2]
+        names = sorted(histograms) if names is None else names
+        return {name: histograms[name].snapshot() for name in names if name in histograms}
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.runs = {}
+
+
+stages = StageStats()
+
+
+class Timeline(object):
+    """The spans of one pipeline run, in the order they finished"""
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.started = time.perf_counter()
+        self.total = None
+        # Set when the run raised, or by the caller for runs that report failure in their result
+        self.failed = False
+        self.spans = []
+        # {command: [count, seconds]} and {(call_site, command): [count, seconds]}
+        self.commands = {}
+        self.call_sites = {}
+        # Time taken by nested spans, one entry per open span
+        self._nested = []
+
+    def add(self, stage, seconds, offset):
+        self.spans.append((stage, offset, seconds))
+
+    def count_command(self, command, call_site, seconds, count=1):
+        for counts, key in ((self.commands, command), (self.call_sites, (call_site, command))):
+            entry = counts.setdefault(key, [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+
+    def merge_commands(self, other):
+        for (call_site, command), (count, seconds) in other.call_sites.items():
+            self.count_command(command, call_site, seconds, count)
+
+    def totals(self):
+        """{stage: (seconds, count)} summed over every span of the stage"""
+        totals = {}
+        for stage, _, seconds in self.spans:
+            spent, count = totals.get(stage, (0.0, 0))
+            totals[stage] = (spent + seconds, count + 1)
+        return totals
+
+    def finish(self):
+        self.total = time.perf_counter() - self.started
+        for stage, (seconds, _) in self.totals().items():
+            stages.observe(f"{self.pipeline}.{stage}", seconds)
+        stages.observe(f"{self.pipeline}.total", self.total)
+        stages.finished(self.pipeline, "failure" if self.failed else "success")
+
+    def report(self):
+        total = self.total if self.total is not None else time.perf_counter() - self.started
+        totals = self.totals()
+        names = [f"{self.pipeline}.{stage}" for stage in totals] + [f"{self.pipeline}.total"]
+        report = {
+            "pipeline": self.pipeline,
+            "total_s": total,
+            "stages": {stage: {"seconds": seconds, "count": count} for stage, (seconds, count) in totals.items()},
+            "untimed_s": max(total - sum(seconds for seconds, _ in totals.values()), 0.0),
+            "failed": self.failed,
+            "histograms": stages.snapshot(names),
+        }
+        if self.commands:
+            call_sites = sorted(self.call_sites.items(), key=lambda item: item[1][1], reverse=True)[:10]
+            report["commands"] = {
+                "count": sum(count for count, _ in self.commands.values()),
+                "seconds": sum(seconds for _, seconds in self.commands.values()),
+                "by_command": {command: {"count": count, "seconds": seconds} for command, (count, seconds) in sorted(self.commands.items())},
+                "top_call_sites": [
+                    {"call_site": call_site, "command": command, "count": count, "seconds": seconds}
+                    for (call_site, command), (count, seconds) in call_sites
+                ],
+            }
+        return report
+
+
+_current = contextvars.ContextVar("scrape_timeline", default=None)
+
+
+def current():
+    return _current.get()
+
+
+@contextmanager
+def track(pipeline):
+    """Track one run of pipeline and yield its Timeline
+
+    Inside a run of the same pipeline the outer Timeline is reused. A different
+    pipeline nested in a run gets its own Timeline and shows up in the outer
+    one as a single stage named after it.
+    """
+    outer = _current.get()
+    if outer is not None and outer.pipeline == pipeline:
+        yield outer
+        return
+    timeline = Timeline(pipeline)
+    token = _current.set(timeline)
+    stages.started(pipeline)
+    try:
+        yield timeline
+    except BaseException:
+        timeline.failed = True
+        raise
+    finally:
+        _current.reset(token)
+        timeline.finish()
+        if outer is not None:
+            outer.merge_commands(timeline)
+            if outer._nested:
+                outer._nested[-1] += timeline.total
+            outer.add(pipeline, timeline.total, timeline.started - outer.started)
+
+
+@contextmanager
+def span(stage):
+    """Time a stage of the tracked run; a no-op when nothing is tracked"""
+    timeline = _current.get()
+    if timeline is None:
+        yield
+        return
+    timeline._nested.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = timeline._nested.pop()
+        if timeline._nested:
+            timeline._nested[-1] += elapsed
+        timeline.add(stage, elapsed - nested, start - timeline.started)
+
+
+def timed(stage):
+    """Decorator form of span for methods that make up one stage"""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def tracked(pipeline):
+    """Decorator for a scraper's scrape method: tracks the run and stores its report on self.timings"""
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            timeline = None
+            try:
+                with track(pipeline) as timeline:
+                    return method(self, *args, **kwargs)
+            finally:
+                if timeline is not None:
+                    self.timings = timeline.report()
+        return wrapper
+    return decorate
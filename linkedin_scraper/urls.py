@@ -0,0 +1,76 @@
+from functools import lru_cache
+from urllib.parse import parse_qs, parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+
+def canonical_url(url):
+    """Normalize a URL into a stable key: https, lower-case host, no query/fragment or trailing slash"""
+    if not url:
+        return ""
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    if netloc == "linkedin.com":
+        netloc = "www.linkedin.com"
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", netloc, path, "", ""))
+
+
+def canonical_page_url(url):
+    """canonical_url that keeps the query string (sorted), so search result pages stay distinct"""
+    key = canonical_url(url)
+    if not key:
+        return ""
+    query = urlsplit(url.strip()).query
+    if not query:
+        return key
+    return key + "?" + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+
+@lru_cache(maxsize=4096)
+def canonical_profile_url(url):
+    """Normalize a LinkedIn profile URL or vanity name to https://www.linkedin.com/in/<slug>
+
+    http/https, locale subdomains, query strings, trailing slashes, letter case and
+    sub-pages such as /en or /details/experience all map to the same key. URLs that
+    are not profiles fall back to canonical_url.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    if "/" not in url:
+        # Bare vanity name, e.g. "john-doe"
+        url = "www.linkedin.com/in/" + url
+    key = canonical_url(url)
+    parts = urlsplit(key)
+    if parts.netloc.endswith("linkedin.com") and parts.path.startswith("/in/"):
+        slug = unquote(parts.path.split("/")[2]).lower()
+        if slug:
+            return "https://www.linkedin.com/in/" + quote(slug, safe="-_.~")
+    return key
+
+
+def canonical_job_url(url):
+    """Normalize a LinkedIn job URL to https://www.linkedin.com/jobs/view/<id>"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip() if "://" in url else "https://" + url.strip())
+    job_id = parse_qs(parts.query).get("currentJobId", [None])[0]
+    if not job_id and "/jobs/view/" in parts.path:
+        job_id = parts.path.split("/jobs/view/", 1)[1].split("/")[0]
+        # Slugged URLs end with the numeric id, e.g. python-developer-at-acme-3812345678
+        job_id = job_id.rsplit("-", 1)[-1]
+    if job_id and job_id.isdigit():
+        return f"https://www.linkedin.com/jobs/view/{job_id}"
+    return canonical_url(url)
+
+
+def canonical_company_url(url):
+    """Normalize a LinkedIn company URL (or any of its tabs) to https://www.linkedin.com/company/<slug>"""
+    key = canonical_url(url)
+    if "/company/" in key:
+        slug = key.split("/company/", 1)[1].split("/")[0]
+        if slug:
+            return f"https://www.linkedin.com/company/{slug.lower()}"
+    return key
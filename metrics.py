@@ -0,0 +1,241 @@
+"""In-process metrics rendered in the Prometheus text exposition format
+
+Counters, gauges and histograms are kept in memory; updating one takes a
+short, per-metric lock and never touches disk. Numbers that other modules
+already keep (scrape stage timings, WebDriver command stats, cache stats)
+are read only when /api/metrics is scraped, through collectors registered
+with ``registry.collector``.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from linkedin_scraper import driver_stats, timing
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, bool):
+        return str(int(value))
+    return str(value)
+
+
+def histogram_samples(name, histogram, labels=None):
+    """_bucket, _sum and _count lines for a timing.Histogram (its buckets are per-bucket, Prometheus' are cumulative)"""
+    labels = labels or {}
+    counts, count, total = histogram.state()
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in zip(list(histogram.buckets) + [float("inf")], counts):
+        cumulative += bucket_count
+        lines.append(f"{name}_bucket{format_labels(dict(labels, le=format_value(bound)))} {cumulative}")
+    lines.append(f"{name}_sum{format_labels(labels)} {format_value(total)}")
+    lines.append(f"{name}_count{format_labels(labels)} {count}")
+    return lines
+
+
+def render_family(name, kind, documentation, samples):
+    """Text for one metric family; samples are (labels, value) pairs, values are timing.Histograms for histograms"""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        if kind == "histogram":
+            lines.extend(histogram_samples(name, value, labels))
+        else:
+            lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+    return lines
+
+
+class Metric(object):
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(dict(zip(self.labelnames, key)), value) for key, value in items]
+
+    def render(self):
+        return render_family(self.name, self.kind, self.documentation, self.samples())
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        if not self.labelnames:
+            # A metric without labels is always exported, starting at zero
+            self._values[()] = 0
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=timing.BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def observe(self, seconds, **labels):
+        key = self._key(labels)
+        histogram = self._values.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(key, timing.Histogram(self.buckets))
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+class Registry(object):
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def _add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._add(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._add(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=timing.BUCKETS):
+        return self._add(Histogram(name, documentation, labelnames, buckets))
+
+    def collector(self, collect):
+        """Register collect(), which yields (name, kind, documentation, samples) families at render time"""
+        self.collectors.append(collect)
+        return collect
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collect in self.collectors:
+            try:
+                for family in collect():
+                    lines.extend(render_family(*family))
+            except Exception as e:
+                logger.error(f"Error collecting metrics from {collect.__name__}: {str(e)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_request_seconds = registry.histogram(
+    "leadgen_http_request_duration_seconds", "Time spent handling API requests", ("route", "method", "status")
+)
+store_operation_seconds = registry.histogram(
+    "leadgen_store_operation_duration_seconds", "Time spent loading or saving a JSON store", ("store", "operation")
+)
+store_records = registry.gauge(
+    "leadgen_store_records", "Records in a JSON store as of its last load or save", ("store",)
+)
+driver_starts = registry.counter(
+    "leadgen_driver_starts_total", "Chrome drivers started; every start after the first is a restart"
+)
+
+
+def store_operation(store, operation):
+    """Decorator for a store's load/save helper: times it and records how many records the store holds
+
+    A load helper returns the records, a save helper takes them as its first argument.
+    """
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            store_operation_seconds.observe(time.perf_counter() - start, store=store, operation=operation)
+            records = result if operation == "load" else args[0]
+            store_records.set(len(records), store=store)
+            return result
+        return wrapper
+    return decorate
+
+
+@registry.collector
+def collect_scrapes():
+    # Copied under the stats lock: scrapes on other threads add entries while this renders
+    runs, active, histograms = timing.stages.state()
+    yield (
+        "leadgen_scrapes_total", "counter", "Finished scrape runs by pipeline and outcome",
+        [({"pipeline": pipeline, "outcome": outcome}, count) for (pipeline, outcome), count in sorted(runs.items())],
+    )
+    yield (
+        "leadgen_scrapes_in_progress", "gauge", "Scrape runs started and not finished yet",
+        [({"pipeline": pipeline}, count) for pipeline, count in sorted(active.items())],
+    )
+    samples = []
+    for name, histogram in sorted(histograms.items()):
+        pipeline, stage = name.split(".", 1)
+        samples.append(({"pipeline": pipeline, "stage": stage}, histogram))
+    yield ("leadgen_scrape_stage_duration_seconds", "histogram", "Time per scrape stage in each run; stage \"total\" is the whole run", samples)
+
+
+@registry.collector
+def collect_driver_commands():
+    commands, errors = driver_stats.stats.state()
+    histograms = sorted(commands.items())
+    yield (
+        "leadgen_webdriver_command_duration_seconds", "histogram", "WebDriver command round trips by command",
+        [({"command": command}, histogram) for command, histogram in histograms],
+    )
+    yield (
+        "leadgen_webdriver_command_errors_total", "counter", "WebDriver commands that raised, by command",
+        [({"command": command}, errors.get(command, 0)) for command, _ in histograms],
+    )
@@ -0,0 +1,130 @@
+"""In-process publish/subscribe bus for scrape results
+
+Scrape workers inside the API process publish results directly instead of
+POSTing them back to their own HTTP server. External processes such as
+test_scraper.py reach the same bus through a local Unix socket.
+"""
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SCRAPED = "profile.scraped"
+
+DEFAULT_SOCKET_PATH = os.getenv("RESULT_BUS_SOCKET", os.path.join(tempfile.gettempdir(), "leadgen-results.sock"))
+
+
+class ResultBus(object):
+    """Synchronous topic-based dispatcher, safe to publish to from any thread"""
+
+    def __init__(self):
+        self._subscribers = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic, handler):
+        with self._lock:
+            self._subscribers[topic].append(handler)
+        return handler
+
+    def unsubscribe(self, topic, handler):
+        with self._lock:
+            if handler in self._subscribers[topic]:
+                self._subscribers[topic].remove(handler)
+
+    def publish(self, topic, payload):
+        """Hand payload to every subscriber of topic and return their results in order"""
+        with self._lock:
+            handlers = list(self._subscribers[topic])
+        if not handlers:
+            logger.warning(f"No subscribers for {topic}, result dropped")
+
+        results = []
+        for handler in handlers:
+            try:
+                results.append(handler(payload))
+            except Exception as e:
+                logger.error(f"Error in {topic} subscriber {getattr(handler, '__name__', handler)}: {str(e)}")
+                results.append(None)
+        return results
+
+
+bus = ResultBus()
+
+
+def socket_supported():
+    return hasattr(socket, "AF_UNIX")
+
+
+class SocketListener(object):
+    """Accept newline-delimited JSON messages {"topic", "payload"} on a Unix socket and publish them"""
+
+    def __init__(self, result_bus=None, path=None):
+        self.bus = result_bus or bus
+        self.path = path or DEFAULT_SOCKET_PATH
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        if not socket_supported():
+            logger.warning("Unix sockets are not available on this platform, IPC listener disabled")
+            return False
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._server.listen(8)
+        self._thread = threading.Thread(target=self._serve, name="result-bus-ipc", daemon=True)
+        self._thread.start()
+        logger.info(f"Result bus listening on {self.path}")
+        return True
+
+    def stop(self):
+        if self._server:
+            self._server.close()
+            self._server = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _serve(self):
+        while self._server:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn, conn.makefile("rwb") as stream:
+            for line in stream:
+                try:
+                    message = json.loads(line)
+                    results = self.bus.publish(message["topic"], message.get("payload"))
+                    reply = {"success": True, "results": results}
+                except Exception as e:
+                    logger.error(f"Error handling IPC message: {str(e)}")
+                    reply = {"success": False, "error": str(e)}
+                stream.write(json.dumps(reply, default=str).encode() + b"\n")
+                stream.flush()
+
+
+def send(topic, payload, path=None, timeout=10):
+    """Publish to the bus of a running API process over its Unix socket and return its reply
+
+    Raises OSError when the socket is unavailable so callers can fall back to HTTP.
+    """
+    if not socket_supported():
+        raise OSError("Unix sockets are not available on this platform")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path or DEFAULT_SOCKET_PATH)
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps({"topic": topic, "payload": payload}).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
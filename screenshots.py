@@ -0,0 +1,144 @@
+"""Bounded, asynchronous debug screenshots
+
+The browser capture itself has to happen on the scraping thread, but encoding
+and disk I/O are handed to a background writer. Files go to one directory
+that is pruned to a count and byte budget after every write.
+"""
+import io
+import logging
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+
+try:
+    from PIL import Image
+except ImportError:  # optional, only needed for downscaling / WebP
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = (".png", ".webp")
+
+
+class ScreenshotWriter(object):
+    def __init__(self, directory, max_files=50, max_bytes=50 * 1024 * 1024, scale=1.0, image_format="png", queue_size=8):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.scale = scale
+        self.image_format = image_format.lower()
+        self.written = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+
+        if Image is None and (self.scale != 1.0 or self.image_format != "png"):
+            logger.warning("Pillow is not installed, screenshots are stored as full-size PNG")
+            self.scale = 1.0
+            self.image_format = "png"
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+
+    def capture(self, driver, label="", reason="debug"):
+        """Grab a screenshot from driver and queue it for writing; returns False if it was dropped"""
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error(f"Error capturing screenshot: {str(e)}")
+            return False
+
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", label.split("linkedin.com/")[-1]).strip("-")[:60]
+        name = "_".join(part for part in (reason, slug, datetime.now().strftime("%Y%m%d_%H%M%S_%f")) if part)
+        self._ensure_worker()
+        try:
+            # Never block the scrape on a slow disk; drop instead
+            self._queue.put_nowait((name, png))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Screenshot queue full, dropped {name}")
+            return False
+
+    def flush(self):
+        """Wait until every queued screenshot has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self):
+        while True:
+            name, png = self._queue.get()
+            try:
+                path = self._write(name, png)
+                self.written += 1
+                logger.info(f"Screenshot saved: {path}")
+                self._prune()
+            except Exception as e:
+                logger.error(f"Error saving screenshot: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _encode(self, png):
+        if Image is None or (self.scale == 1.0 and self.image_format == "png"):
+            return png, ".png"
+        image = Image.open(io.BytesIO(png))
+        if self.scale != 1.0:
+            image = image.resize((max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale))))
+        buffer = io.BytesIO()
+        if self.image_format == "webp":
+            image.save(buffer, format="WEBP", quality=80)
+            return buffer.getvalue(), ".webp"
+        image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), ".png"
+
+    def _write(self, name, png):
+        data, extension = self._encode(png)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, name + extension)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+    def _files(self):
+        """Screenshots in the directory, oldest first, as (mtime, size, path)"""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(EXTENSIONS):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(files)
+
+    def _prune(self):
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        while files and (len(files) > self.max_files or total > self.max_bytes):
+            _, size, path = files.pop(0)
+            try:
+                os.remove(path)
+                total -= size
+            except OSError as e:
+                logger.error(f"Error removing old screenshot {path}: {str(e)}")
+
+    def pending(self):
+        """Screenshots captured but not written yet"""
+        return self._queue.qsize()
+
+    def stats(self):
+        files = self._files() if os.path.isdir(self.directory) else []
+        return {
+            "directory": self.directory,
+            "files": len(files),
+            "bytes": sum(size for _, size, _ in files),
+            "written": self.written,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize(),
+        }
@@ -4,6 +4,7 @@ import platform
 import json
 import requests
 from linkedin_scraper import Person, actions
+import result_bus
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -192,7 +193,8 @@ try:
         # If profile URL was provided as an argument, scrape immediately
         if profile_url:
             print(f"\nStarting profile scraping: {profile_url}")
-            person = Person(profile_url, driver=driver, close_on_complete=False)
+            person = Person(profile_url, driver=driver, close_on_complete=False, script_extraction=True,
+                            sections=["about", "experiences", "educations"])
             print(f"Name: {person.name}")
             if hasattr(person, 'about') and person.about:
                 print(f"About: {person.about}")
@@ -212,17 +214,26 @@ try:
                 }
                 
                 print("\nSending profile data to backend...")
-                api_url = "http://localhost:5000/api/linkedin/scrape-profile"
-                response = requests.post(
-                    api_url,
-                    json={"profile_data": profile_data, "use_existing_session": True, "profile_url": profile_url},
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    print("Profile data successfully sent to backend")
-                else:
-                    print(f"Failed to send profile data: {response.status_code}")
+                try:
+                    # Prefer the backend's local result bus socket
+                    reply = result_bus.send(result_bus.PROFILE_SCRAPED, {"profile_url": profile_url, "profile_data": profile_data})
+                    if reply.get("success"):
+                        print("Profile data successfully sent to backend (socket)")
+                    else:
+                        print(f"Failed to send profile data: {reply.get('error')}")
+                except OSError as socket_error:
+                    print(f"Result bus socket unavailable ({socket_error}), falling back to HTTP")
+                    api_url = "http://localhost:5000/api/linkedin/scrape-profile"
+                    response = requests.post(
+                        api_url,
+                        json={"profile_data": profile_data, "use_existing_session": True, "profile_url": profile_url},
+                        timeout=10
+                    )
+                    
+                    if response.status_code == 200:
+                        print("Profile data successfully sent to backend")
+                    else:
+                        print(f"Failed to send profile data: {response.status_code}")
             except Exception as e:
                 print(f"Error while sending profile data: {str(e)}")
         else: